@@ -0,0 +1,107 @@
+"""Compare the online RLS forecaster with refitting ARIMA(1,0,0): per-call latency and 5-step accuracy
+
+    python benchmarks/forecast_benchmark.py                    # synthetic CPU-like series
+    python benchmarks/forecast_benchmark.py --store            # recent samples from the metric store
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.ai_utils import OnlineForecaster, ResourcePredictor
+
+
+def synthetic_series(length, seed=0):
+    """AR(1) load around a drifting level with occasional bursts, clipped to 0..100"""
+    rng = np.random.default_rng(seed)
+    level = 30 + 15 * np.sin(np.linspace(0, 6 * np.pi, length))
+    values = np.empty(length)
+    y = level[0]
+    for i in range(length):
+        y = level[i] + 0.8 * (y - level[i]) + rng.normal(0, 3)
+        values[i] = y
+    bursts = rng.random(length) < 0.01
+    values[bursts] += rng.uniform(20, 50, bursts.sum())
+    return np.clip(values, 0, 100)
+
+
+def store_series(seconds):
+    from config import METRIC_STORE_PATH, METRIC_RETENTION
+    from utils.metric_store import MetricStore
+
+    store = MetricStore(METRIC_STORE_PATH, METRIC_RETENTION)
+    try:
+        _, cpu, _, _ = store.load_recent(seconds)
+    finally:
+        store.close()
+    return np.asarray(cpu, dtype=float)
+
+
+def evaluate(series, window, steps, every):
+    """Walk forward through the series; both methods forecast at the same points"""
+    online = OnlineForecaster()
+    try:
+        import statsmodels.tsa.arima.model  # noqa: F401
+        arima = ResourcePredictor(method="arima")
+    except ImportError:
+        arima = None
+
+    online_times, arima_times = [], []
+    online_errors, arima_errors = [], []
+    for t in range(len(series) - steps):
+        start = time.perf_counter()
+        online.observe(series[t])
+        if t < window // 10 or t % every:
+            continue
+        forecast = online.forecast(steps)
+        online_times.append(time.perf_counter() - start)
+        actual = series[t + 1:t + 1 + steps]
+        online_errors.append(np.abs(forecast - actual))
+
+        if arima is not None:
+            history = series[max(0, t + 1 - window):t + 1]
+            start = time.perf_counter()
+            forecast = arima.predict_next_values(history, steps)
+            arima_times.append(time.perf_counter() - start)
+            if forecast is not None:
+                arima_errors.append(np.abs(np.asarray(forecast) - actual))
+
+    return (online_times, online_errors), (arima_times, arima_errors) if arima is not None else None
+
+
+def report(name, times, errors):
+    """Print latency percentiles (online includes the observe() update) and MAE per horizon"""
+    times = np.asarray(times) * 1000.0
+    errors = np.asarray(errors)
+    print(f"{name:<8} calls {len(times):5d}   latency p50 {np.percentile(times, 50):8.3f} ms"
+          f"   p95 {np.percentile(times, 95):8.3f} ms")
+    print(f"{'':<8} MAE by horizon: " + "  ".join(f"{value:5.2f}" for value in errors.mean(axis=0))
+          + f"   overall {errors.mean():.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=int, default=3000, help="synthetic series length")
+    parser.add_argument("--window", type=int, default=3600, help="history ARIMA is refitted on (app default)")
+    parser.add_argument("--steps", type=int, default=5)
+    parser.add_argument("--every", type=int, default=10, help="forecast every N samples")
+    parser.add_argument("--store", action="store_true", help="use the last day of CPU samples from the metric store")
+    args = parser.parse_args()
+
+    series = store_series(86400) if args.store else synthetic_series(args.length)
+    print(f"{len(series)} samples, {args.steps}-step forecasts every {args.every} samples")
+
+    online, arima = evaluate(series, args.window, args.steps, args.every)
+    report("online", *online)
+    if arima is None:
+        print("arima    skipped (statsmodels is not installed)")
+    else:
+        report("arima", *arima)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Measure cold-start time of the dashboard: imports, time to first frame and analytics loading
+
+Each run starts a fresh interpreter so module caches do not hide import costs.
+
+    python benchmarks/startup_time.py --runs 5
+    python benchmarks/startup_time.py --imports-only   # no display needed
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def child_imports():
+    """Time importing the AI module and then loading the analytics libraries"""
+    sys.path.insert(0, REPO_ROOT)
+    start = time.perf_counter()
+    from utils.ai_utils import preload_analytics
+    imported = time.perf_counter()
+    loaded = preload_analytics()
+    done = time.perf_counter()
+    return {
+        'import_ai_utils': imported - start,
+        'preload_analytics': done - imported if loaded else None
+    }
+
+
+def child_first_frame(timeout):
+    """Start the full app and time how long it takes to paint its first frame"""
+    start = time.perf_counter()
+    sys.path.insert(0, REPO_ROOT)
+    import tkinter as tk
+    from ui.app import ProcessMonitorApp
+    imported = time.perf_counter()
+
+    root = tk.Tk()
+    app = ProcessMonitorApp(root, store_path=None)
+    result = {'import_app': imported - start}
+
+    def check():
+        if app.first_frame_time:
+            result['app_first_frame'] = app.first_frame_time
+            result['first_frame'] = time.perf_counter() - start
+            app.on_closing()
+        elif time.perf_counter() - start > timeout:
+            result['error'] = "timed out waiting for the first frame"
+            app.on_closing()
+        else:
+            root.after(5, check)
+
+    root.after(5, check)
+    root.mainloop()
+    return result
+
+
+def run_child(mode, timeout):
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", mode,
+                             "--timeout", str(timeout)],
+                            capture_output=True, text=True, cwd=REPO_ROOT, timeout=timeout + 30)
+    for line in reversed(output.stdout.splitlines()):
+        if line.startswith("{"):
+            return json.loads(line)
+    raise RuntimeError(output.stderr.strip().splitlines()[-1] if output.stderr.strip() else "no result")
+
+
+def summarize(results):
+    keys = sorted({key for result in results for key, value in result.items() if isinstance(value, float)})
+    for key in keys:
+        values = [result[key] for result in results if isinstance(result.get(key), float)]
+        print(f"  {key:<20} median {statistics.median(values) * 1000:8.1f} ms"
+              f"   min {min(values) * 1000:8.1f} ms   max {max(values) * 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--imports-only", action="store_true", help="skip the windowed first-frame runs")
+    parser.add_argument("--child", choices=["imports", "first-frame"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child == "imports":
+        print(json.dumps(child_imports()))
+        return
+    if args.child == "first-frame":
+        print(json.dumps(child_first_frame(args.timeout)))
+        return
+
+    print(f"Import costs ({args.runs} runs):")
+    summarize([run_child("imports", args.timeout) for _ in range(args.runs)])
+
+    if args.imports_only:
+        return
+    print(f"Time to first frame ({args.runs} runs):")
+    try:
+        summarize([run_child("first-frame", args.timeout) for _ in range(args.runs)])
+    except Exception as e:
+        print(f"  could not start the UI (no display?): {e}")
+
+
+if __name__ == "__main__":
+    main()
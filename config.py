@@ -1,3 +1,5 @@
+import os
+
 # Enhanced theme configuration with multiple theme options
 THEMES = {
     "dark": {
@@ -209,4 +211,33 @@ DEFAULT_ALERT_THRESHOLDS = {
 }
 
 # Default refresh rate in seconds
-DEFAULT_REFRESH_RATE = 1 
+DEFAULT_REFRESH_RATE = 1
+
+# Process collector backend: "psutil", "procfs" (Linux /proc bulk reader) or "auto"
+DEFAULT_COLLECTOR_BACKEND = "psutil"
+
+# On-disk metric store so history survives restarts (set to None to disable)
+METRIC_STORE_PATH = os.path.join(os.path.expanduser("~"), ".process_monitor", "metrics.db")
+
+# How long each kind of stored data is kept, in seconds
+METRIC_RETENTION = {
+    "system": 2 * 24 * 3600,     # raw 1-second samples
+    "rollups": 30 * 24 * 3600,   # 10s / 1m / 10m min/max/mean buckets
+    "process": 24 * 3600         # top-process samples
+}
+
+# Number of top processes (by CPU) recorded with each sample
+METRIC_STORE_TOP_PROCESSES = 10
+
+# Per-process history: samples kept per process, how many processes are tracked
+# (the most active by CPU) and how long an exited process is kept before eviction.
+# A tracked process can only be replaced after holding its slot for MIN_TENURE samples,
+# and only by a process busier than it by REPLACE_MARGIN CPU% points.
+PROCESS_HISTORY_SAMPLES = 600
+PROCESS_HISTORY_MAX_TRACKED = 50
+PROCESS_HISTORY_GRACE_PERIOD = 30
+PROCESS_HISTORY_MIN_TENURE = 30
+PROCESS_HISTORY_REPLACE_MARGIN = 5.0
+
+# Worker processes for model training and ARIMA forecasting (kept off the Tk thread)
+ANALYTICS_WORKERS = 1
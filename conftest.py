@@ -0,0 +1 @@
+# Lets pytest import the utils/ui packages when run from the repository root
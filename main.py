@@ -1,7 +1,42 @@
-import tkinter as tk
-from ui.app import ProcessMonitorApp
+import argparse
+import multiprocessing
+
+from config import DEFAULT_COLLECTOR_BACKEND, DEFAULT_REFRESH_RATE
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = ProcessMonitorApp(root)
-    root.mainloop() 
+    # Needed for the analytics worker processes in the PyInstaller one-file build
+    multiprocessing.freeze_support()
+    
+    parser = argparse.ArgumentParser(description="Real-Time Process Monitoring Dashboard")
+    parser.add_argument("--backend", choices=["psutil", "procfs", "auto"],
+                        default=DEFAULT_COLLECTOR_BACKEND,
+                        help="process collector backend (procfs reads /proc directly on Linux)")
+    parser.add_argument("--no-store", action="store_true",
+                        help="do not read or write the on-disk metric history")
+    parser.add_argument("--headless", action="store_true",
+                        help="run the collection, alert and anomaly pipeline without a window")
+    parser.add_argument("--interval", type=float, default=DEFAULT_REFRESH_RATE,
+                        help="sampling interval in seconds for headless mode")
+    parser.add_argument("--no-anomaly", action="store_true",
+                        help="skip anomaly detection in headless mode (smaller memory footprint)")
+    args = parser.parse_args()
+
+    if args.headless:
+        # Headless mode never imports tkinter or matplotlib
+        from utils.agent import MonitorAgent
+
+        agent_options = {"interval": args.interval, "backend": args.backend,
+                         "detect_anomalies": not args.no_anomaly}
+        if args.no_store:
+            agent_options["store_path"] = None
+        MonitorAgent(**agent_options).run()
+    else:
+        import tkinter as tk
+        from ui.app import ProcessMonitorApp
+
+        root = tk.Tk()
+        if args.no_store:
+            app = ProcessMonitorApp(root, backend=args.backend, store_path=None)
+        else:
+            app = ProcessMonitorApp(root, backend=args.backend)
+        root.mainloop()
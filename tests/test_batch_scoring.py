@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from utils.ai_utils import AnomalyDetector, fit_anomaly_model
+from utils.history import MetricHistory
+
+
+class ThresholdModel:
+    """Scores a sample by its negated CPU, with the anomaly cut-off at 80% CPU"""
+
+    offset_ = -80.0
+
+    def score_samples(self, features):
+        return -np.asarray(features)[:, 0]
+
+
+def make_detector():
+    detector = AnomalyDetector()
+    detector.set_model(ThresholdModel())
+    return detector
+
+
+def append(history, values):
+    for value in values:
+        history.append(float(history.total_samples), value, 40.0, 60.0)
+
+
+def score(detector, history):
+    return detector.score_new_samples(history.cpu.view(), history.memory.view(),
+                                      history.disk.view(), history.total_samples)
+
+
+def test_untrained_detector_scores_nothing():
+    history = MetricHistory(capacity=10)
+    append(history, [10.0])
+    assert AnomalyDetector().score_new_samples(history.cpu.view(), history.memory.view(),
+                                               history.disk.view(), history.total_samples) is None
+
+
+def test_each_sample_is_scored_exactly_once():
+    history = MetricHistory(capacity=20)
+    detector = make_detector()
+    append(history, [10.0] * 15)
+
+    first = score(detector, history)
+    assert first['sequence'].tolist() == [14]
+    assert score(detector, history) is None
+
+    append(history, [20.0, 90.0, 30.0])
+    batch = score(detector, history)
+    assert batch['sequence'].tolist() == [15, 16, 17]
+    assert batch['labels'].tolist() == [1, -1, 1]
+    assert history.cpu.view()[batch['positions']].tolist() == [20.0, 90.0, 30.0]
+    assert batch['missed'] == 0
+
+
+def test_samples_that_left_the_window_are_counted_as_missed():
+    history = MetricHistory(capacity=10)
+    detector = make_detector()
+    append(history, [10.0] * 5)
+    score(detector, history)
+
+    # The window wraps past samples that were never scored
+    append(history, [10.0] * 14 + [95.0])
+    batch = score(detector, history)
+    assert batch['missed'] == 5
+    assert batch['sequence'].tolist() == list(range(10, 20))
+    assert batch['labels'].tolist() == [1] * 9 + [-1]
+
+
+def test_score_batch_labels_match_isolation_forest_predict():
+    pytest.importorskip("sklearn")
+    rng = np.random.default_rng(0)
+    features = np.column_stack((rng.normal(20, 2, 500), rng.normal(40, 1, 500), rng.normal(60, 0.5, 500)))
+    detector = AnomalyDetector()
+    detector.set_model(fit_anomaly_model(features))
+
+    probe = np.vstack((features[:50], [[95.0, 90.0, 99.0]]))
+    scores, labels = detector.score_batch(probe)
+    np.testing.assert_array_equal(labels, detector.model.predict(probe))
+    assert labels[-1] == -1
@@ -0,0 +1,46 @@
+import numpy as np
+
+from utils.downsample import minmax_downsample, minmax_indices
+
+
+def test_short_series_are_returned_unchanged():
+    assert minmax_indices(np.arange(5.0), 10).tolist() == [0, 1, 2, 3, 4]
+    assert minmax_indices(np.arange(10.0), 10).tolist() == list(range(10))
+
+
+def test_spikes_survive_downsampling():
+    values = np.zeros(10000)
+    values[1234] = 100.0
+    values[8765] = -50.0
+    x = np.arange(len(values), dtype=float)
+
+    xs, ys = minmax_downsample(x, values, 200)
+    assert len(xs) <= 200
+    assert 100.0 in ys and -50.0 in ys
+    assert 1234.0 in xs and 8765.0 in xs
+
+
+def test_indices_are_sorted_unique_and_keep_each_bucket_extremes():
+    rng = np.random.default_rng(3)
+    values = rng.normal(size=1003)
+    indices = minmax_indices(values, 100)
+    assert np.all(np.diff(indices) > 0)
+    assert len(indices) <= 100
+
+    starts = np.linspace(0, len(values), 51).astype(int)
+    for start, end in zip(starts[:-1], starts[1:]):
+        chosen = indices[(indices >= start) & (indices < end)]
+        assert values[start:end].min() in values[chosen]
+        assert values[start:end].max() in values[chosen]
+
+
+def test_nan_gaps_are_skipped():
+    values = np.full(1000, np.nan)
+    values[500:510] = [1, 9, 2, 3, 4, 5, 6, 7, 8, 0]
+    indices = minmax_indices(values, 20)
+    assert 501 in indices and 509 in indices
+
+
+def test_flat_buckets_keep_one_point():
+    indices = minmax_indices(np.ones(1000), 100)
+    assert len(indices) == 50
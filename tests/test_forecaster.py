@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from utils.ai_utils import OnlineForecaster, ResourcePredictor
+
+
+def ar1_series(length, c, phi, noise, seed=0):
+    rng = np.random.default_rng(seed)
+    values = np.empty(length)
+    y = c / (1 - phi)
+    for i in range(length):
+        y = c + phi * y + rng.normal(0, noise)
+        values[i] = y
+    return values
+
+
+def test_rls_recovers_ar1_coefficients():
+    forecaster = OnlineForecaster(forgetting=1.0)
+    forecaster.warm_start(ar1_series(5000, c=12.0, phi=0.7, noise=2.0))
+    assert forecaster.phi == pytest.approx(0.7, abs=0.05)
+    assert forecaster.c / (1 - forecaster.phi) == pytest.approx(40.0, abs=1.0)
+
+
+def test_forecast_decays_towards_the_mean_and_is_clipped():
+    forecaster = OnlineForecaster(forgetting=1.0)
+    forecaster.warm_start(ar1_series(3000, c=12.0, phi=0.7, noise=2.0))
+    forecaster.observe(90.0)
+    forecast = forecaster.forecast(10)
+    assert len(forecast) == 10
+    assert np.all(np.diff(forecast) < 0)
+    assert forecast[-1] == pytest.approx(40.0, abs=3.0)
+
+    high = OnlineForecaster(high=100.0)
+    high.warm_start(np.linspace(0, 99, 200))
+    assert np.all(high.forecast(50) <= 100.0)
+
+
+def test_forgetting_follows_a_level_shift():
+    forecaster = OnlineForecaster()
+    forecaster.warm_start(ar1_series(1000, c=6.0, phi=0.8, noise=1.0))
+    forecaster.warm_start(ar1_series(1000, c=14.0, phi=0.8, noise=1.0, seed=1))
+    assert forecaster.c / (1 - forecaster.phi) == pytest.approx(70.0, abs=3.0)
+
+
+def test_flat_and_nan_input_stay_stable():
+    forecaster = OnlineForecaster()
+    assert forecaster.forecast() is None
+    forecaster.warm_start(np.full(5000, 25.0))
+    forecaster.observe(float("nan"))
+    assert forecaster.count == 5000
+    assert forecaster.p00 + forecaster.p11 <= forecaster.initial_covariance * 10 + 1e-6
+    np.testing.assert_allclose(forecaster.forecast(5), 25.0, atol=0.5)
+
+
+def test_predictor_needs_enough_history():
+    predictor = ResourcePredictor()
+    short = np.full(10, 20.0)
+    assert predictor.get_predictions(short, short, short)['cpu'] is None
+
+    history = ar1_series(300, c=10.0, phi=0.5, noise=1.0)
+    for value in history:
+        predictor.observe(value, 50.0, 30.0)
+    predictions = predictor.get_predictions(history, np.full(300, 50.0), np.full(300, 30.0))
+    assert len(predictions['cpu']) == 5 and len(predictions['times']) == 5
+    np.testing.assert_allclose(predictions['memory'], 50.0, atol=0.5)
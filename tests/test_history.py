@@ -0,0 +1,76 @@
+import numpy as np
+
+from utils.history import MetricHistory, RollupLevel
+
+
+def test_rollup_bucket_closes_on_the_boundary():
+    level = RollupLevel(10, 5)
+    assert level.add(100.0, (1, 10, 5)) is None
+    assert level.add(105.0, (3, 20, 5)) is None
+    assert level.add(109.999, (2, 30, 5)) is None
+
+    # The first sample of the next bucket closes the previous one
+    closed = level.add(110.0, (7, 7, 7))
+    assert closed.resolution == 10 and closed.timestamp == 100.0
+    assert closed.mean == (2.0, 20.0, 5.0)
+    assert closed.low == (1.0, 10.0, 5.0)
+    assert closed.high == (3.0, 30.0, 5.0)
+    assert level.timestamps.view().tolist() == [100.0]
+
+
+def test_gap_in_samples_closes_one_bucket_only():
+    level = RollupLevel(10, 5)
+    level.add(100.0, (1, 1, 1))
+    closed = level.add(145.0, (2, 2, 2))
+    assert closed.timestamp == 100.0
+    assert level.timestamps.view().tolist() == [100.0]
+    assert level.close_bucket().timestamp == 140.0
+
+
+def test_window_includes_the_open_bucket():
+    level = RollupLevel(10, 5)
+    for t in range(100, 125):
+        level.add(float(t), (t, 0, 0))
+    window = level.window(0)
+    assert window.timestamps.tolist() == [100.0, 110.0, 120.0]
+    assert window.mean["cpu"].tolist() == [104.5, 114.5, 122.0]
+    assert window.high["cpu"].tolist() == [109.0, 119.0, 124.0]
+
+    assert level.window(110).timestamps.tolist() == [110.0, 120.0]
+
+
+def test_rollup_ring_drops_oldest_buckets():
+    level = RollupLevel(10, 3)
+    for t in range(0, 60, 5):
+        level.add(float(t), (1, 1, 1))
+    assert level.timestamps.view().tolist() == [20.0, 30.0, 40.0]
+
+
+def test_series_picks_the_finest_resolution_that_covers_the_range():
+    history = MetricHistory(capacity=60, rollup_levels=((10, 100), (60, 100)))
+    start = 1_000_000.0
+    for i in range(3000):
+        history.append(start + i, i % 100, 50, 10)
+    now = start + 3000
+
+    raw = history.series(30, now)
+    assert raw.resolution == 1 and len(raw.timestamps) == 30
+    assert history.series(600, now).resolution == 10
+    assert history.series(2000, now).resolution == 60
+    # Longer than every level: the coarsest one is used
+    assert history.series(10 ** 6, now).resolution == 60
+
+    window = history.series(600, now)
+    assert np.all(window.low["cpu"] <= window.mean["cpu"])
+    assert np.all(window.mean["cpu"] <= window.high["cpu"])
+
+
+def test_append_reports_closed_buckets_and_counts_samples():
+    history = MetricHistory(capacity=10, rollup_levels=((10, 10), (60, 10)))
+    closed = []
+    for t in range(0, 61):
+        closed.extend(history.append(float(t), 1, 2, 3))
+    assert [(bucket.resolution, bucket.timestamp) for bucket in closed] == \
+        [(10, float(t)) for t in range(0, 60, 10)] + [(60, 0.0)]
+    assert len(history) == 10
+    assert history.total_samples == 61
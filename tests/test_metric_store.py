@@ -0,0 +1,104 @@
+import math
+import time
+
+import numpy as np
+import pytest
+
+from utils.history import MetricHistory
+from utils.metric_store import MetricStore
+from utils.process_history import ProcessHistory
+from utils.snapshot import ProcessInfo, ProcessSnapshot
+
+RETENTION = {"system": 3600, "rollups": 7 * 24 * 3600, "process": 3600}
+LEVELS = ((10, 100), (60, 100))
+# A recent time (the store prunes against the wall clock) that is 5 seconds into
+# a 10 s bucket and 45 seconds into a 60 s bucket
+NOW = math.floor(time.time() / 600) * 600 - 600 + 45.0
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "metrics.db")
+
+
+def snapshot(timestamp):
+    processes = [ProcessInfo(1, "idle", "sleeping", 1.0, 10 * 2 ** 20, 100.0, 0, 0, 1),
+                 ProcessInfo(2, "busy", "running", 50.0, 20 * 2 ** 20, 200.0, 0, 0, 4)]
+    return ProcessSnapshot(processes, timestamp, 0.0, 0.0)
+
+
+def record(store, history, start, end):
+    for t in np.arange(start, end):
+        store.add_sample(t, t % 100, 50.0, 25.0, history.append(t, t % 100, 50.0, 25.0), snapshot(t))
+
+
+def test_round_trip_restores_samples_and_rollups(path):
+    history = MetricHistory(capacity=600, rollup_levels=LEVELS)
+    store = MetricStore(path, RETENTION, top_processes=2)
+    record(store, history, NOW - 300, NOW)
+    store.close(history)
+
+    restored = MetricHistory(capacity=600, rollup_levels=LEVELS)
+    store = MetricStore(path, RETENTION)
+    assert store.restore_history(restored, now=NOW) == 300
+    np.testing.assert_array_equal(restored.cpu.view(), history.cpu.view())
+    for original, level in zip(history.rollups, restored.rollups):
+        # The bucket that was still open at shutdown is reopened, not stored as finished
+        np.testing.assert_array_equal(level.timestamps.view(), original.timestamps.view()[:-1])
+    store.close()
+
+
+def test_partial_buckets_resume_after_restart(path):
+    history = MetricHistory(capacity=600, rollup_levels=LEVELS)
+    store = MetricStore(path, RETENTION)
+    record(store, history, NOW - 300, NOW)
+    store.close(history)
+
+    restored = MetricHistory(capacity=600, rollup_levels=LEVELS)
+    store = MetricStore(path, RETENTION)
+    store.restore_history(restored, now=NOW)
+    assert [(level._bucket, level._count) for level in restored.rollups] == [(NOW - 5, 5), (NOW - 45, 45)]
+
+    # Finishing the 60 s bucket after the restart gives the same result as an uninterrupted run
+    reference = MetricHistory(capacity=600, rollup_levels=LEVELS)
+    for t in np.arange(NOW - 300, NOW + 16):
+        reference.append(t, t % 100, 50.0, 25.0)
+    closed = []
+    for t in np.arange(NOW, NOW + 16):
+        closed.extend(restored.append(t, t % 100, 50.0, 25.0))
+    minute = [bucket for bucket in closed if bucket.resolution == 60][0]
+    expected = reference.rollup(60).window(NOW - 45)
+    assert minute.timestamp == NOW - 45
+    assert minute.mean[0] == pytest.approx(expected.mean["cpu"][0])
+    assert minute.high[0] == expected.high["cpu"][0]
+    store.close()
+
+
+def test_process_history_is_replayed(path):
+    history = MetricHistory(capacity=600, rollup_levels=LEVELS)
+    store = MetricStore(path, RETENTION, top_processes=1)
+    record(store, history, NOW - 50, NOW)
+    store.close()
+
+    store = MetricStore(path, RETENTION)
+    processes = ProcessHistory(capacity=100, max_tracked=5)
+    assert store.restore_process_history(processes, now=NOW) == 50
+    key = processes.find(2)
+    assert key == (2, 200.0)
+    timestamps, cpu, rss = processes.series(key)
+    assert len(timestamps) == 50 and np.all(cpu == 50.0)
+    # Only the top process was stored
+    assert processes.find(1) is None
+    store.close()
+
+
+def test_prune_applies_retention(path):
+    history = MetricHistory(capacity=600, rollup_levels=LEVELS)
+    store = MetricStore(path, RETENTION)
+    record(store, history, NOW - 300, NOW)
+    store.flush()
+    store.prune(now=NOW + 3600 - 100)
+    timestamps, _, _, _ = store.load_recent(10 ** 6, now=NOW)
+    assert len(timestamps) == 100 and timestamps[0] == NOW - 100
+    assert len(store.load_process_samples(10 ** 6, now=NOW)) == 100 * 2
+    store.close()
@@ -0,0 +1,45 @@
+import numpy as np
+
+from utils.ai_utils import score_process_anomalies, top_process_anomalies
+from utils.process_history import ProcessHistory
+from utils.snapshot import ProcessInfo, ProcessSnapshot
+
+
+def make_snapshot(rows):
+    """rows: (pid, cpu_percent, rss) tuples"""
+    return ProcessSnapshot([ProcessInfo(pid, f"proc{pid}", "running", cpu, rss, float(pid), 1, 0, 1)
+                            for pid, cpu, rss in rows], 0.0, 0.0, 0.0)
+
+
+def test_score_flags_only_the_process_that_changed():
+    rng = np.random.default_rng(0)
+    cpu = rng.normal(10, 1, (5, 200))
+    rss = np.full((5, 200), 100e6) + rng.normal(0, 1e5, (5, 200))
+    cpu[2, -10:] = 60
+    rss[4, -10:] = 200e6
+
+    scores, cpu_z, rss_z = score_process_anomalies(cpu, rss)
+    assert set(np.flatnonzero(scores >= 4.0)) == {2, 4}
+    assert cpu_z[2] > rss_z[2]
+    assert rss_z[4] > cpu_z[4]
+
+
+def test_score_needs_a_baseline():
+    scores, _, _ = score_process_anomalies(np.ones((3, 20)), np.ones((3, 20)))
+    assert np.all(np.isnan(scores))
+
+
+def test_top_anomalies_skip_freed_slots():
+    history = ProcessHistory(capacity=200, max_tracked=3, grace_period=2)
+    for t in range(160):
+        spike = t >= 145
+        rows = [(2, 40.0 if spike else 5.0, 50e6), (3, 40.0 if spike else 5.0, 50e6)]
+        if t < 155:
+            # pid 1 spikes hardest, then exits; its slot is freed but keeps the samples
+            rows.append((1, 90.0 if spike else 5.0, 50e6))
+        history.update(make_snapshot(rows), timestamp=float(t))
+
+    assert history.find(1) is None
+    anomalies = top_process_anomalies(history, limit=2)
+    assert sorted(proc['pid'] for proc in anomalies) == [2, 3]
+    assert all(proc['reason'] == 'CPU' for proc in anomalies)
@@ -0,0 +1,76 @@
+import numpy as np
+
+from utils.process_history import ProcessHistory
+from utils.snapshot import ProcessInfo, ProcessSnapshot
+
+
+def make_snapshot(rows):
+    """rows: (pid, cpu_percent) pairs; create_time is derived from the pid"""
+    return ProcessSnapshot([ProcessInfo(pid, f"proc{pid}", "running", cpu, pid * 2 ** 20, float(pid), 1, 0, 1)
+                            for pid, cpu in rows], 0.0, 0.0, 0.0)
+
+
+def test_columns_wrap_and_rows_stay_ordered():
+    history = ProcessHistory(capacity=5, max_tracked=2)
+    for t in range(8):
+        history.update(make_snapshot([(1, float(t))]), timestamp=float(t))
+    timestamps, cpu, rss = history.series((1, 1.0))
+    assert timestamps.tolist() == [3.0, 4.0, 5.0, 6.0, 7.0]
+    assert cpu.tolist() == [3.0, 4.0, 5.0, 6.0, 7.0]
+    assert np.all(rss == 2 ** 20)
+
+
+def test_absent_process_gets_nan_and_is_evicted_after_grace_period():
+    history = ProcessHistory(capacity=10, max_tracked=2, grace_period=2.0)
+    history.update(make_snapshot([(1, 5.0), (2, 5.0)]), timestamp=0.0)
+    history.update(make_snapshot([(2, 5.0)]), timestamp=1.0)
+    _, cpu, _ = history.series((1, 1.0))
+    assert cpu[0] == 5.0 and np.isnan(cpu[1])
+
+    history.update(make_snapshot([(2, 5.0)]), timestamp=2.0)
+    assert history.find(1) is not None
+    history.update(make_snapshot([(2, 5.0)]), timestamp=3.0)
+    assert history.find(1) is None
+    assert None in history.slot_keys
+
+
+def test_reused_pid_gets_its_own_row():
+    history = ProcessHistory(capacity=10, max_tracked=3)
+    old = ProcessInfo(7, "old", "running", 5.0, 1, 100.0, 1, 0, 1)
+    new = ProcessInfo(7, "new", "running", 9.0, 1, 200.0, 1, 0, 1)
+    history.update(ProcessSnapshot([old], 0.0, 0.0, 0.0), timestamp=0.0)
+    history.update(ProcessSnapshot([new], 0.0, 0.0, 0.0), timestamp=1.0)
+    assert (7, 100.0) in history.slots and (7, 200.0) in history.slots
+    _, cpu, _ = history.series((7, 200.0))
+    assert np.isnan(cpu[0]) and cpu[1] == 9.0
+
+
+def test_short_bursts_do_not_replace_established_processes():
+    history = ProcessHistory(capacity=100, max_tracked=3, min_tenure=10, replace_margin=5.0)
+    steady = [(1, 10.0), (2, 12.0), (3, 14.0)]
+    history.update(make_snapshot(steady), timestamp=0.0)
+    for t in range(1, 50):
+        # A new short-lived process every tick, a little busier than the quietest tracked one
+        history.update(make_snapshot(steady + [(1000 + t, 13.0)]), timestamp=float(t))
+    assert sorted(key[0] for key in history.slots) == [1, 2, 3]
+    _, cpu, _ = history.series((1, 1.0))
+    assert not np.any(np.isnan(cpu))
+
+
+def test_clearly_busier_process_replaces_the_least_active_slot():
+    history = ProcessHistory(capacity=100, max_tracked=3, min_tenure=10, replace_margin=5.0)
+    steady = [(1, 10.0), (2, 12.0), (3, 14.0)]
+    for t in range(5):
+        history.update(make_snapshot(steady), timestamp=float(t))
+    # Still within the minimum tenure: no slot can be taken
+    history.update(make_snapshot(steady + [(99, 80.0)]), timestamp=5.0)
+    assert history.find(99) is None
+
+    for t in range(6, 12):
+        history.update(make_snapshot(steady), timestamp=float(t))
+    history.update(make_snapshot(steady + [(99, 80.0)]), timestamp=12.0)
+    assert history.find(99) is not None
+    assert history.find(1) is None
+    # The reused slot does not show the previous owner's samples
+    _, cpu, _ = history.series(history.find(99))
+    assert np.count_nonzero(~np.isnan(cpu)) == 1
@@ -0,0 +1,49 @@
+import os
+import time
+
+from utils.process_registry import ProcessRegistry
+
+
+def scan_by_pid(registry):
+    return {pid: (create_time, info) for pid, create_time, info in registry.scan()}
+
+
+def test_scan_measures_cpu_percent_on_second_pass():
+    registry = ProcessRegistry()
+    pid = os.getpid()
+    assert pid in scan_by_pid(registry)
+    assert registry.cpu_percent(pid) is None
+
+    end = time.monotonic() + 0.1
+    while time.monotonic() < end:
+        pass
+    rows = scan_by_pid(registry)
+    assert registry.cpu_percent(pid) is not None
+    assert rows[pid][1]['cpu_percent'] > 0
+
+
+def test_scan_replaces_entry_when_pid_is_reused():
+    registry = ProcessRegistry()
+    pid = os.getpid()
+    scan_by_pid(registry)
+    old = registry._entries[pid]
+
+    # Pretend the PID now belongs to a different process: the cached Process reports
+    # it is no longer running, and its CPU counter is far ahead of the new process
+    old.process.is_running = lambda: False
+    old.cpu_total = 1e9
+    old.create_time -= 100.0
+
+    rows = scan_by_pid(registry)
+    entry = registry._entries[pid]
+    assert entry is not old
+    assert entry.cpu_total is not None and entry.cpu_total < 1e9
+    assert entry.cpu_percent is None
+    assert rows[pid][0] == entry.create_time != old.create_time
+
+
+def test_lookups_without_a_cached_entry():
+    registry = ProcessRegistry()
+    pid = os.getpid()
+    assert registry.cpu_percent(pid) is None
+    assert registry.get(pid).pid == pid
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from utils.ring_buffer import RingBuffer
+
+
+def test_append_wraps_and_keeps_order():
+    buffer = RingBuffer(4)
+    for value in range(10):
+        buffer.append(value)
+        expected = list(range(max(0, value - 3), value + 1))
+        assert buffer.view().tolist() == expected
+    assert len(buffer) == 4
+    assert buffer.total_appended == 10
+    assert buffer[-1] == 9 and buffer[0] == 6
+    assert buffer.last(2).tolist() == [8, 9]
+
+
+def test_view_is_contiguous_read_only_and_not_a_copy():
+    buffer = RingBuffer(3)
+    for value in range(5):
+        buffer.append(value)
+    view = buffer.view()
+    assert view.flags.c_contiguous
+    with pytest.raises(ValueError):
+        view[0] = 99
+    assert np.shares_memory(view, buffer._data)
+
+
+def test_extend_keeps_the_newest_values():
+    buffer = RingBuffer(5)
+    buffer.append(1)
+    buffer.append(2)
+    buffer.extend([3, 4, 5, 6])
+    assert buffer.view().tolist() == [2, 3, 4, 5, 6]
+
+    buffer.extend(range(100, 120))
+    assert buffer.view().tolist() == list(range(115, 120))
+
+    # Appending after a bulk load continues to wrap correctly
+    for value in range(120, 127):
+        buffer.append(value)
+    assert buffer.view().tolist() == list(range(122, 127))
+
+
+def test_empty_and_clear():
+    buffer = RingBuffer(3, np.float32)
+    assert not buffer and len(buffer.view()) == 0
+    buffer.extend([])
+    buffer.append(1.5)
+    assert buffer and buffer.view().dtype == np.float32
+    buffer.clear()
+    assert len(buffer) == 0 and buffer.view().tolist() == []
@@ -0,0 +1,93 @@
+from utils.scheduler import TickScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeTk:
+    """Records pending after/after_idle callbacks like a Tk widget"""
+
+    def __init__(self):
+        self.pending = {}
+        self.next_id = 0
+
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.pending[self.next_id] = callback
+        return self.next_id
+
+    def after_idle(self, callback):
+        return self.after(0, callback)
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def fire(self):
+        callbacks = list(self.pending.values())
+        self.pending.clear()
+        for callback in callbacks:
+            callback()
+
+
+def test_missed_ticks_are_skipped_not_stacked():
+    clock = FakeClock()
+    scheduler = TickScheduler(clock=clock)
+    runs = []
+    task = scheduler.add("task", 1.0, lambda: runs.append(clock.now), delay=0)
+
+    scheduler.run_pending()
+    clock.now = 3.5
+    assert scheduler.run_pending() == 1
+    assert scheduler.run_pending() == 0
+    assert runs == [0.0, 3.5]
+    assert task.skipped == 2
+    assert task.next_run == 4.0
+
+
+def test_priority_order_and_errors():
+    clock = FakeClock()
+    scheduler = TickScheduler(clock=clock)
+    order = []
+    scheduler.add("low", 1.0, lambda: order.append("low"), priority=5, delay=0)
+    scheduler.add("high", 1.0, lambda: order.append("high"), priority=0, delay=0)
+    scheduler.add("broken", 1.0, lambda: 1 / 0, priority=1, delay=0)
+
+    assert scheduler.run_pending() == 3
+    assert order == ["high", "low"]
+    assert scheduler.tasks["broken"].errors == 1
+
+
+def test_hidden_tasks_are_marked_dirty_and_caught_up():
+    clock = FakeClock()
+    scheduler = TickScheduler(clock=clock)
+    visible = [False]
+    runs = []
+    task = scheduler.add("render", 1.0, lambda: runs.append(clock.now), delay=0,
+                         visible=lambda: visible[0])
+
+    scheduler.run_pending()
+    assert runs == [] and task.dirty and task.hidden_skips == 1
+
+    clock.now = 0.2
+    visible[0] = True
+    scheduler.catch_up()
+    scheduler.run_pending()
+    assert runs == [0.2] and not task.dirty
+
+
+def test_waking_from_inside_a_tick_keeps_one_timer():
+    clock = FakeClock()
+    scheduler = TickScheduler(clock=clock)
+    tk = FakeTk()
+    scheduler.add("other", 1.0, lambda: None)
+    scheduler.add("task", 1.0, lambda: scheduler.run_soon("other"), delay=0)
+    scheduler.attach_tk(tk)
+
+    for _ in range(5):
+        tk.fire()
+        assert len(tk.pending) == 1
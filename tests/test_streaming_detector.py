@@ -0,0 +1,47 @@
+import numpy as np
+
+from utils.ai_utils import StreamingAnomalyDetector
+
+
+def feed(detector, cpu, mem=None, disk=None):
+    mem = np.full(len(cpu), 40.0) if mem is None else mem
+    disk = np.full(len(cpu), 60.0) if disk is None else disk
+    return [detector.update(c, m, d, timestamp=0.0) for c, m, d in zip(cpu, mem, disk)]
+
+
+def noisy(length, level, noise, seed=0):
+    return level + np.random.default_rng(seed).normal(0, noise, length)
+
+
+def test_nothing_is_reported_during_warmup():
+    detector = StreamingAnomalyDetector(warmup=30)
+    cpu = noisy(30, 20, 2)
+    cpu[10] = 100.0
+    assert not any(result['is_anomaly'] for result in feed(detector, cpu))
+
+
+def test_normal_noise_gives_no_false_positives():
+    detector = StreamingAnomalyDetector()
+    results = feed(detector, noisy(2000, 20, 2), noisy(2000, 40, 1, seed=1), noisy(2000, 60, 0.2, seed=2))
+    assert sum(result['is_anomaly'] for result in results) == 0
+
+
+def test_spike_is_flagged_once_and_does_not_move_the_baseline():
+    detector = StreamingAnomalyDetector()
+    feed(detector, noisy(200, 20, 2))
+    baseline = detector.mean['cpu']
+
+    results = feed(detector, [95.0, 95.0, 95.0])
+    assert all(result['is_anomaly'] for result in results)
+    assert [result['is_new'] for result in results] == [True, False, False]
+    assert results[0]['metric'] == 'cpu'
+    assert detector.mean['cpu'] - baseline < 2.0
+
+
+def test_lasting_level_shift_is_learned():
+    detector = StreamingAnomalyDetector()
+    feed(detector, noisy(200, 20, 2))
+    results = feed(detector, noisy(400, 60, 2, seed=3))
+    assert results[0]['is_anomaly']
+    assert not any(result['is_anomaly'] for result in results[-100:])
+    assert abs(detector.mean['cpu'] - 60) < 3
@@ -0,0 +1,108 @@
+import random
+
+from ui.treeview_diff import TreeviewDiff, longest_increasing_run
+
+
+class FakeTree:
+    """Stand-in for ttk.Treeview that keeps the child order and counts Tk calls"""
+
+    def __init__(self):
+        self.children = []
+        self.values = {}
+        self.calls = 0
+
+    def insert(self, parent, index, iid, values):
+        self.calls += 1
+        self.children.insert(index, iid)
+        self.values[iid] = values
+
+    def move(self, iid, parent, index):
+        # Like Tk: a detached item is reattached, an attached one is unlinked first
+        self.calls += 1
+        if iid in self.children:
+            self.children.remove(iid)
+        self.children.insert(index, iid)
+
+    def item(self, iid, values):
+        self.calls += 1
+        self.values[iid] = values
+
+    def detach(self, *iids):
+        self.calls += 1
+        for iid in iids:
+            self.children.remove(iid)
+
+    def delete(self, *iids):
+        self.calls += 1
+        for iid in iids:
+            self.children.remove(iid)
+            del self.values[iid]
+
+
+def process_rows(processes):
+    """Rows sorted by CPU like the process list; key is (pid, create_time)"""
+    ordered = sorted(processes.items(), key=lambda item: (-item[1][0], item[0]))
+    return [((pid, 1.0), (pid, f"proc{pid}", f"{cpu:.1f}", f"{rss:.1f}")) for pid, (cpu, rss) in ordered]
+
+
+def assert_matches(tree, rows):
+    assert tree.children == [TreeviewDiff.make_iid(key) for key, _ in rows]
+    assert all(tree.values[TreeviewDiff.make_iid(key)] == values for key, values in rows)
+
+
+def test_update_matches_target_after_random_changes():
+    rng = random.Random(1)
+    tree = FakeTree()
+    diff = TreeviewDiff(tree)
+    rows = [(i, (i, rng.random())) for i in range(200)]
+    for _ in range(50):
+        rng.shuffle(rows)
+        rows = rows[:rng.randint(150, 200)] + [(rng.randint(1000, 2000), (0, 0.0)) for _ in range(5)]
+        rows = [(key, values) for key, values in dict(rows).items()]
+        for i in rng.sample(range(len(rows)), 10):
+            rows[i] = (rows[i][0], (rows[i][1][0], rng.random()))
+        diff.update(rows)
+        assert_matches(tree, rows)
+
+
+def test_realistic_tick_needs_an_order_of_magnitude_fewer_calls():
+    rng = random.Random(0)
+    # 4000 processes, most idle; each tick a few hundred change CPU/RSS, a few exit or start
+    processes = {pid: (rng.choice([0.0] * 9 + [rng.uniform(0, 30)]), rng.uniform(1, 500))
+                 for pid in range(1, 4001)}
+    tree = FakeTree()
+    diff = TreeviewDiff(tree)
+    diff.update(process_rows(processes))
+    next_pid = 5000
+
+    diff_calls = []
+    for _ in range(20):
+        for pid in rng.sample(sorted(processes), 200):
+            cpu, rss = processes[pid]
+            processes[pid] = (max(0.0, cpu + rng.uniform(-2, 2)) if cpu else cpu, rss + rng.uniform(-1, 1))
+        for pid in rng.sample(sorted(processes), 5):
+            del processes[pid]
+        for _ in range(5):
+            processes[next_pid] = (rng.uniform(0, 5), rng.uniform(1, 50))
+            next_pid += 1
+
+        rows = process_rows(processes)
+        tree.calls = 0
+        diff.update(rows)
+        assert tree.calls == diff.last_call_count
+        diff_calls.append(tree.calls)
+        assert_matches(tree, rows)
+
+    # A full rebuild deletes everything in one call and inserts every row
+    full_rebuild_calls = 1 + len(processes)
+    print(f"full rebuild {full_rebuild_calls} calls, diff {min(diff_calls)}-{max(diff_calls)} calls per tick")
+    assert max(diff_calls) * 10 <= full_rebuild_calls
+
+
+def test_longest_increasing_run_keeps_rows_already_in_order():
+    position = {name: i for i, name in enumerate("ABCDE")}
+    # E moved to the front: everything else keeps its place
+    assert longest_increasing_run(list("EABCD"), position) == set("ABCD")
+    # A moved to the back
+    assert longest_increasing_run(list("BCDEA"), position) == set("BCDE")
+    assert longest_increasing_run([], position) == set()
@@ -13,22 +13,54 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import math
 import random
+import threading
 import traceback
 import getpass
 
-from config import THEMES, DEFAULT_ALERT_THRESHOLDS, CUSTOM_STYLES
+from config import (THEMES, DEFAULT_ALERT_THRESHOLDS, CUSTOM_STYLES, DEFAULT_COLLECTOR_BACKEND,
+                    METRIC_STORE_PATH, METRIC_RETENTION, METRIC_STORE_TOP_PROCESSES, ANALYTICS_WORKERS,
+                    PROCESS_HISTORY_SAMPLES, PROCESS_HISTORY_MAX_TRACKED, PROCESS_HISTORY_GRACE_PERIOD,
+                    PROCESS_HISTORY_MIN_TENURE, PROCESS_HISTORY_REPLACE_MARGIN)
 from ui.sections import TopSection, MiddleSection
-from utils.process_utils import get_process_details, kill_process, change_process_priority
-from utils.ai_utils import ResourcePredictor, AnomalyDetector
+from utils.alerts import check_thresholds
+from utils.process_utils import kill_process, change_process_priority
+from utils.snapshot import SnapshotEngine, ProcessSnapshot
+from utils.collector import BackgroundCollector
+from utils.scheduler import TickScheduler
+from utils.profiler import StageTimer
+from utils.history import MetricHistory
+from utils.downsample import minmax_indices
+from utils.metric_store import MetricStore
+from utils.process_history import ProcessHistory
+from utils.ai_utils import (ResourcePredictor, AnomalyDetector, StreamingAnomalyDetector,
+                            preload_analytics, analytics_ready,
+                            fit_anomaly_model, arima_predictions, top_process_anomalies)
+from utils.ai_worker import AnalyticsWorkerPool
 from ui.footer import Footer
+from ui.virtual_table import VirtualProcessTable
+from ui.graphs import BlitManager, AreaSeries
+from ui.perf_overlay import PerformanceOverlay
+
+# Graph time ranges (label -> seconds); the longer ranges are served from rollup history
+TIME_RANGES = {
+    "5 minutes": 300,
+    "15 minutes": 900,
+    "30 minutes": 1800,
+    "1 hour": 3600,
+    "6 hours": 6 * 3600,
+    "24 hours": 24 * 3600,
+    "7 days": 7 * 24 * 3600,
+}
 
 # Set default font to avoid EUDC.TTE error
 mpl.rcParams['font.family'] = 'DejaVu Sans'  # Use a single, reliable font
 mpl.rcParams['axes.unicode_minus'] = False    # Fix minus sign display
 
 class ProcessMonitorApp:
-    def __init__(self, root):
+    def __init__(self, root, backend=DEFAULT_COLLECTOR_BACKEND, store_path=METRIC_STORE_PATH):
         """Initialize the Process Monitor App"""
+        self.startup_started = time.perf_counter()
+        self.first_frame_time = None  # seconds from __init__ to the first painted frame
         self.root = root
         self.root.title("Advanced Process Monitoring Dashboard")
         self.root.geometry("1280x720")
@@ -61,6 +93,43 @@ class ProcessMonitorApp:
         self.top_section = None
         self.middle_section = None  # Add this line
         
+        # Shared process table snapshot, collected once per refresh tick
+        self.snapshot_engine = SnapshotEngine(backend=backend)
+        
+        # All periodic UI work runs from one monotonic scheduler (see start_background_tasks)
+        self.stage_timer = StageTimer()
+        self.scheduler = TickScheduler(timer=self.stage_timer)
+        self.perf_overlay = None
+        
+        # Training and ARIMA fits run in worker processes; the UI shows the last finished result
+        self.analytics_pool = AnalyticsWorkerPool(max_workers=ANALYTICS_WORKERS)
+        
+        # Metric history (one hour at 1-second intervals) in preallocated ring buffers
+        self.metric_history = MetricHistory(capacity=3600)
+        self.timestamps = self.metric_history.timestamps
+        self.cpu_usage_history = self.metric_history.cpu
+        self.mem_usage_history = self.metric_history.memory
+        self.disk_usage_history = self.metric_history.disk
+        
+        # CPU/RSS history of the most active processes, keyed by (pid, create_time)
+        self.process_history = ProcessHistory(capacity=PROCESS_HISTORY_SAMPLES,
+                                              max_tracked=PROCESS_HISTORY_MAX_TRACKED,
+                                              grace_period=PROCESS_HISTORY_GRACE_PERIOD,
+                                              min_tenure=PROCESS_HISTORY_MIN_TENURE,
+                                              replace_margin=PROCESS_HISTORY_REPLACE_MARGIN)
+        
+        # Reload recent history from disk so graphs and AI models don't start cold
+        self.metric_store = None
+        if store_path:
+            try:
+                self.metric_store = MetricStore(store_path, METRIC_RETENTION,
+                                                top_processes=METRIC_STORE_TOP_PROCESSES)
+                self.metric_store.restore_history(self.metric_history)
+                self.metric_store.restore_process_history(self.process_history)
+            except Exception as e:
+                print(f"Metric store unavailable, history will not persist: {e}")
+                self.metric_store = None
+        
         # Create the UI components
         self.create_ui()
         
@@ -70,6 +139,9 @@ class ProcessMonitorApp:
         # Set up closing event
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
+        # F12 toggles the performance overlay (per-stage timings of the monitor itself)
+        self.root.bind("<F12>", self.toggle_perf_overlay)
+        
         # Initialize AI model training flag
         self.is_model_trained = False
         
@@ -77,16 +149,21 @@ class ProcessMonitorApp:
         self.showing_ai_results = False
         
         # Data storage
-        self.cpu_usage_history = []
-        self.mem_usage_history = []
-        self.disk_usage_history = []
-        self.timestamps = []
-        self.process_history = {}
         self.alerts = []  # Store alert history
         
         # Initialize AI components
         self.resource_predictor = ResourcePredictor()
+        # The online forecasters continue from any history restored from the store
+        self.resource_predictor.warm_start(self.cpu_usage_history.view(),
+                                           self.mem_usage_history.view(),
+                                           self.disk_usage_history.view())
         self.anomaly_detector = AnomalyDetector()
+        # Scores every sample as it arrives (no training pass, constant cost per tick)
+        self.streaming_detector = StreamingAnomalyDetector()
+        self.last_streaming_result = None
+        self.last_anomaly_result = None
+        self.process_anomalies = []
+        self.ai_predictions = None
         self.recent_anomalies = []
         self.is_model_trained = False  # Flag to track if AI model is trained
         
@@ -95,6 +172,9 @@ class ProcessMonitorApp:
         mpl.rcParams['axes.unicode_minus'] = False
         
         self.start_time = datetime.now()  # Add this line
+        if self.timestamps:
+            # Count restored history as already collected
+            self.start_time = datetime.fromtimestamp(float(self.timestamps[0]))
         
         # Add this global error handler to main.py or at the app initialization:
         self.add_exception_handling()
@@ -186,20 +266,18 @@ class ProcessMonitorApp:
         list_container = ttk.Frame(self.process_frame, style="Card.TFrame")
         list_container.pack(fill="both", expand=True, padx=5, pady=(0, 2))
         
-        # Process treeview
+        # Process table: every process is kept (sorted) in memory, but only the rows
+        # on screen exist as Treeview items; click a heading to sort on that column
         columns = ("PID", "Name", "CPU%", "Memory", "Status")
-        self.process_tree = ttk.Treeview(list_container, 
-                                       columns=columns, 
-                                       show="headings",
-                                       style="Custom.Treeview",
-                                       height=8)  # Set explicit height to control vertical size
-        
-        # Configure columns
-        self.process_tree.heading("PID", text="PID")
-        self.process_tree.heading("Name", text="Process Name")
-        self.process_tree.heading("CPU%", text="CPU %")
-        self.process_tree.heading("Memory", text="Memory (MB)")
-        self.process_tree.heading("Status", text="Status")
+        self.process_table = VirtualProcessTable(
+            list_container,
+            columns,
+            headings={"Name": "Process Name", "CPU%": "CPU %", "Memory": "Memory (MB)"},
+            formatters={"CPU%": lambda value: f"{value:.1f}", "Memory": lambda value: f"{value:.1f}"},
+            height=8,  # Set explicit height to control vertical size
+            sort_column="CPU%"
+        )
+        self.process_tree = self.process_table.tree
         
         self.process_tree.column("PID", width=70, anchor="center")
         self.process_tree.column("Name", width=200)
@@ -207,12 +285,7 @@ class ProcessMonitorApp:
         self.process_tree.column("Memory", width=100, anchor="center")
         self.process_tree.column("Status", width=100, anchor="center")
         
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(list_container, orient="vertical", command=self.process_tree.yview)
-        self.process_tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.process_tree.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self.process_table.pack(fill="both", expand=True)
         
         # Create the process controls at the bottom of the process list with reduced padding
         self.create_process_controls_panel(self.process_frame)
@@ -236,12 +309,6 @@ class ProcessMonitorApp:
         self.performance_frame.grid(row=1, column=0, sticky="nsew", padx=0, pady=(2, 0))
         self.create_performance_graphs(self.performance_frame)
         
-        # Initialize data storage for history
-        self.timestamps = []
-        self.cpu_usage_history = []
-        self.mem_usage_history = []
-        self.disk_usage_history = []
-        
         # Explicitly connect the filter_var to the update_process_list method
         self.filter_var.trace_add("write", self.on_filter_change)
         
@@ -513,83 +580,128 @@ class ProcessMonitorApp:
 
     def start_background_tasks(self):
         """Start background data updating"""
-        self.update_data()
+        # psutil sampling runs on its own thread; the Tk loop only drains its queue
+        self.collector = BackgroundCollector(interval=self.get_refresh_interval(),
+                                             snapshot_engine=self.snapshot_engine,
+                                             timer=self.stage_timer)
+        self.collector.start()
+        
+        # Periodic UI tasks; lower priority numbers run first when several are due.
+        # Collection and analysis always run; rendering tasks are skipped while their panel
+        # is hidden and catch up with one render when it is shown again.
+        self.scheduler.add("collector", 0.1, self.poll_collector, priority=0, delay=0)
+        self.scheduler.add("analytics-poll", 0.25, self.analytics_pool.poll, priority=4, delay=0.25)
+        self.scheduler.add("ai-analysis", self.get_refresh_interval, self.update_ai_components, priority=3,
+                           delay=1.0)
+        self.scheduler.add("graphs", self.get_refresh_interval, self.update_performance_graphs, priority=1,
+                           delay=1.0, visible=lambda: self.is_widget_visible(self.performance_frame))
+        self.scheduler.add("refresh-ui", self.get_refresh_interval, self.refresh_ui, priority=2,
+                           delay=1.0, visible=self.is_window_visible)
+        self.scheduler.add("system-logs", 10, self.update_system_logs, priority=5, delay=1.0,
+                           visible=self.is_window_visible)
+        if self.top_section is not None:
+            self.scheduler.add("gauges", self.get_refresh_interval, self.render_gauges, priority=1,
+                               delay=1.0, visible=self.top_section.is_visible)
+            self.scheduler.add("ai-insights", self.get_refresh_interval, self.render_ai_insights, priority=3,
+                               delay=1.0, visible=self.top_section.is_visible)
+            self.scheduler.add("system-info", 10, self.top_section.update_system_info, priority=5,
+                               visible=self.top_section.is_visible)
+        self.scheduler.attach_tk(self.root)
+        
+        # Mapping (de-iconify, tab switch, pack) is the moment hidden panels become visible again
+        self.root.bind("<Map>", self.on_map, add="+")
+
+    def is_window_visible(self):
+        """Return False while the main window is minimized or withdrawn"""
+        return self.root.state() not in ("iconic", "withdrawn") and bool(self.root.winfo_viewable())
+
+    def is_widget_visible(self, widget):
+        """Return True if a widget and all its parents are mapped in a visible window"""
+        return widget is not None and self.is_window_visible() and bool(widget.winfo_viewable())
+
+    def on_map(self, event=None):
+        """Render panels that skipped updates while hidden"""
+        self.scheduler.catch_up()
+        if self.first_frame_time is None and event is not None and event.widget is self.root:
+            # The window is mapped; the first frame is painted once the pending redraws are idle
+            self.first_frame_time = 0.0
+            self.root.after_idle(self.on_first_frame)
+
+    def on_first_frame(self):
+        """Record time to first frame, then load the analytics stack off the UI thread"""
+        self.root.update_idletasks()
+        self.first_frame_time = time.perf_counter() - self.startup_started
+        self.stage_timer.record("startup.first_frame", self.first_frame_time)
+        threading.Thread(target=self.preload_analytics, name="analytics-preload", daemon=True).start()
+
+    def preload_analytics(self):
+        """Import scikit-learn and statsmodels in the background"""
+        with self.stage_timer.time("startup.analytics_import"):
+            preload_analytics()
+
+    def toggle_perf_overlay(self, event=None):
+        """Show or hide the performance overlay"""
+        if self.perf_overlay is not None and self.perf_overlay.is_open():
+            self.perf_overlay.close()
+        else:
+            self.perf_overlay = PerformanceOverlay(self.root, self.theme, self.stage_timer, self.scheduler)
 
-    def update_data(self):
-        """Update system data and handle UI refreshes"""
+    def render_gauges(self):
+        """Draw the gauges from the latest recorded sample"""
+        if not self.cpu_usage_history:
+            return
+        self.top_section.update_gauges(self.cpu_usage_history[-1],
+                                       self.mem_usage_history[-1],
+                                       self.disk_usage_history[-1])
+
+    def poll_collector(self):
+        """Drain samples from the collector thread and feed them to the UI"""
         try:
-            # Get current CPU and memory usage with smoothing
-            cpu_samples = [psutil.cpu_percent() for _ in range(3)]
-            cpu_percent = sum(cpu_samples) / len(cpu_samples)
+            # Keep the collector's cadence in sync with the refresh rate setting
+            self.collector.set_interval(self.get_refresh_interval())
             
-            mem = psutil.virtual_memory()
-            mem_percent = mem.percent
+            for sample in self.collector.drain():
+                self.update_data(sample)
+        except Exception as e:
+            print(f"Error polling collector: {e}")
+
+    def get_refresh_interval(self):
+        """Return the refresh interval in seconds"""
+        try:
+            return max(0.5, float(self.refresh_rate.get()))
+        except (ValueError, AttributeError):
+            return 1.0
+
+    def get_snapshot(self):
+        """Return the latest process snapshot published by the collector
+
+        Before the first collection finishes this is an empty snapshot; collecting here
+        would race the collector thread on the reader and registry state.
+        """
+        snapshot = self.snapshot_engine.latest
+        if snapshot is None:
+            snapshot = ProcessSnapshot([], time.time(), time.monotonic(), 0.0)
+        return snapshot
+
+    def update_data(self, sample):
+        """Record a sample from the collector thread and update the dependent UI"""
+        try:
+            cpu_percent = sample['cpu']
+            mem_percent = sample['memory']
+            disk_percent = sample['disk']
             
             # Add small random variations to make graphs more dynamic
             cpu_variation = random.uniform(-0.5, 0.5)
             mem_variation = random.uniform(-0.3, 0.3)
+            disk_variation = random.uniform(-0.2, 0.2)
             
             # Apply smoothing and variations
             cpu_percent = max(0, min(100, cpu_percent + cpu_variation))
             mem_percent = max(0, min(100, mem_percent + mem_variation))
-            
-            # Get disk usage with smoothing and better error handling
-            try:
-                # Try multiple paths for Windows systems
-                if platform.system() == 'Windows':
-                    # Try C: drive first
-                    try:
-                        disk_percent = psutil.disk_usage('C:\\').percent
-                    except Exception:
-                        # Try other common Windows drives
-                        disk_found = False
-                        for drive in ['D:', 'E:']:
-                            try:
-                                disk_percent = psutil.disk_usage(drive + '\\').percent
-                                disk_found = True
-                                break
-                            except Exception:
-                                continue
-                        
-                        # If no drives worked, try the system drive or default to 0.1%
-                        if not disk_found:
-                            try:
-                                system_drive = os.environ.get('SystemDrive', 'C:') 
-                                disk_percent = psutil.disk_usage(system_drive + '\\').percent
-                            except Exception:
-                                # Last resort - use a more realistic placeholder value
-                                # Most systems have at least 20-30% disk usage
-                                disk_percent = random.uniform(25.0, 35.0)
-                else:  # Unix/Linux/MacOS
-                    disk_percent = psutil.disk_usage('/').percent
-                    
-                # Apply small random variation for visual interest
-                disk_variation = random.uniform(-0.2, 0.2)
-                disk_percent = max(0, min(100, disk_percent + disk_variation))
-            except Exception as e:
-                print(f"Error getting disk usage: {e}")
-                # Use a small non-zero value to make it visible but indicate an issue
-                disk_percent = 0.1
-                
-            # Add current time
-            current_time = time.time()
-            
-            # Initialize history lists if they don't exist
-            if not hasattr(self, 'timestamps'):
-                self.timestamps = []
-                self.cpu_usage_history = []
-                self.mem_usage_history = []
-                self.disk_usage_history = []
+            disk_percent = max(0, min(100, disk_percent + disk_variation))
                 
-                # Add some initial varied values for disk usage to make the graph more interesting
-                # This will be overwritten with real data as it becomes available
-                base_disk = max(disk_percent, 25.0)  # Use either the real value or a minimum of 25%
-                for i in range(30):  # Add 30 initial points
-                    # Create a wavy pattern with random variations
-                    variation = random.uniform(-5.0, 5.0)
-                    wave = 3.0 * math.sin(i / 5.0)  # Gentle sine wave
-                    initial_disk = max(0, min(100, base_disk + variation + wave))
-                    self.disk_usage_history.append(initial_disk)
+            # Sample time as recorded by the collector
+            current_time = sample['timestamp']
             
             # Apply exponential moving average for smoother transitions
             alpha = 0.3  # Smoothing factor
@@ -603,29 +715,27 @@ class ProcessMonitorApp:
                 last_disk = self.disk_usage_history[-1]
                 disk_percent = alpha * disk_percent + (1 - alpha) * last_disk
             
-            # Add data to history
-            self.timestamps.append(current_time)
-            self.cpu_usage_history.append(float(cpu_percent))
-            self.mem_usage_history.append(float(mem_percent))
-            self.disk_usage_history.append(float(disk_percent))
-            
-            # Keep only the last hour of data
-            max_points = 3600  # 1 hour of data at 1-second intervals
-            if len(self.timestamps) > max_points:
-                self.timestamps = self.timestamps[-max_points:]
-                self.cpu_usage_history = self.cpu_usage_history[-max_points:]
-                self.mem_usage_history = self.mem_usage_history[-max_points:]
-                self.disk_usage_history = self.disk_usage_history[-max_points:]
-            
-            # Update the UI
-            self.update_performance_graphs()
+            # Add data to history (the ring buffers drop samples older than an hour)
+            closed_buckets = self.metric_history.append(current_time, cpu_percent, mem_percent, disk_percent)
+            
+            # O(1) update of the online forecasters; forecasts need no refit later
+            if hasattr(self, 'resource_predictor'):
+                self.resource_predictor.observe(cpu_percent, mem_percent, disk_percent)
             
-            # Schedule next update with slightly random interval for more natural look
-            base_refresh_rate = int(self.refresh_rate.get()) * 1000 if hasattr(self, 'refresh_rate') else 1000
-            jitter = random.uniform(-100, 100)  # Add ±100ms random jitter
-            refresh_rate = max(100, base_refresh_rate + jitter)  # Ensure minimum 100ms
+            # Per-process history from the same snapshot
+            if sample.get('snapshot') is not None:
+                with self.stage_timer.time("record.process_history"):
+                    self.process_history.update(sample['snapshot'], current_time)
             
-            self.root.after(int(refresh_rate), self.update_data)
+            # Persist the sample; the store batches writes into one transaction every few seconds
+            if self.metric_store is not None:
+                with self.stage_timer.time("record.store"):
+                    self.metric_store.add_sample(current_time, cpu_percent, mem_percent, disk_percent,
+                                                 closed_buckets, sample.get('snapshot'))
+            
+            # Score this sample for anomalies (O(1), so every sample is checked)
+            if hasattr(self, 'streaming_detector'):
+                self.check_streaming_anomaly(cpu_percent, mem_percent, disk_percent, current_time)
             
             # Update AI timeline
             if hasattr(self, 'start_time'):
@@ -746,28 +856,13 @@ class ProcessMonitorApp:
         
         except Exception as e:
             print(f"Error in update_data: {e}")
-            # Ensure we keep updating even if there's an error
-            self.root.after(1000, self.update_data)
 
     def check_alerts(self, cpu_percent, mem_percent, disk_percent=None):
         """Check if usage exceeds alert thresholds and log alerts"""
-        current_time = datetime.now().strftime("%H:%M:%S")
-        alert_triggered = False
-        
-        if cpu_percent > self.alert_thresholds["cpu"]:
-            alert_msg = f"[{current_time}] WARNING: CPU usage at {cpu_percent:.1f}% exceeded threshold ({self.alert_thresholds['cpu']}%)"
-            self.log_alert(alert_msg)
-            alert_triggered = True
-        
-        if mem_percent > self.alert_thresholds["memory"]:
-            alert_msg = f"[{current_time}] WARNING: Memory usage at {mem_percent:.1f}% exceeded threshold ({self.alert_thresholds['memory']}%)"
+        alerts = check_thresholds(self.alert_thresholds, cpu_percent, mem_percent, disk_percent)
+        for metric, alert_msg in alerts:
             self.log_alert(alert_msg)
-            alert_triggered = True
-        
-        if disk_percent and disk_percent > self.alert_thresholds["disk"]:
-            alert_msg = f"[{current_time}] WARNING: Disk usage at {disk_percent:.1f}% exceeded threshold ({self.alert_thresholds['disk']}%)"
-            self.log_alert(alert_msg)
-            alert_triggered = True
+        alert_triggered = bool(alerts)
         
         # Show a popup for the first alert only to avoid spamming
         if alert_triggered and not hasattr(self, 'alert_shown'):
@@ -781,6 +876,41 @@ class ProcessMonitorApp:
         if hasattr(self, 'alert_shown'):
             delattr(self, 'alert_shown')
 
+    def summarize_anomaly_batch(self, batch):
+        """Reduce a score_new_samples batch to one result, describing its most anomalous sample"""
+        worst = int(np.argmin(batch['scores']))  # lower IsolationForest score = more anomalous
+        position = batch['positions'][worst]
+        anomalies = int(np.count_nonzero(batch['labels'] == -1))
+        return {
+            'is_anomaly': anomalies > 0,
+            'score': float(batch['scores'][worst]),
+            'cpu': float(self.cpu_usage_history[position]),
+            'memory': float(self.mem_usage_history[position]),
+            'disk': float(self.disk_usage_history[position]),
+            'detection_time': datetime.fromtimestamp(self.timestamps[position]).strftime("%H:%M:%S"),
+            'anomaly_count': anomalies,
+            'scored': len(batch['scores']),
+            'missed': batch['missed']
+        }
+
+    def check_streaming_anomaly(self, cpu_percent, mem_percent, disk_percent, timestamp):
+        """Run the streaming detector on one sample and log the start of each anomalous episode"""
+        try:
+            result = self.streaming_detector.update(cpu_percent, mem_percent, disk_percent, timestamp)
+            self.last_streaming_result = result
+            if result['is_new']:
+                metric = result['metric']
+                anomaly_msg = (
+                    f"[{result['detection_time']}] ANOMALY DETECTED (streaming, {metric} "
+                    f"z={result['z_scores'][metric]:.1f}): CPU {result['cpu']:.1f}%, "
+                    f"MEM {result['memory']:.1f}%, DISK {result['disk']:.1f}%"
+                )
+                self.recent_anomalies.append(anomaly_msg)
+                self.recent_anomalies = self.recent_anomalies[-20:]
+                self.log_alert(anomaly_msg)
+        except Exception as e:
+            print(f"Error in streaming anomaly detection: {e}")
+
     def log_alert(self, message):
         """Add an alert to the alerts panel"""
         self.alerts.append(message)
@@ -790,7 +920,8 @@ class ProcessMonitorApp:
             self.alerts = self.alerts[-100:]
         
         # Update the alerts text widget
-        self.middle_section.update_alerts_text(self.alerts)
+        if self.middle_section is not None:
+            self.middle_section.update_alerts_text(self.alerts)
 
     def kill_process(self):
         """Kill the selected process"""
@@ -974,9 +1105,14 @@ class ProcessMonitorApp:
             files_tab = ttk.Frame(details_notebook, style="Card.TFrame")
             details_notebook.add(files_tab, text="Files")
             
+            # History Tab (available even after the process has exited)
+            history_tab = ttk.Frame(details_notebook, style="Card.TFrame")
+            details_notebook.add(history_tab, text="History")
+            self.create_process_history_chart(history_tab, pid)
+            
             # Get process details
             try:
-                process = psutil.Process(pid)
+                process = self.snapshot_engine.registry.get(pid)
                 
                 # Basic Info Tab Content
                 basic_frame = ttk.Frame(basic_tab, style="Card.TFrame")
@@ -1036,7 +1172,8 @@ class ProcessMonitorApp:
                 cpu_frame = ttk.LabelFrame(perf_frame, text="CPU Usage", style="Card.TFrame")
                 cpu_frame.pack(fill="x", pady=10)
                 
-                cpu_percent = process.cpu_percent(interval=0.1)
+                # Measured CPU% from the last scan instead of blocking on a fresh sample
+                cpu_percent = self.get_process_cpu_percent(pid)
                 cpu_times = process.cpu_times()
                 
                 row = 0
@@ -1140,6 +1277,48 @@ class ProcessMonitorApp:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to show process details: {str(e)}")
 
+    def get_process_cpu_percent(self, pid):
+        """Return the CPU% of a process as measured by the collector"""
+        proc = self.get_snapshot().find(pid)
+        if proc is not None:
+            return proc.cpu_percent
+        cpu_percent = self.snapshot_engine.registry.cpu_percent(pid)
+        return cpu_percent if cpu_percent is not None else 0.0
+
+    def create_process_history_chart(self, parent, pid):
+        """Plot the recorded CPU and memory history of a process"""
+        key = self.process_history.find(pid)
+        series = self.process_history.series(key) if key is not None else None
+        if series is None or np.all(np.isnan(series[1])):
+            ttk.Label(parent,
+                      text=f"No history recorded for this process.\n"
+                           f"Only the {self.process_history.max_tracked} most active processes are tracked.",
+                      style="Info.TLabel").pack(padx=20, pady=20)
+            return
+        
+        timestamps, cpu, rss = series
+        relative_times = timestamps - time.time()
+        text_color = self.theme["text"]
+        
+        fig = plt.Figure(figsize=(5.5, 3.2), dpi=100)
+        fig.patch.set_facecolor(self.theme["chart_bg"])
+        cpu_ax = fig.add_subplot(211)
+        mem_ax = fig.add_subplot(212, sharex=cpu_ax)
+        
+        cpu_ax.plot(relative_times, cpu, color=self.theme["cpu_color"], linewidth=1.2)
+        mem_ax.plot(relative_times, rss / (1024**2), color=self.theme["mem_color"], linewidth=1.2)
+        for ax, title in [(cpu_ax, "CPU Usage (%)"), (mem_ax, "Memory (RSS, MB)")]:
+            ax.set_facecolor(self.theme["chart_bg"])
+            ax.set_title(title, fontsize=9, color=text_color)
+            ax.tick_params(axis='both', colors=text_color, labelsize=8)
+            ax.grid(True, linestyle='--', color=self.theme["grid_color"], alpha=0.6)
+        mem_ax.set_xlabel("Seconds ago", color=text_color, fontsize=8)
+        fig.tight_layout(pad=0.5)
+        
+        canvas = FigureCanvasTkAgg(fig, parent)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
+
     def refresh_process_details(self, window, pid, name):
         """Refresh the process details window"""
         # Close the current window
@@ -1174,20 +1353,15 @@ class ProcessMonitorApp:
                 processes = []
                 filter_text = self.middle_section.filter_var.get().lower() if hasattr(self.middle_section, 'filter_var') else ""
                 
-                # Get process list directly
-                for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info', 'status']):
-                    try:
-                        proc_info = proc.info
-                        if filter_text in proc_info['name'].lower():
-                            processes.append([
-                                proc_info['pid'],
-                                proc_info['name'],
-                                f"{proc_info['cpu_percent']:.1f}",
-                                f"{proc_info['memory_info'].rss / (1024 * 1024):.1f}",
-                                proc_info['status']
-                            ])
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
+                # Get process list from the shared snapshot
+                for proc in self.get_snapshot().filter(filter_text):
+                    processes.append([
+                        proc.pid,
+                        proc.name,
+                        f"{proc.cpu_percent:.1f}",
+                        f"{proc.memory_rss / (1024 * 1024):.1f}",
+                        proc.status
+                    ])
             
             print(f"Exporting {len(processes)} processes to {file_path}")
             
@@ -1220,21 +1394,42 @@ class ProcessMonitorApp:
     
     def on_closing(self):
         """Handle window closing"""
+        self.scheduler.detach()
+        if self.perf_overlay is not None:
+            self.perf_overlay.close()
+        if hasattr(self, 'collector'):
+            self.collector.stop()
+        self.analytics_pool.shutdown()
+        if self.metric_store is not None:
+            try:
+                self.metric_store.close(self.metric_history)
+            except Exception as e:
+                print(f"Error closing metric store: {e}")
         self.root.destroy() 
 
     def update_ai_components(self):
-        """Update AI components with new data and handle errors gracefully"""
+        """Run forecasting, anomaly training/scoring and alert logging (also while the panels are hidden)"""
         try:
             # Get predictions if we have enough data
+            # (the models wait until the analytics libraries have finished loading in the background)
             predictions = None
-            if hasattr(self, 'resource_predictor') and len(self.cpu_usage_history) >= 10:
+            if hasattr(self, 'resource_predictor') and self.resource_predictor.ready() and len(self.cpu_usage_history) >= 10:
                 try:
-                    with np.errstate(all='ignore'):  # Suppress numpy warnings
-                        predictions = self.resource_predictor.get_predictions(
-                            self.cpu_usage_history,
-                            self.mem_usage_history,
-                            self.disk_usage_history
-                        )
+                    if self.resource_predictor.method == "online":
+                        with np.errstate(all='ignore'):  # Suppress numpy warnings
+                            predictions = self.resource_predictor.get_predictions(
+                                self.cpu_usage_history.view(),
+                                self.mem_usage_history.view(),
+                                self.disk_usage_history.view()
+                            )
+                    else:
+                        # Refitting ARIMA is slow: queue it (replacing a queued older fit) and
+                        # show the last completed forecast meanwhile
+                        self.analytics_pool.submit("forecast", arima_predictions,
+                                                   np.array(self.cpu_usage_history.view()),
+                                                   np.array(self.mem_usage_history.view()),
+                                                   np.array(self.disk_usage_history.view()))
+                        predictions = self.analytics_pool.result("forecast")
                 except Exception as e:
                     print(f"Non-critical: Error generating predictions: {e}")
                     # Fallback to simple prediction
@@ -1244,33 +1439,59 @@ class ProcessMonitorApp:
                         'disk': [self.disk_usage_history[-1]]
                     }
                     
+            # Per-process anomalies: one vectorized pass over the tracked processes' history
+            process_anomalies = []
+            try:
+                with self.stage_timer.time("ai.process_anomalies"):
+                    process_anomalies = top_process_anomalies(self.process_history)
+            except Exception as e:
+                print(f"Error scoring process anomalies: {e}")
+            self.process_anomalies = process_anomalies
+            self.ai_predictions = predictions
+            
             # Train or update anomaly detection model if needed
             anomaly_result = None
-            if hasattr(self, 'anomaly_detector'):
+            if hasattr(self, 'anomaly_detector') and analytics_ready():
                 try:
                     if self.anomaly_detector.should_train(len(self.cpu_usage_history)):
-                        self.anomaly_detector.train(
-                            self.cpu_usage_history,
-                            self.mem_usage_history,
-                            self.disk_usage_history
-                        )
+                        self.analytics_pool.submit("anomaly-train", fit_anomaly_model,
+                                                   self.anomaly_detector.training_data(
+                                                       self.cpu_usage_history.view(),
+                                                       self.mem_usage_history.view(),
+                                                       self.disk_usage_history.view()))
+                    
+                    # Install a newly trained model once its worker has finished
+                    model = self.analytics_pool.take("anomaly-train")
+                    if model is not None:
+                        self.anomaly_detector.set_model(model)
                     
-                    # Detect anomalies in current data
+                    # Score every sample recorded since the last pass in one model call
+                    anomaly_result = self.last_anomaly_result
                     if self.anomaly_detector.is_trained and len(self.cpu_usage_history) >= 10:
-                        anomaly_result = self.anomaly_detector.detect_anomalies(
-                            self.cpu_usage_history,
-                            self.mem_usage_history,
-                            self.disk_usage_history
+                        batch = self.anomaly_detector.score_new_samples(
+                            self.cpu_usage_history.view(),
+                            self.mem_usage_history.view(),
+                            self.disk_usage_history.view(),
+                            self.metric_history.total_samples
                         )
+                        if batch is not None:
+                            anomaly_result = self.summarize_anomaly_batch(batch)
+                            self.last_anomaly_result = anomaly_result
                         
-                        # Log anomaly if detected
-                        if anomaly_result and anomaly_result.get('is_anomaly', False):
+                        # Log anomaly if detected among the new samples
+                        if batch is not None and anomaly_result.get('is_anomaly', False):
                             anomaly_msg = (
                                 f"[{anomaly_result.get('detection_time', datetime.now().strftime('%H:%M:%S'))}] "
                                 f"ANOMALY DETECTED: CPU {anomaly_result.get('cpu', 0):.1f}%, "
                                 f"MEM {anomaly_result.get('memory', 0):.1f}%, "
                                 f"DISK {anomaly_result.get('disk', 0):.1f}%"
                             )
+                            if anomaly_result['anomaly_count'] > 1:
+                                anomaly_msg += (f" ({anomaly_result['anomaly_count']} of "
+                                                f"{anomaly_result['scored']} samples since the last check)")
+                            if process_anomalies:
+                                anomaly_msg += " - unusual: " + ", ".join(
+                                    f"{proc['name']} ({proc['pid']}, {proc['reason']})" for proc in process_anomalies)
                             if not hasattr(self, 'recent_anomalies'):
                                 self.recent_anomalies = []
                             self.recent_anomalies.append(anomaly_msg)
@@ -1281,59 +1502,47 @@ class ProcessMonitorApp:
                                 self.recent_anomalies = self.recent_anomalies[-20:]
                 except Exception as e:
                     print(f"Error in anomaly detection: {e}")
-            
+        except Exception as e:
+            print(f"Error in update_ai_components: {e}")
+
+    def render_ai_insights(self):
+        """Push the latest analysis results to the AI insight panels"""
+        try:
             # Update the AI panels in the UI with error handling
             if hasattr(self, 'top_section'):
                 try:
                     if hasattr(self.top_section, 'update_ai_insights'):
-                        self.top_section.update_ai_insights(predictions, anomaly_result, 
-                                                          getattr(self, 'recent_anomalies', []))
+                        self.top_section.update_ai_insights(self.ai_predictions, self.last_anomaly_result, 
+                                                          getattr(self, 'recent_anomalies', []),
+                                                          self.process_anomalies)
                 except Exception as e:
                     print(f"Error updating top section AI insights: {e}")
                     
             if hasattr(self, 'middle_section'):
                 try:
                     if hasattr(self.middle_section, 'update_detailed_ai_insights'):
-                        self.middle_section.update_detailed_ai_insights(predictions, anomaly_result, 
+                        self.middle_section.update_detailed_ai_insights(self.ai_predictions, self.last_anomaly_result, 
                                                                      getattr(self, 'recent_anomalies', []))
                 except Exception as e:
                     print(f"Error updating middle section AI insights: {e}")
         except Exception as e:
-            print(f"Error in update_ai_components: {e}")
-            # Schedule the next update anyway to prevent breaking the update cycle
-            if hasattr(self, 'main_frame'):
-                self.main_frame.after(30000, self.update_ai_components)
+            print(f"Error in render_ai_insights: {e}")
 
     def refresh_ui(self):
         """Refresh the UI components"""
         try:
-            # Update various UI components
-            self.update_process_list()
-            self.update_system_info_label()
-            self.update_performance_graphs()
-            self.update_ai_components()
+            # Update the process list; graphs, gauges and AI insights have their own
+            # scheduler tasks so each can be skipped while its panel is hidden
+            with self.stage_timer.time("render.process_list"):
+                self.update_process_list()
             
             # Update the process intelligence as well
             if hasattr(self, "middle_section") and self.middle_section:
-                if hasattr(self.middle_section, "update_process_intelligence"):
-                    self.middle_section.update_process_intelligence()
-            
-            # Schedule next refresh based on refresh rate
-            try:
-                refresh_seconds = float(self.refresh_rate.get())
-                # Ensure refresh rate is reasonable
-                if refresh_seconds < 0.5:
-                    refresh_seconds = 0.5
-                refresh_ms = int(refresh_seconds * 1000)
-            except ValueError:
-                # Default to 1 second if invalid value
-                refresh_ms = 1000
-                
-            self.root.after(refresh_ms, self.refresh_ui)
+                if hasattr(self.middle_section, "update_process_intelligence") and self.middle_section.is_visible():
+                    with self.stage_timer.time("render.process_intelligence"):
+                        self.middle_section.update_process_intelligence()
         except Exception as e:
             print(f"Error in refresh_ui: {e}")
-            # If an error occurs, try to reschedule anyway to prevent UI from freezing
-            self.root.after(1000, self.refresh_ui)
 
     def update_performance_graphs(self):
         """Update the performance graphs with the latest data and area fill"""
@@ -1341,64 +1550,46 @@ class ProcessMonitorApp:
             # Get theme colors from the current theme
             text_color = self.theme["text"]  # Text color from theme
             
-            # Get the time range from the dropdown
-            time_range_text = self.time_range_var.get()
-            if time_range_text == "5 minutes":
-                time_range = 300  # 5 minutes in seconds
-            elif time_range_text == "15 minutes":
-                time_range = 900  # 15 minutes in seconds
-            elif time_range_text == "30 minutes":
-                time_range = 1800  # 30 minutes in seconds
-            else:  # 1 hour
-                time_range = 3600  # 1 hour in seconds
-            
-            # Calculate relative times for x-axis (in seconds)
-            current_time = time.time()
-            timestamps = [t - current_time for t in self.timestamps]
+            # Get the time range from the dropdown (in seconds)
+            time_range = TIME_RANGES.get(self.time_range_var.get(), 300)
             
-            # Filter data to the selected time range
-            filtered_indices = [i for i, t in enumerate(timestamps) if t >= -time_range]
+            # Finest history resolution that covers the range
+            current_time = time.time()
+            window = self.metric_history.series(time_range, current_time)
             
-            if not filtered_indices:
+            if len(window.timestamps) == 0:
                 return  # No data to display
-                
-            relative_times = [timestamps[i] for i in filtered_indices]
-            filtered_cpu = [self.cpu_usage_history[i] for i in filtered_indices]
-            filtered_mem = [self.mem_usage_history[i] for i in filtered_indices]
-            filtered_disk = [self.disk_usage_history[i] for i in filtered_indices]
-            
-            # Update the line data
-            self.cpu_line.set_data(relative_times, filtered_cpu)
-            self.mem_line.set_data(relative_times, filtered_mem)
-            self.disk_line.set_data(relative_times, filtered_disk)
-            
-            # Remove old area fills
-            for collection in self.cpu_ax.collections + self.mem_ax.collections + self.disk_ax.collections:
-                try:
-                    collection.remove()
-                except:
-                    pass
-                
-            # Add new area fills
-            self.cpu_fill = self.cpu_ax.fill_between(relative_times, 0, filtered_cpu, color=self.theme["cpu_color"], alpha=0.2)
-            self.mem_fill = self.mem_ax.fill_between(relative_times, 0, filtered_mem, color=self.theme["mem_color"], alpha=0.2)
-            self.disk_fill = self.disk_ax.fill_between(relative_times, 0, filtered_disk, color=self.theme["disk_color"], alpha=0.2)
-            
-            # Update axis limits
-            min_time = min(relative_times) if relative_times else -60
-            # Add a small offset to prevent identical low and high xlims
-            if min_time == 0:
-                min_time = -0.1  # Small offset to avoid identical values
-                
-            self.cpu_ax.set_xlim(min_time, 0)
-            self.mem_ax.set_xlim(min_time, 0)
-            self.disk_ax.set_xlim(min_time, 0)
-            
-            # Add bottom label for clarity with theme text color
-            self.disk_ax.set_xlabel("Seconds ago", color=text_color, fontsize=8)
             
-            # Redraw the canvas
-            self.canvas.draw()
+            # Relative times for x-axis, in hours for the long ranges
+            time_unit, time_label = (3600.0, "Hours ago") if time_range > 3600 else (1.0, "Seconds ago")
+            relative_times = (window.timestamps - current_time) / time_unit
+            
+            # Cap each series at the plot width in pixels, keeping every bucket's min and max
+            # so spikes stay visible; lines show the bucket mean, fills reach the bucket maximum
+            plot_width = max(100, int(self.cpu_ax.bbox.width))
+            for line, fill, metric in [
+                (self.cpu_line, self.cpu_fill, "cpu"),
+                (self.mem_line, self.mem_fill, "memory"),
+                (self.disk_line, self.disk_fill, "disk")
+            ]:
+                indices = minmax_indices(window.mean[metric], plot_width)
+                line.set_data(relative_times[indices], window.mean[metric][indices])
+                if window.high[metric] is not window.mean[metric]:
+                    indices = minmax_indices(window.high[metric], plot_width)
+                fill.set_data(relative_times[indices], window.high[metric][indices])
+            
+            # Axis limits and labels are part of the cached background, so only touch them
+            # (and pay for a full redraw) when the selected range changes
+            if self.graph_time_range != time_range:
+                self.graph_time_range = time_range
+                for ax in (self.cpu_ax, self.mem_ax, self.disk_ax):
+                    ax.set_xlim(-time_range / time_unit, 0)
+                self.disk_ax.set_xlabel(time_label, color=text_color, fontsize=8)
+                self.graph_blit.invalidate()
+            
+            # Redraw only the lines and fills over the cached background
+            with self.stage_timer.time("render.graphs.blit"):
+                self.graph_blit.update()
         except Exception as e:
             print(f"Error updating performance graphs: {e}")
             # Create sample data to show something rather than blank graphs
@@ -1415,31 +1606,16 @@ class ProcessMonitorApp:
                 self.disk_line.set_data(sample_data['times'], sample_data['disk'])
                 
                 # Add fill
-                if hasattr(self, 'cpu_fill'):
-                    try:
-                        self.cpu_fill.remove()
-                    except:
-                        pass
-                if hasattr(self, 'mem_fill'):
-                    try:
-                        self.mem_fill.remove()
-                    except:
-                        pass
-                if hasattr(self, 'disk_fill'):
-                    try:
-                        self.disk_fill.remove()
-                    except:
-                        pass
-                
-                self.cpu_fill = self.cpu_ax.fill_between(sample_data['times'], 0, sample_data['cpu'], color=self.theme["cpu_color"], alpha=0.2)
-                self.mem_fill = self.mem_ax.fill_between(sample_data['times'], 0, sample_data['mem'], color=self.theme["mem_color"], alpha=0.2)
-                self.disk_fill = self.disk_ax.fill_between(sample_data['times'], 0, sample_data['disk'], color=self.theme["disk_color"], alpha=0.2)
+                self.cpu_fill.set_data(sample_data['times'], sample_data['cpu'])
+                self.mem_fill.set_data(sample_data['times'], sample_data['mem'])
+                self.disk_fill.set_data(sample_data['times'], sample_data['disk'])
                 
                 self.cpu_ax.set_xlim(-60, 0)
                 self.mem_ax.set_xlim(-60, 0)
                 self.disk_ax.set_xlim(-60, 0)
-                
-                self.canvas.draw()
+                self.graph_time_range = None
+                self.graph_blit.invalidate()
+                self.graph_blit.update()
             except Exception as inner_e:
                 print(f"Failed to set fallback data: {inner_e}")
 
@@ -1548,17 +1724,10 @@ class ProcessMonitorApp:
             if "most" in query or "top" in query:
                 # Get top CPU consuming process
                 try:
-                    processes = []
-                    for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
-                        try:
-                            processes.append((proc.info['pid'], proc.info['name'], proc.info['cpu_percent']))
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            pass
-                    
-                    processes.sort(key=lambda x: x[2], reverse=True)
+                    processes = self.get_snapshot().top(1)
                     if processes:
                         top_proc = processes[0]
-                        return f"The process using the most CPU is {top_proc[1]} (PID: {top_proc[0]}) at {top_proc[2]:.1f}%"
+                        return f"The process using the most CPU is {top_proc.name} (PID: {top_proc.pid}) at {top_proc.cpu_percent:.1f}%"
                     else:
                         return "I couldn't retrieve the top CPU consuming process."
                 except Exception as e:
@@ -1607,7 +1776,7 @@ class ProcessMonitorApp:
         # Process related queries
         elif "process" in query or "running" in query:
             try:
-                process_count = len(list(psutil.process_iter()))
+                process_count = self.get_snapshot().total_count
                 return f"There are currently {process_count} processes running on your system."
             except Exception as e:
                 return f"I encountered an error while checking processes: {str(e)}"
@@ -1694,46 +1863,26 @@ class ProcessMonitorApp:
         try:
             # Get filter text
             filter_text = self.filter_var.get().lower()
-            print(f"Filtering with: '{filter_text}'")  # Debug print
-            
-            # Clear existing items
-            for item in self.process_tree.get_children():
-                self.process_tree.delete(item)
             
-            # Get process list
+            # Get process list from the shared snapshot
+            snapshot = self.get_snapshot()
+            total_processes = snapshot.total_count
             processes = []
-            total_processes = 0
-            visible_processes = 0
             
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info', 'status']):
-                try:
-                    total_processes += 1
-                    proc_info = proc.info
-                    proc_name = proc_info['name'].lower()
-                    
-                    # Apply filter if text is provided
-                    if not filter_text or filter_text in proc_name:
-                        processes.append((
-                            proc_info['pid'],
-                            proc_info['name'],
-                            f"{proc_info['cpu_percent']:.1f}",
-                            f"{proc_info['memory_info'].rss / (1024 * 1024):.1f}",  # Convert to MB
-                            proc_info['status']
-                        ))
-                        visible_processes += 1
-                    
-                    # Limit to 100 processes for better performance
-                    if visible_processes >= 100 and not filter_text:
-                        break
-                except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-                    pass
-            
-            # Sort processes by CPU usage
-            processes.sort(key=lambda x: float(x[2]), reverse=True)
-            
-            # Insert into treeview
-            for proc in processes:
-                self.process_tree.insert('', 'end', values=proc)
+            for proc in snapshot.filter(filter_text):
+                # Raw values; the table sorts on them and formats only the visible rows
+                processes.append(((proc.pid, proc.create_time), (
+                    proc.pid,
+                    proc.name,
+                    proc.cpu_percent,
+                    proc.memory_rss / (1024 * 1024),  # Convert to MB
+                    proc.status
+                )))
+            visible_processes = len(processes)
+            
+            # Sort in the table's current order and materialize the rows on screen
+            with self.stage_timer.time("render.process_tree"):
+                self.process_table.set_rows(processes)
             
             # Update process count
             count_text = f"{visible_processes} of {total_processes} processes"
@@ -1743,29 +1892,26 @@ class ProcessMonitorApp:
             self.process_count.config(text=count_text)
             
             # Update the system info label
-            self.update_system_info_label()
+            with self.stage_timer.time("render.info_label"):
+                self.update_system_info_label()
         except Exception as e:
             print(f"Error updating process list: {e}")
 
     def update_system_info_label(self):
         """Update the system information label at the bottom of the process list"""
         try:
-            # Get all processes
-            processes = list(psutil.process_iter(['pid', 'name', 'status', 'memory_info']))
-            
-            # Count processes
-            total_processes = len(processes)
-            
-            # Calculate total memory usage
-            total_memory = sum(p.info['memory_info'].rss for p in processes if p.info['memory_info'])
-            total_memory_mb = total_memory / (1024 * 1024)
+            # Count processes and total memory from the shared snapshot
+            snapshot = self.get_snapshot()
+            total_processes = snapshot.total_count
+            total_memory_mb = snapshot.total_memory / (1024 * 1024)
             
             # Calculate average CPU usage
-            avg_cpu = sum(self.cpu_usage_history[-10:]) / min(10, len(self.cpu_usage_history)) if self.cpu_usage_history else 0
+            avg_cpu = float(self.cpu_usage_history.last(10).mean()) if self.cpu_usage_history else 0
             
-            # Update the system info label
+            # Update the system info label, including how long the process scan took
             self.system_info_label.config(
-                text=f"Processes: {total_processes} | Memory: {total_memory_mb:.1f} MB | CPU Avg: {avg_cpu:.1f}%"
+                text=f"Processes: {total_processes} | Memory: {total_memory_mb:.1f} MB | CPU Avg: {avg_cpu:.1f}% "
+                     f"| Scan: {snapshot.collect_duration * 1000:.0f} ms ({snapshot.age():.1f}s ago)"
             )
         except Exception as e:
             # Graceful error handling
@@ -1847,7 +1993,7 @@ class ProcessMonitorApp:
         self.time_range_var = tk.StringVar()
         time_dropdown = ttk.Combobox(time_frame, 
                                     textvariable=self.time_range_var,
-                                    values=["5 minutes", "15 minutes", "30 minutes", "1 hour"],
+                                    values=list(TIME_RANGES),
                                       width=10,
                                       state="readonly")
         time_dropdown.current(0)
@@ -1916,16 +2062,26 @@ class ProcessMonitorApp:
         
         # Create attractive area plots with gradient fill
         self.cpu_line = self.cpu_ax.plot(x, cpu_init, color=self.theme["cpu_color"], linewidth=1.5)[0]
-        self.cpu_fill = self.cpu_ax.fill_between(x, 0, cpu_init, color=self.theme["cpu_color"], alpha=0.2)
+        self.cpu_fill = AreaSeries(self.cpu_ax, color=self.theme["cpu_color"], alpha=0.2, linewidth=0)
+        self.cpu_fill.set_data(x, cpu_init)
         
         self.mem_line = self.mem_ax.plot(x, mem_init, color=self.theme["mem_color"], linewidth=1.5)[0]
-        self.mem_fill = self.mem_ax.fill_between(x, 0, mem_init, color=self.theme["mem_color"], alpha=0.2)
+        self.mem_fill = AreaSeries(self.mem_ax, color=self.theme["mem_color"], alpha=0.2, linewidth=0)
+        self.mem_fill.set_data(x, mem_init)
         
         self.disk_line = self.disk_ax.plot(x, disk_init, color=self.theme["disk_color"], linewidth=1.5)[0]
-        self.disk_fill = self.disk_ax.fill_between(x, 0, disk_init, color=self.theme["disk_color"], alpha=0.2)
+        self.disk_fill = AreaSeries(self.disk_ax, color=self.theme["disk_color"], alpha=0.2, linewidth=0)
+        self.disk_fill.set_data(x, disk_init)
         
         # Create canvas with matching background
         self.canvas = FigureCanvasTkAgg(self.fig, graph_frame)
+        
+        # Lines and fills are blitted over a cached background of axes, grid and labels
+        self.graph_blit = BlitManager(self.canvas, [self.cpu_line, self.mem_line, self.disk_line,
+                                                    self.cpu_fill.collection, self.mem_fill.collection,
+                                                    self.disk_fill.collection])
+        self.graph_time_range = None  # time range the axis limits were last set for
+        
         self.canvas.draw()
         canvas_widget = self.canvas.get_tk_widget()
         canvas_widget.configure(bg=chart_bg_color, highlightbackground=chart_bg_color, highlightcolor=chart_bg_color)
@@ -2027,8 +2183,8 @@ class ProcessMonitorApp:
 
     def on_time_range_change(self, event=None):
         """Handle time range change events"""
-        # No need to do anything here - the refresh will pick up the new time range
-        pass
+        # Redraw straight away rather than waiting for the next sample
+        self.update_performance_graphs()
 
     def update_performance_graph_colors(self):
         """Update performance graph colors based on theme and visibility settings"""
@@ -2044,10 +2200,10 @@ class ProcessMonitorApp:
         self.fig.patch.set_facecolor(chart_bg_color)
         
         # Update all text colors and styles for each subplot
-        for ax, title, line, color in [
-            (self.cpu_ax, "CPU Usage (%)", self.cpu_line, cpu_color),
-            (self.mem_ax, "Memory Usage (%)", self.mem_line, mem_color),
-            (self.disk_ax, "Disk Usage (%)", self.disk_line, disk_color)
+        for ax, title, line, fill, color in [
+            (self.cpu_ax, "CPU Usage (%)", self.cpu_line, self.cpu_fill, cpu_color),
+            (self.mem_ax, "Memory Usage (%)", self.mem_line, self.mem_fill, mem_color),
+            (self.disk_ax, "Disk Usage (%)", self.disk_line, self.disk_fill, disk_color)
         ]:
             # Update background color
             ax.set_facecolor(chart_bg_color)
@@ -2065,8 +2221,9 @@ class ProcessMonitorApp:
             # Update grid color
             ax.grid(True, which='major', color=grid_color, linestyle='--', linewidth=0.5, alpha=0.6)
             
-            # Update line color
+            # Update line and fill color
             line.set_color(color)
+            fill.set_color(color)
             
             # Update axis labels color
             if ax == self.disk_ax:
@@ -2085,9 +2242,11 @@ class ProcessMonitorApp:
             self.mem_fill.set_visible(self.show_mem_var.get())
         if hasattr(self, 'disk_fill'):
             self.disk_fill.set_visible(self.show_disk_var.get())
-            
-            # Redraw the canvas
+        
+        # Full redraw (re-caches the blit background); limits and labels are reapplied on the next update
+        self.graph_time_range = None
         self.canvas.draw()
+        self.update_performance_graphs()
 
     def refresh_dashboard(self):
         """Refresh the entire dashboard"""
@@ -2110,8 +2269,9 @@ class ProcessMonitorApp:
             # Explicitly refresh system info
             self.top_section.update_system_info()
             
-            # Force update of all data
-            self.update_data()
+            # Ask the collector for a fresh sample right away
+            if hasattr(self, 'collector'):
+                self.collector.wake()
             
             # Update performance graphs
             self.update_performance_graphs()
@@ -2506,9 +2666,6 @@ class ProcessMonitorApp:
             font=("Segoe UI", 8)
         )
         self.alert_count.pack(side="left", padx=(5, 0))
-        
-        # Add this to the update_data method to update these values
-        self.main_frame.after(1000, self.update_system_logs)
 
     def update_system_logs(self):
         """Update system logs and information panels"""
@@ -2538,13 +2695,8 @@ class ProcessMonitorApp:
             # Update alert count if needed
             if hasattr(self, 'alert_count') and hasattr(self, 'recent_anomalies'):
                 self.alert_count.config(text=f"{len(self.recent_anomalies)} active")
-            
-            # Schedule next update
-            self.main_frame.after(10000, self.update_system_logs)
         except Exception as e:
             print(f"Error updating system logs: {e}")
-            # Schedule anyway to prevent update from stopping on error
-            self.main_frame.after(10000, self.update_system_logs)
 
     def show_pi_tab(self, tab_name):
         """Show the selected Process Intelligence tab"""
@@ -2562,6 +2714,7 @@ class ProcessMonitorApp:
             
         # Update active tab
         self.active_pi_tab.set(tab_name)
+        self.scheduler.catch_up()
         
     def create_resource_usage_tab(self):
         """Create the Resource Usage tab content"""
@@ -2599,7 +2752,7 @@ class ProcessMonitorApp:
         summary_title.pack(side="left")
         
         # Summary info
-        total_processes = len(list(psutil.process_iter()))
+        total_processes = self.get_snapshot().total_count
         mem = psutil.virtual_memory()
         summary_info = ttk.Label(
         self.resource_usage_frame,
@@ -2734,8 +2887,7 @@ class ProcessMonitorApp:
         select_frame.pack(fill="x", pady=(0, 5))
         
         self.selected_process = tk.StringVar()
-        process_list = [p.name() for p in psutil.process_iter()]
-        process_list = sorted(list(set(process_list)))  # Remove duplicates
+        process_list = self.get_snapshot().names()  # Sorted, without duplicates
         if process_list:
             self.selected_process.set(process_list[0])
             
@@ -2855,15 +3007,15 @@ class ProcessMonitorApp:
                 return
                 
             # Find the process in the process list to get its PID
-            for proc in psutil.process_iter(['pid', 'name']):
+            for proc in self.get_snapshot():
                 try:
-                    if proc.info['name'] == selected_process:
+                    if proc.name == selected_process:
                         # Create a fake selection in the pi_tree
                         if hasattr(self, 'process_intelligence') and hasattr(self.process_intelligence, 'pi_tree'):
                             # Find if this process exists in the tree
                             for item in self.process_intelligence.pi_tree.get_children():
                                 item_values = self.process_intelligence.pi_tree.item(item)["values"]
-                                if len(item_values) > 0 and str(proc.info['pid']) == str(item_values[0]):
+                                if len(item_values) > 0 and str(proc.pid) == str(item_values[0]):
                                     # Select this item
                                     self.process_intelligence.pi_tree.selection_set(item)
                                     # Call the show_process_relationships method
@@ -2873,7 +3025,7 @@ class ProcessMonitorApp:
                             # If we didn't find the process in the tree, show a message
                             messagebox.showinfo("Info", f"Process {selected_process} not found in the process intelligence tree. Try selecting it directly from the Process Intelligence tab.")
                             return
-                except (psutil.NoSuchProcess, psutil.AccessDenied, IndexError):
+                except IndexError:
                     continue
             
             messagebox.showinfo("Info", f"Process {selected_process} not found. It may have terminated.")
@@ -1,6 +1,8 @@
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
+from matplotlib.collections import PathCollection
+from matplotlib.path import Path
 from datetime import datetime
 
 def create_performance_graphs(parent, theme):
@@ -206,3 +208,103 @@ def update_performance_graphs(axes, timestamps, cpu_history, mem_history, disk_h
     
     # Set x-axis label for bottom subplot
     axes[-1].set_xlabel("Time", color=theme["text"], fontsize=8)
+
+
+class BlitManager:
+    """Redraw only animated artists over a cached figure background"""
+
+    def __init__(self, canvas, animated_artists=()):
+        self.canvas = canvas
+        self._background = None
+        self._artists = []
+        for artist in animated_artists:
+            self.add_artist(artist)
+
+        # Any full draw (first show, resize, theme change) refreshes the cached background
+        self._draw_cid = canvas.mpl_connect("draw_event", self.on_draw)
+
+    def add_artist(self, artist):
+        """Mark an artist as animated so it is left out of the cached background"""
+        if artist not in self._artists:
+            artist.set_animated(True)
+            self._artists.append(artist)
+
+    def remove_artist(self, artist):
+        """Stop managing an artist"""
+        if artist in self._artists:
+            self._artists.remove(artist)
+
+    def invalidate(self):
+        """Force a full redraw on the next update (axis limits, labels or colors changed)"""
+        self._background = None
+
+    def on_draw(self, event):
+        """Cache the freshly drawn background and paint the animated artists on top"""
+        figure = self.canvas.figure
+        self._background = self.canvas.copy_from_bbox(figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        figure = self.canvas.figure
+        for artist in self._artists:
+            if artist.get_visible() and artist.figure is figure:
+                figure.draw_artist(artist)
+
+    def update(self):
+        """Blit the animated artists, falling back to a full draw when no background is cached"""
+        if self._background is None:
+            # draw() fires draw_event, which caches the background and draws the artists
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+
+class AreaSeries:
+    """Area fill from 0 up to a series, updated in place through a preallocated vertex buffer"""
+
+    def __init__(self, ax, capacity=4096, **kwargs):
+        self.ax = ax
+        self.capacity = 0
+        self._vertices = None
+        self._path = None
+        self.collection = PathCollection([], **kwargs)
+        ax.add_collection(self.collection, autolim=False)
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """(Re)build the single fixed-size polygon path backing the fill"""
+        self.capacity = capacity
+        # Baseline start + one vertex per point + baseline end + closing vertex
+        size = capacity + 3
+        codes = np.full(size, Path.LINETO, dtype=Path.code_type)
+        codes[0] = Path.MOVETO
+        codes[-1] = Path.CLOSEPOLY
+        self._path = Path(np.zeros((size, 2)), codes)
+        self._vertices = self._path.vertices
+        self.collection.set_paths([self._path])
+
+    def set_data(self, x, y):
+        """Rewrite the polygon for new data; unused vertices collapse onto the last baseline point"""
+        count = len(x)
+        if count > self.capacity:
+            self._allocate(max(count, self.capacity * 2))
+        vertices = self._vertices
+        if count == 0:
+            vertices[:] = 0.0
+        else:
+            vertices[0, 0] = x[0]
+            vertices[0, 1] = 0.0
+            vertices[1:count + 1, 0] = x
+            vertices[1:count + 1, 1] = y
+            vertices[count + 1:, 0] = x[count - 1]
+            vertices[count + 1:, 1] = 0.0
+        self.collection.stale = True
+
+    def set_visible(self, visible):
+        self.collection.set_visible(visible)
+
+    def set_color(self, color):
+        self.collection.set_facecolor(color)
+        self.collection.set_edgecolor(color)
@@ -0,0 +1,114 @@
+import tkinter as tk
+from tkinter import ttk, filedialog
+from datetime import datetime
+
+# How often the overlay re-reads the timings, in seconds
+OVERLAY_REFRESH_INTERVAL = 1.0
+
+STAGE_COLUMNS = ("Stage", "Count", "Last", "p50", "p95", "Max")
+TASK_COLUMNS = ("Task", "Period", "Runs", "Late skips", "Hidden skips", "Avg late", "Errors")
+
+
+class PerformanceOverlay:
+    """Small always-on-top window with per-stage timings and scheduler statistics"""
+
+    def __init__(self, root, theme, stage_timer, scheduler):
+        self.stage_timer = stage_timer
+        self.scheduler = scheduler
+
+        self.window = tk.Toplevel(root)
+        self.window.title("Performance Overlay")
+        self.window.geometry("620x520")
+        self.window.configure(bg=theme["bg"])
+        self.window.attributes("-topmost", True)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.window.bind("<F12>", lambda event: self.close())
+
+        ttk.Label(self.window, text="Stage timings (ms, rolling window)",
+                  style="Title.TLabel", font=("Segoe UI", 11, "bold")).pack(anchor="w", padx=10, pady=(10, 2))
+        self.stage_tree = self._create_tree(STAGE_COLUMNS, height=12)
+
+        ttk.Label(self.window, text="Scheduler tasks",
+                  style="Title.TLabel", font=("Segoe UI", 11, "bold")).pack(anchor="w", padx=10, pady=(10, 2))
+        self.task_tree = self._create_tree(TASK_COLUMNS, height=7)
+
+        button_frame = ttk.Frame(self.window)
+        button_frame.pack(fill="x", padx=10, pady=10)
+        ttk.Button(button_frame, text="Export JSON", command=self.export_json,
+                   style="Accent.TButton").pack(side="left")
+        ttk.Button(button_frame, text="Reset", command=self.reset).pack(side="left", padx=5)
+        self.status_label = ttk.Label(button_frame, text="")
+        self.status_label.pack(side="right")
+
+        self.scheduler.add("perf-overlay", OVERLAY_REFRESH_INTERVAL, self.refresh, priority=9, delay=0,
+                           visible=lambda: bool(self.window.winfo_viewable()))
+
+    def _create_tree(self, columns, height):
+        tree = ttk.Treeview(self.window, columns=columns, show="headings",
+                            height=height, style="Custom.Treeview")
+        for col in columns:
+            tree.heading(col, text=col, anchor="center")
+            tree.column(col, width=70, anchor="e")
+        tree.column(columns[0], width=200, anchor="w")
+        tree.pack(fill="both", expand=True, padx=10)
+        return tree
+
+    def is_open(self):
+        return self.window is not None
+
+    def refresh(self):
+        """Redraw both tables from the current statistics"""
+        self.stage_tree.delete(*self.stage_tree.get_children())
+        for stage, stats in self.stage_timer.stats().items():
+            self.stage_tree.insert("", "end", values=(
+                stage,
+                stats['count'],
+                f"{stats['last_ms']:.2f}",
+                f"{stats['p50_ms']:.2f}",
+                f"{stats['p95_ms']:.2f}",
+                f"{stats['max_ms']:.2f}"
+            ))
+
+        self.task_tree.delete(*self.task_tree.get_children())
+        for name, stats in self.scheduler.stats().items():
+            self.task_tree.insert("", "end", values=(
+                name,
+                f"{stats['period_ms']:.0f}",
+                stats['runs'],
+                stats['skipped'],
+                stats['hidden_skips'],
+                f"{stats['avg_lateness_ms']:.1f}",
+                stats['errors']
+            ))
+
+    def export_json(self):
+        """Save the stage timings and scheduler statistics to a JSON file"""
+        path = filedialog.asksaveasfilename(
+            parent=self.window,
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            initialfile=f"monitor_timings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        if not path:
+            return
+        try:
+            self.stage_timer.export_json(path, extra={'scheduler': self.scheduler.stats()})
+            self.status_label.config(text="Exported")
+        except Exception as e:
+            print(f"Error exporting timings: {e}")
+            self.status_label.config(text="Export failed")
+
+    def reset(self):
+        """Clear the rolling timings"""
+        self.stage_timer.reset()
+        self.refresh()
+
+    def close(self):
+        """Stop refreshing and destroy the window"""
+        self.scheduler.remove("perf-overlay")
+        if self.window is not None:
+            try:
+                self.window.destroy()
+            except tk.TclError:
+                pass
+            self.window = None
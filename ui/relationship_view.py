@@ -0,0 +1,133 @@
+import time
+from collections import OrderedDict
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+# Relationship data is re-read from psutil only when the cached copy is older than this (seconds)
+RELATION_CACHE_TTL = 10.0
+RELATION_CACHE_SIZE = 64
+
+# Shown when a process cannot be inspected (exited or access denied)
+PLACEHOLDER_RELATIONS = [(name, "") for name in ("Child", "Parent", "Service", "Network", "File", "Memory")]
+
+
+def circle_layout(count, radius=0.4, center=(0.5, 0.5)):
+    """Positions of count nodes spread evenly on a circle"""
+    angles = 2 * np.pi * np.arange(count) / max(1, count)
+    return np.column_stack((center[0] + radius * np.cos(angles), center[1] + radius * np.sin(angles)))
+
+
+class RelationshipView:
+    """Process relationship diagram drawn on one persistent figure
+
+    The figure, the centre node and a fixed pool of edge/node/label artists are
+    created once; showing another process only moves, relabels and hides them.
+    Relations and node layouts are cached per (pid, create_time).
+    """
+
+    def __init__(self, parent, theme, max_nodes=8):
+        self.theme = theme
+        self.max_nodes = max_nodes
+        self.cache = OrderedDict()     # key -> (loaded_at, center_label, relations, positions)
+        self.current_key = None
+
+        self.fig = plt.Figure(figsize=(8, 6), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        self.ax.axis('off')
+        self.ax.set_xlim(0, 1)
+        self.ax.set_ylim(0, 1)
+        self.ax.set_aspect('equal')
+        self.title = self.ax.set_title("", pad=20)
+
+        self.center_node = plt.Circle((0.5, 0.5), 0.1, alpha=0.7)
+        self.ax.add_patch(self.center_node)
+        self.center_text = self.ax.text(0.5, 0.5, "", ha='center', va='center', fontsize=9)
+
+        # Pool of artists for the related nodes, reused for every process
+        self.edges = []
+        self.nodes = []
+        self.type_texts = []
+        self.info_texts = []
+        for _ in range(max_nodes):
+            edge = plt.Line2D([0.5, 0.5], [0.5, 0.5], alpha=0.4, visible=False)
+            self.ax.add_line(edge)
+            node = plt.Circle((0.5, 0.5), 0.05, alpha=0.7, visible=False)
+            self.ax.add_patch(node)
+            self.edges.append(edge)
+            self.nodes.append(node)
+            self.type_texts.append(self.ax.text(0.5, 0.5, "", ha='center', va='center',
+                                                fontsize=8, visible=False))
+            self.info_texts.append(self.ax.text(0.5, 0.5, "", ha='center', va='center',
+                                                fontsize=7, visible=False))
+
+        self.canvas = FigureCanvasTkAgg(self.fig, parent)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        self.set_theme(theme)
+
+    def get_cached(self, key, now=None):
+        """Return (center_label, relations) for a key if the cached copy is still fresh"""
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        if (now if now is not None else time.monotonic()) - entry[0] > RELATION_CACHE_TTL:
+            return None
+        self.cache.move_to_end(key)
+        return entry[1], entry[2]
+
+    def show(self, key, title, center_label, relations, fresh=True):
+        """Draw the diagram for one process, reusing the existing artists
+
+        fresh=False means the relations came from get_cached and keep their original age.
+        """
+        relations = list(relations)[:self.max_nodes]
+
+        # Reuse the cached layout when the number of relations has not changed
+        entry = self.cache.get(key)
+        if entry is not None and len(entry[3]) == len(relations):
+            positions = entry[3]
+        else:
+            positions = circle_layout(len(relations))
+        loaded_at = time.monotonic() if fresh or entry is None else entry[0]
+        self.cache[key] = (loaded_at, center_label, relations, positions)
+        self.cache.move_to_end(key)
+        while len(self.cache) > RELATION_CACHE_SIZE:
+            self.cache.popitem(last=False)
+
+        self.current_key = key
+        self.title.set_text(title)
+        self.center_text.set_text(center_label)
+
+        for i in range(self.max_nodes):
+            visible = i < len(relations)
+            for artist in (self.edges[i], self.nodes[i], self.type_texts[i], self.info_texts[i]):
+                artist.set_visible(visible)
+            if not visible:
+                continue
+            relation_type, info = relations[i]
+            x, y = positions[i]
+            self.edges[i].set_data([0.5, x], [0.5, y])
+            self.nodes[i].center = (x, y)
+            self.type_texts[i].set_position((x, y))
+            self.type_texts[i].set_text(relation_type)
+            self.info_texts[i].set_position((x, y + 0.07))
+            self.info_texts[i].set_text(str(info)[:15])
+
+        self.canvas.draw_idle()
+
+    def set_theme(self, theme):
+        """Apply theme colors to every artist"""
+        self.theme = theme
+        text_color = theme.get("text", "#000000")
+        self.fig.patch.set_facecolor(theme.get("card_bg", "#ffffff"))
+        self.ax.set_facecolor(theme.get("chart_bg", "#ffffff"))
+        self.title.set_color(text_color)
+        self.center_node.set_color(theme.get("accent", "#0078D7"))
+        self.center_text.set_color(text_color)
+        for edge, node, type_text, info_text in zip(self.edges, self.nodes, self.type_texts, self.info_texts):
+            edge.set_color(theme.get("text", "#666666"))
+            node.set_color(theme.get("success", "#4CAF50"))
+            type_text.set_color(text_color)
+            info_text.set_color(text_color)
+        self.canvas.draw_idle()
@@ -12,6 +12,9 @@ from tkinter import messagebox
 
 from ui.gauges import create_gauge, update_gauge
 from ui.graphs import create_performance_graphs, update_performance_graphs
+from ui.treeview_diff import TreeviewDiff
+from ui.relationship_view import RelationshipView, PLACEHOLDER_RELATIONS
+from utils.process_utils import get_process_relations
 from config import THEMES
 
 class TopSection:
@@ -393,6 +396,14 @@ class TopSection:
                 else:
                     anomaly_msg += "System State: Normal - No significant anomalies detected"
                 
+                # Processes whose recent CPU or memory departs from their own history
+                process_anomalies = getattr(self, 'process_anomalies', [])
+                if process_anomalies:
+                    anomaly_msg += "\n\nUnusual processes:"
+                    for proc in process_anomalies:
+                        anomaly_msg += (f"\n• {proc['name']} ({proc['pid']}): {proc['reason']} "
+                                        f"- CPU {proc['cpu']:.1f}%, {proc['rss_mb']:.0f} MB")
+                
                 # Update status message
                 self.update_status_message(anomaly_msg)
                 
@@ -422,6 +433,13 @@ class TopSection:
             print(f"Error in handle_ai_button: {e}")
             self.update_status_message(f"Error: {str(e)}")
 
+    def update_ai_insights(self, predictions, anomaly_result, recent_anomalies, process_anomalies=None):
+        """Keep the latest analysis results for the AI insight buttons"""
+        self.current_predictions = predictions
+        self.last_anomaly_result = anomaly_result
+        self.recent_anomalies = recent_anomalies
+        self.process_anomalies = process_anomalies or []
+
     def update_status_message(self, message):
         """Update the status message in the AI insights panel"""
         try:
@@ -506,24 +524,21 @@ class TopSection:
             
             self.info_labels["Uptime"].config(text=uptime_info)
             
-            # Schedule next update (every 10 seconds for system info is reasonable)
-            self.frame.after(10000, self.update_system_info)
-            
         except Exception as e:
             print(f"Error updating system info: {e}")
             # Handle errors gracefully by showing "Error" in the fields
             for label in self.info_labels:
                 self.info_labels[label].config(text="Error")
 
+    def is_visible(self):
+        """Return True if the top section is on screen (not minimized or unmapped)"""
+        return self.app.is_widget_visible(self.frame)
+
     def update_gauges(self, cpu_percent, mem_percent, disk_percent):
         """Update gauge charts for CPU, memory and disk"""
         update_gauge(self.cpu_ax, cpu_percent, "CPU", self.theme)
         update_gauge(self.mem_ax, mem_percent, "MEM", self.theme)
         update_gauge(self.disk_ax, disk_percent, "DISK", self.theme)
-        
-        self.cpu_ax.figure.canvas.draw()
-        self.mem_ax.figure.canvas.draw()
-        self.disk_ax.figure.canvas.draw()
     
     def update_gauge_colors(self, theme):
         """Update gauge colors when theme changes"""
@@ -531,9 +546,9 @@ class TopSection:
             # Store the current theme
             self.theme = theme
             
-            # Update gauges background color
-            for fig, _ in self.gauges:
-                fig.patch.set_facecolor(theme["card_bg"])
+            # Update gauges background color (full redraw of each gauge's static parts)
+            for _, ax in self.gauges:
+                ax.user_data["gauge"].set_theme(theme)
             
             # Force redraw of gauges with current values
             cpu_percent = self.app.cpu_usage_history[-1] if self.app.cpu_usage_history else 0
@@ -706,20 +721,17 @@ class TopSection:
                 self.analysis_text.config(state="normal")
                 self.analysis_text.delete(1.0, tk.END)
                 
-                # Get more complex metrics if available
-                process_count = len(list(psutil.process_iter()))
+                # Get more complex metrics from the shared process snapshot
+                snapshot = self.app.get_snapshot()
+                process_count = snapshot.total_count
                 
                 # Get top CPU and memory processes
                 top_processes = []
                 try:
-                    for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info']):
-                        try:
-                            proc_info = proc.info
-                            if proc_info['cpu_percent'] > 0.5:  # Only include processes using some CPU
-                                memory_mb = proc_info['memory_info'].rss / (1024 * 1024)
-                                top_processes.append((proc_info['name'], proc_info['cpu_percent'], memory_mb))
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            pass
+                    for proc in snapshot:
+                        if proc.cpu_percent > 0.5:  # Only include processes using some CPU
+                            memory_mb = proc.memory_rss / (1024 * 1024)
+                            top_processes.append((proc.name, proc.cpu_percent, memory_mb))
                     
                     # Sort by CPU usage
                     top_processes.sort(key=lambda x: x[1], reverse=True)
@@ -907,7 +919,7 @@ class TopSection:
                           str(round(sent_mb, 2)) + "MB sent since startup."
                 self.update_chat_display("Network Information: " + message, "assistant")
             elif command == "processes":
-                process_count = len(list(psutil.process_iter()))
+                process_count = self.app.get_snapshot().total_count
                 message = "Currently running " + str(process_count) + " processes."
                 self.update_chat_display("Process Information: " + message, "assistant")
             elif command == "help":
@@ -1007,7 +1019,7 @@ class TopSection:
                     response = "Network: " + str(round(recv_mb, 2)) + "MB received, " + \
                               str(round(sent_mb, 2)) + "MB sent since startup."
                 elif "processes" in query.lower() or "apps" in query.lower() or "programs" in query.lower() or "tasks" in query.lower():
-                    process_count = len(list(psutil.process_iter()))
+                    process_count = self.app.get_snapshot().total_count
                     response = "Currently running " + str(process_count) + " processes."
                 elif "performance" in query.lower() or "system status" in query.lower() or "overall" in query.lower():
                     try:
@@ -1222,39 +1234,31 @@ class TopSection:
                     
                     if target_process:
                         # Find matching processes
-                        matches = []
-                        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info', 'create_time', 'num_threads']):
-                            try:
-                                if target_process.lower() in proc.info['name'].lower():
-                                    proc_info = proc.info
-                                    proc_info['memory_mb'] = proc_info['memory_info'].rss / (1024 * 1024)
-                                    matches.append(proc_info)
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                pass
+                        matches = self.app.get_snapshot().filter(target_process)
                         
                         if not matches:
                             return f"No processes found matching '{target_process}'."
                         
                         # Sort by memory usage
-                        matches.sort(key=lambda x: x['memory_mb'], reverse=True)
+                        matches.sort(key=lambda x: x.memory_rss, reverse=True)
                         
                         # Analyze the process
                         proc = matches[0]
-                        pid = proc['pid']
-                        name = proc['name']
-                        cpu = proc['cpu_percent']
-                        memory_mb = proc['memory_mb']
+                        pid = proc.pid
+                        name = proc.name
+                        cpu = proc.cpu_percent
+                        memory_mb = proc.memory_rss / (1024 * 1024)
                         
                         # Get creation time
                         import datetime
-                        create_time = datetime.datetime.fromtimestamp(proc['create_time']).strftime("%Y-%m-%d %H:%M:%S")
+                        create_time = datetime.datetime.fromtimestamp(proc.create_time).strftime("%Y-%m-%d %H:%M:%S")
                         
                         # Get thread count
-                        threads = proc['num_threads']
+                        threads = proc.num_threads
                         
                         # Try to get more details
                         try:
-                            process = psutil.Process(pid)
+                            process = self.app.snapshot_engine.registry.get(pid)
                             status = process.status()
                             
                             # Try to get command line
@@ -1367,9 +1371,6 @@ class TopSection:
             
             self.info_labels["Uptime"].config(text=uptime_info)
             
-            # Schedule next update (every 10 seconds for system info is reasonable)
-            self.frame.after(10000, self.update_system_info)
-            
         except Exception as e:
             print(f"Error updating system info: {e}")
             # Handle errors gracefully by showing "Error" in the fields
@@ -1381,10 +1382,6 @@ class TopSection:
         update_gauge(self.cpu_ax, cpu_percent, "CPU", self.theme)
         update_gauge(self.mem_ax, mem_percent, "MEM", self.theme)
         update_gauge(self.disk_ax, disk_percent, "DISK", self.theme)
-        
-        self.cpu_ax.figure.canvas.draw()
-        self.mem_ax.figure.canvas.draw()
-        self.disk_ax.figure.canvas.draw()
     
     def update_gauge_colors(self, theme):
         """Update gauge colors when theme changes"""
@@ -1392,9 +1389,9 @@ class TopSection:
             # Store the current theme
             self.theme = theme
             
-            # Update gauges background color
-            for fig, _ in self.gauges:
-                fig.patch.set_facecolor(theme["card_bg"])
+            # Update gauges background color (full redraw of each gauge's static parts)
+            for _, ax in self.gauges:
+                ax.user_data["gauge"].set_theme(theme)
             
             # Force redraw of gauges with current values
             cpu_percent = self.app.cpu_usage_history[-1] if self.app.cpu_usage_history else 0
@@ -1953,6 +1950,10 @@ class MiddleSection:
         # Create performance graphs
         self.create_performance_graphs()
 
+    def is_visible(self):
+        """Return True if the process intelligence tree is on screen (its notebook tab is selected)"""
+        return self.app.is_widget_visible(getattr(self, "pi_tree", self.frame))
+
     def create_process_list(self):
         """Create the process list with improved styling and functionality"""
         # Process treeview with improved styling
@@ -1980,6 +1981,9 @@ class MiddleSection:
         self.tree.heading("Memory", text="Memory (MB)", anchor="center")
         self.tree.heading("Status", text="Status", anchor="center")
         
+        # Rows are keyed by (pid, create_time) and updated incrementally
+        self.tree_diff = TreeviewDiff(self.tree)
+        
         # Add scrollbar
         scrollbar = ttk.Scrollbar(list_container, orient="vertical", command=self.tree.yview)
         self.tree.configure(yscrollcommand=scrollbar.set)
@@ -2069,41 +2073,31 @@ class MiddleSection:
     def update_process_list(self):
         """Update the process list after killing a process"""
         try:
-            # Clear existing items
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-            
             # Get filter text
             filter_text = self.filter_var.get().lower()
             
-            # Get process list
+            # Get process list from the shared snapshot
+            snapshot = self.app.get_snapshot()
             processes = []
-            process_count = 0
             
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info']):
-                try:
-                    proc_info = proc.info
-                    if filter_text in proc_info['name'].lower():
-                        processes.append((
-                            proc_info['pid'],
-                            proc_info['name'],
-                            f"{proc_info['cpu_percent']:.1f}",
-                            f"{proc_info['memory_info'].rss / (1024 * 1024):.1f}",
-                            proc_info['status']
-                        ))
-                        process_count += 1
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
+            for proc in snapshot.filter(filter_text):
+                processes.append(((proc.pid, proc.create_time), (
+                    proc.pid,
+                    proc.name,
+                    f"{proc.cpu_percent:.1f}",
+                    f"{proc.memory_rss / (1024 * 1024):.1f}",
+                    proc.status
+                )))
+            process_count = len(processes)
             
             # Sort processes by CPU usage
-            processes.sort(key=lambda x: float(x[2]), reverse=True)
+            processes.sort(key=lambda x: float(x[1][2]), reverse=True)
             
-            # Insert into treeview
-            for proc in processes:
-                self.tree.insert('', 'end', values=proc)
+            # Apply only the changes since the last refresh
+            self.tree_diff.update(processes)
             
             # Update process count
-            total_processes = len(list(psutil.process_iter()))
+            total_processes = snapshot.total_count
             self.process_count.config(text=f"{process_count} of {total_processes} processes")
             
         except Exception as e:
@@ -2286,6 +2280,9 @@ class MiddleSection:
         self.pi_tree.column("Priority", width=80)
         self.pi_tree.column("Relations", width=150)
         
+        # Rows are keyed by (pid, create_time) and updated incrementally
+        self.pi_tree_diff = TreeviewDiff(self.pi_tree)
+        
         # Add scrollbar
         scrollbar = ttk.Scrollbar(process_list_frame, orient="vertical", command=self.pi_tree.yview)
         self.pi_tree.configure(yscrollcommand=scrollbar.set)
@@ -2318,6 +2315,7 @@ class MiddleSection:
         # Add canvas frame for the diagram
         self.relation_canvas_frame = ttk.Frame(self.relations_frame, style="Card.TFrame")
         self.relation_canvas_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        self.relationship_view = None  # created on the first selection
         
         # Populate initial process data
         self.update_process_intelligence()
@@ -2331,179 +2329,32 @@ class MiddleSection:
                 return
             
             process_name = self.pi_tree.item(selected[0])["values"][0]
-            
-            # Clear previous diagram
-            for widget in self.relation_canvas_frame.winfo_children():
-                widget.destroy()
-            
-            # Create a matplotlib figure for the diagram
-            fig = plt.Figure(figsize=(8, 6), dpi=100)
-            fig.patch.set_facecolor(self.theme.get("card_bg", "#ffffff"))
-            
-            ax = fig.add_subplot(111)
-            ax.set_facecolor(self.theme.get("chart_bg", "#ffffff"))
-            ax.set_title(f"Process Relationships: {process_name}", 
-                        color=self.theme.get("text", "#000000"),
-                        pad=20)
-            
-            # Hide axes
-            ax.axis('off')
-            
-            # Create canvas
-            canvas = FigureCanvasTkAgg(fig, self.relation_canvas_frame)
-            canvas.get_tk_widget().pack(fill="both", expand=True)
+            key = self.pi_tree_diff.key_for(selected[0])
+            
+            # The diagram keeps one figure for the whole session
+            if self.relationship_view is None:
+                self.relationship_view = RelationshipView(self.relation_canvas_frame, self.theme)
+            title = f"Process Relationships: {process_name}"
+            
+            # Reuse relations read for this process in the last few seconds
+            cached = self.relationship_view.get_cached(key)
+            if cached is not None:
+                center_label, relations = cached
+                self.relationship_view.show(key, title, center_label, relations, fresh=False)
+                return
             
             # Get actual process data
             try:
-                # Get the process ID from the tree item
-                pid = int(process_name)
-                process = psutil.Process(pid)
-                
-                # Get parent process if available
-                parent = None
-                parent_name = "None"
-                try:
-                    parent = psutil.Process(process.ppid())
-                    parent_name = f"{parent.pid} ({parent.name()})"
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-                
-                # Get children processes
-                children = []
-                try:
-                    children = process.children()
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-                
-                # Get connections
-                connections = []
-                try:
-                    connections = process.connections()
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-                
-                # Get open files
-                open_files = []
-                try:
-                    open_files = process.open_files()
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-                
-                # Create a list of related processes to display
-                related_processes = []
-                
-                # Add parent if available
-                if parent:
-                    related_processes.append(("Parent", parent_name))
-                
-                # Add up to 2 children
-                for i, child in enumerate(children[:2]):
-                    try:
-                        related_processes.append(("Child", f"{child.pid} ({child.name()})"))
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
-                
-                # Add up to 2 network connections
-                for i, conn in enumerate(connections[:2]):
-                    addr = conn.laddr
-                    related_processes.append(("Network", f"{addr.ip}:{addr.port}"))
-                
-                # Add up to 2 file connections
-                for i, file in enumerate(open_files[:2]):
-                    related_processes.append(("File", file.path.split('\\')[-1]))
-                
-                # Fill remaining slots with placeholders if needed
-                relation_types = ["Memory", "Thread", "Service"]
-                i = 0
-                
-                # Draw central node (main process)
-                circle = plt.Circle((0.5, 0.5), 0.1, color=self.theme.get("accent", "#0078D7"), alpha=0.7)
-                ax.add_patch(circle)
-                ax.text(0.5, 0.5, f"{process.pid} ({process.name()})", 
-                       ha='center', va='center', 
-                       color=self.theme.get("text", "#000000"),
-                       fontsize=9)
-                
-                # Draw related processes in a circle
-                num_relations = len(related_processes)
-                radius = 0.4  # Radius of the circle
-                center = (0.5, 0.5)  # Center of the diagram
-                
-                for i, (relation_type, process_info) in enumerate(related_processes):
-                    angle = 2 * np.pi * i / num_relations
-                    x = center[0] + radius * np.cos(angle)
-                    y = center[1] + radius * np.sin(angle)
-                    
-                    # Draw connection line
-                    line = plt.Line2D([center[0], x], [center[1], y], 
-                                    color=self.theme.get("text", "#666666"),
-                                    alpha=0.4)
-                    ax.add_line(line)
-                    
-                    # Draw related process node
-                    circle = plt.Circle((x, y), 0.05, 
-                                      color=self.theme.get("success", "#4CAF50"),
-                                      alpha=0.7)
-                    ax.add_patch(circle)
-                    
-                    # Add label for related process
-                    ax.text(x, y, relation_type,
-                           ha='center', va='center',
-                           color=self.theme.get("text", "#000000"),
-                           fontsize=8)
-                    
-                    # Add process info below the relation type
-                    ax.text(x, y + 0.07, str(process_info)[:15],
-                           ha='center', va='center',
-                           color=self.theme.get("text", "#000000"),
-                           fontsize=7)
-                
-            except (ValueError, psutil.NoSuchProcess, psutil.AccessDenied) as e:
+                process = self.app.snapshot_engine.registry.get(key[0])
+                center_label = f"{process.pid} ({process.name()})"
+                relations = get_process_relations(process)
+            except (TypeError, psutil.NoSuchProcess, psutil.AccessDenied) as e:
                 # If we can't get actual process data, fall back to placeholder visualization
                 print(f"Error getting process data: {e}")
-                
-                # Draw central node (main process)
-                circle = plt.Circle((0.5, 0.5), 0.1, color=self.theme.get("accent", "#0078D7"), alpha=0.7)
-                ax.add_patch(circle)
-                ax.text(0.5, 0.5, process_name, 
-                       ha='center', va='center', 
-                       color=self.theme.get("text", "#000000"),
-                       fontsize=9)
-                
-                # Draw related processes in a circle
-                num_relations = 6  # Number of related processes to show
-                radius = 0.4  # Radius of the circle
-                center = (0.5, 0.5)  # Center of the diagram
-                
-                for i in range(num_relations):
-                    angle = 2 * np.pi * i / num_relations
-                    x = center[0] + radius * np.cos(angle)
-                    y = center[1] + radius * np.sin(angle)
-                    
-                    # Draw connection line
-                    line = plt.Line2D([center[0], x], [center[1], y], 
-                                    color=self.theme.get("text", "#666666"),
-                                    alpha=0.4)
-                    ax.add_line(line)
-                    
-                    # Draw related process node
-                    circle = plt.Circle((x, y), 0.05, 
-                                      color=self.theme.get("success", "#4CAF50"),
-                                      alpha=0.7)
-                    ax.add_patch(circle)
-                    
-                    # Add label for related process
-                    relation_type = ["Child", "Parent", "Service", "Network", "File", "Memory"][i]
-                    ax.text(x, y, relation_type,
-                           ha='center', va='center',
-                           color=self.theme.get("text", "#000000"),
-                           fontsize=8)
+                center_label = str(process_name)
+                relations = PLACEHOLDER_RELATIONS
             
-            # Set the aspect ratio to be equal
-            ax.set_aspect('equal')
-            
-            # Draw the canvas
-            canvas.draw()
+            self.relationship_view.show(key, title, center_label, relations)
             
         except Exception as e:
             print(f"Error showing process relationships: {e}")
@@ -2512,30 +2363,25 @@ class MiddleSection:
                                   text=f"Error generating diagram: {str(e)}",
                                   style="Error.TLabel")
             error_label.pack(anchor="center", pady=20)
+            error_label.after(5000, error_label.destroy)
 
     def update_process_intelligence(self):
         """Update the process intelligence data with improved categories and relations"""
         try:
-            # Clear existing items
-            for item in self.pi_tree.get_children():
-                self.pi_tree.delete(item)
-            
             # Get the running processes
             processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info']):
-                try:
-                    # Skip very low resource processes to focus on important ones
-                    if proc.info['cpu_percent'] < 0.1 and proc.info['memory_info'].rss < 10*1024*1024:
-                        continue
-                        
-                    processes.append({
-                        'pid': proc.info['pid'],
-                        'name': proc.info['name'],
-                        'cpu': proc.info['cpu_percent'],
-                        'memory': proc.info['memory_info'].rss / (1024*1024)
-                    })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
+            for proc in self.app.get_snapshot():
+                # Skip very low resource processes to focus on important ones
+                if proc.cpu_percent < 0.1 and proc.memory_rss < 10*1024*1024:
+                    continue
+                    
+                processes.append({
+                    'pid': proc.pid,
+                    'create_time': proc.create_time,
+                    'name': proc.name,
+                    'cpu': proc.cpu_percent,
+                    'memory': proc.memory_rss / (1024*1024)
+                })
             
             # Sort by resource usage (CPU + Memory impact)
             processes.sort(key=lambda x: (x['cpu'] + x['memory']/100), reverse=True)
@@ -2698,6 +2544,7 @@ class MiddleSection:
                 return ", ".join(relations)
             
             # Populate the tree
+            rows = []
             for proc in processes:
                 # Get process name
                 process_name = proc['name']
@@ -2712,19 +2559,22 @@ class MiddleSection:
                 relations = determine_relations(process_name)
                 
                 # Add to tree (note: removed Optimizations column)
-                self.pi_tree.insert('', 'end', values=(
+                rows.append(((proc['pid'], proc['create_time']), (
                     process_name,
                     category,
                     priority,
                     relations
-                ))
+                )))
+            
+            # Apply only the changes since the last refresh
+            self.pi_tree_diff.update(rows)
             
         except Exception as e:
             print(f"Error updating process intelligence: {e}")
             # Show error in the tree
-            self.pi_tree.insert('', 'end', values=(
+            self.pi_tree_diff.update([("error", (
                 "Error loading process data",
                 "Error",
                 "Error",
                 str(e)
-            ))
+            ))])
@@ -0,0 +1,105 @@
+from bisect import bisect_left
+
+
+def longest_increasing_run(items, position):
+    """Largest subset of items whose position values already increase in list order (O(n log n))"""
+    tails = []          # tails[k] = smallest end position of an increasing run of length k + 1
+    tail_index = []     # index into items of that run's last element
+    previous = [-1] * len(items)
+    for i, item in enumerate(items):
+        k = bisect_left(tails, position[item])
+        if k == len(tails):
+            tails.append(position[item])
+            tail_index.append(i)
+        else:
+            tails[k] = position[item]
+            tail_index[k] = i
+        previous[i] = tail_index[k - 1] if k else -1
+
+    run = set()
+    i = tail_index[-1] if tail_index else -1
+    while i >= 0:
+        run.add(items[i])
+        i = previous[i]
+    return run
+
+
+class TreeviewDiff:
+    """Keep a ttk.Treeview in sync with a list of keyed rows using as few Tk calls as possible"""
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.values = {}    # iid -> values currently shown
+        self.keys = {}      # iid -> row key
+        self.order = []     # iids in display order
+        self.last_call_count = 0
+
+    @staticmethod
+    def make_iid(key):
+        """Build a stable Treeview item id from a row key such as (pid, create_time)"""
+        if isinstance(key, tuple):
+            return "-".join(str(part) for part in key)
+        return str(key)
+
+    def update(self, rows):
+        """Apply rows given as (key, values) pairs in display order; returns the Tk call count"""
+        calls = 0
+        target_order = []
+        target_values = {}
+        target_keys = {}
+        for key, values in rows:
+            iid = self.make_iid(key)
+            if iid in target_values:
+                continue  # Duplicate keys would break the Treeview; keep the first
+            target_order.append(iid)
+            target_values[iid] = tuple(values)
+            target_keys[iid] = key
+
+        # Remove exited rows in a single call
+        removed = [iid for iid in self.order if iid not in target_values]
+        if removed:
+            self.tree.delete(*removed)
+            calls += 1
+        # Surviving rows keep their place if they are on the longest run already in target
+        # order; the rest are detached in one call and reattached at their target index.
+        # Every row before `index` then matches the target and the rows after it are the
+        # remaining stable ones, so one pass places everything.
+        old_index = {iid: i for i, iid in enumerate(self.order)}
+        stable = longest_increasing_run([iid for iid in target_order if iid in self.values], old_index)
+        unstable = [iid for iid in target_order if iid in self.values and iid not in stable]
+        if unstable:
+            self.tree.detach(*unstable)
+            calls += 1
+
+        for index, iid in enumerate(target_order):
+            values = target_values[iid]
+            if iid not in self.values:
+                self.tree.insert('', index, iid=iid, values=values)
+                calls += 1
+                continue
+
+            if iid not in stable:
+                self.tree.move(iid, '', index)
+                calls += 1
+
+            if self.values[iid] != values:
+                self.tree.item(iid, values=values)
+                calls += 1
+
+        self.values = target_values
+        self.keys = target_keys
+        self.order = target_order
+        self.last_call_count = calls
+        return calls
+
+    def clear(self):
+        """Remove every managed row"""
+        if self.order:
+            self.tree.delete(*self.order)
+        self.values = {}
+        self.keys = {}
+        self.order = []
+
+    def key_for(self, iid):
+        """Return the row key for a Treeview item id, or None"""
+        return self.keys.get(iid)
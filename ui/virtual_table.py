@@ -0,0 +1,177 @@
+from tkinter import ttk
+
+from ui.treeview_diff import TreeviewDiff
+
+
+class VirtualProcessTable:
+    """Treeview that keeps the full sorted dataset in memory and only materializes the visible rows
+
+    Rows are (key, values) pairs where values hold raw, sortable data (numbers stay
+    numbers); formatters turn them into display text only for the rows on screen.
+    The table owns its scrollbar, so scrolling moves a window over the dataset
+    instead of scrolling a Treeview that holds every row.
+    """
+
+    def __init__(self, parent, columns, headings=None, formatters=None, height=8, overscan=10,
+                 style="Custom.Treeview", sort_column=None, sort_descending=True):
+        self.columns = tuple(columns)
+        self.formatters = formatters or {}
+        self.overscan = overscan
+        self.rows = []                 # full dataset, sorted
+        self.offset = 0                # index of the first visible row
+        self.visible_count = height
+        self.sort_column = sort_column
+        self.sort_descending = sort_descending
+        self.headings = headings or {}
+
+        self.frame = ttk.Frame(parent, style="Card.TFrame")
+        self.tree = ttk.Treeview(self.frame, columns=self.columns, show="headings",
+                                 style=style, height=height)
+        for col in self.columns:
+            self.tree.heading(col, text=self.headings.get(col, col),
+                              command=lambda c=col: self.sort_by(c))
+        self.diff = TreeviewDiff(self.tree)
+
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.on_scrollbar)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", self.on_mousewheel)
+        self.tree.bind("<Button-5>", self.on_mousewheel)
+        self.tree.bind("<Up>", lambda event: self.on_key_step(-1))
+        self.tree.bind("<Down>", lambda event: self.on_key_step(1))
+        self.tree.bind("<Prior>", lambda event: self.scroll(-self.visible_count))
+        self.tree.bind("<Next>", lambda event: self.scroll(self.visible_count))
+        self._update_heading_arrows()
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def set_rows(self, rows):
+        """Replace the dataset; the scroll position and sort order are kept"""
+        self.rows = list(rows)
+        self._sort()
+        self.render()
+
+    def sort_by(self, column, descending=None):
+        """Sort on a column; clicking the current sort column again reverses the order"""
+        if descending is None:
+            if column == self.sort_column:
+                descending = not self.sort_descending
+            else:
+                # Numbers start with the largest value, text starts at A
+                index = self.columns.index(column)
+                descending = not (self.rows and isinstance(self.rows[0][1][index], str))
+        self.sort_column = column
+        self.sort_descending = descending
+        self._update_heading_arrows()
+        self._sort()
+        self.render()
+
+    def _sort(self):
+        if self.sort_column not in self.columns:
+            return
+        index = self.columns.index(self.sort_column)
+
+        def sort_key(row):
+            value = row[1][index]
+            return value.lower() if isinstance(value, str) else value
+
+        try:
+            self.rows.sort(key=sort_key, reverse=self.sort_descending)
+        except TypeError:
+            # Mixed types in one column: fall back to comparing the text
+            self.rows.sort(key=lambda row: str(row[1][index]).lower(), reverse=self.sort_descending)
+
+    def _update_heading_arrows(self):
+        for col in self.columns:
+            text = self.headings.get(col, col)
+            if col == self.sort_column:
+                text += " ▼" if self.sort_descending else " ▲"
+            self.tree.heading(col, text=text)
+
+    def format_values(self, values):
+        """Display text for one row"""
+        return tuple(self.formatters[col](value) if col in self.formatters else value
+                     for col, value in zip(self.columns, values))
+
+    def render(self):
+        """Materialize the visible window (plus overscan) and sync the scrollbar"""
+        self.offset = max(0, min(self.offset, len(self.rows) - self.visible_count))
+        end = min(len(self.rows), self.offset + self.visible_count + self.overscan)
+        window = [(key, self.format_values(values)) for key, values in self.rows[self.offset:end]]
+        self.diff.update(window)
+        self.tree.yview_moveto(0)
+
+        total = max(1, len(self.rows))
+        self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.visible_count) / total))
+
+    def scroll(self, rows):
+        """Move the window by a number of rows"""
+        self.scroll_to(self.offset + rows)
+        return "break"
+
+    def scroll_to(self, offset):
+        """Make the row at offset the first visible row"""
+        offset = max(0, min(int(offset), len(self.rows) - self.visible_count))
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def on_scrollbar(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units'|'pages')"""
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * len(self.rows))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self.visible_count
+            self.scroll(step)
+
+    def on_mousewheel(self, event):
+        if getattr(event, "num", None) == 4:
+            return self.scroll(-3)
+        if getattr(event, "num", None) == 5:
+            return self.scroll(3)
+        return self.scroll(-3 if event.delta > 0 else 3)
+
+    def on_key_step(self, step):
+        """Keyboard navigation that scrolls the window when the selection reaches an edge"""
+        selected = self.tree.selection()
+        if not selected or selected[0] not in self.diff.order:
+            return None
+        index = self.diff.order.index(selected[0])
+        edge = 0 if step < 0 else min(self.visible_count, len(self.diff.order)) - 1
+        if index != edge:
+            return None  # Let the Treeview move the selection inside the window
+        previous = self.offset
+        self.scroll(step)
+        if self.offset != previous:
+            # The next row has scrolled into the same screen position
+            self.tree.selection_set(self.diff.order[edge])
+            self.tree.focus(self.diff.order[edge])
+        return "break"
+
+    def on_resize(self, event):
+        """Recompute how many rows fit when the widget is resized"""
+        style = ttk.Style()
+        row_height = style.lookup(self.tree.cget("style"), "rowheight") or 20
+        try:
+            row_height = max(1, int(row_height))
+        except (TypeError, ValueError):
+            row_height = 20
+        # Leave room for the heading row
+        visible = max(1, (event.height - row_height) // row_height)
+        if visible != self.visible_count:
+            self.visible_count = visible
+            self.render()
+
+    def selected_key(self):
+        """Row key of the selected item, or None"""
+        selected = self.tree.selection()
+        return self.diff.key_for(selected[0]) if selected else None
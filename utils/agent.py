@@ -0,0 +1,153 @@
+import queue
+import signal
+import time
+from datetime import datetime
+
+from config import (DEFAULT_ALERT_THRESHOLDS, DEFAULT_COLLECTOR_BACKEND, DEFAULT_REFRESH_RATE,
+                    METRIC_STORE_PATH, METRIC_RETENTION, METRIC_STORE_TOP_PROCESSES)
+from utils.alerts import check_thresholds
+from utils.collector import BackgroundCollector
+from utils.history import MetricHistory
+from utils.metric_store import MetricStore
+from utils.snapshot import SnapshotEngine
+
+
+class MonitorAgent:
+    """Headless monitoring loop: collection, history store, alerts and anomaly detection without Tk"""
+
+    def __init__(self, interval=DEFAULT_REFRESH_RATE, backend=DEFAULT_COLLECTOR_BACKEND,
+                 store_path=METRIC_STORE_PATH, thresholds=None, detect_anomalies=True,
+                 alert_cooldown=60.0):
+        self.interval = interval
+        self.thresholds = dict(thresholds or DEFAULT_ALERT_THRESHOLDS)
+        self.alert_cooldown = alert_cooldown
+        self._last_alert = {}  # metric -> monotonic time of the last alert printed
+        self._running = False
+
+        self.snapshot_engine = SnapshotEngine(backend=backend)
+        self.collector = BackgroundCollector(interval=interval, snapshot_engine=self.snapshot_engine)
+        self.history = MetricHistory(capacity=3600)
+
+        self.store = None
+        if store_path:
+            try:
+                self.store = MetricStore(store_path, METRIC_RETENTION,
+                                         top_processes=METRIC_STORE_TOP_PROCESSES)
+                restored = self.store.restore_history(self.history)
+                if restored:
+                    print(f"Restored {restored} samples from {store_path}")
+            except Exception as e:
+                print(f"Metric store unavailable, history will not persist: {e}")
+                self.store = None
+
+        # The ML stack is only imported when anomaly detection is wanted; the streaming
+        # detector needs only NumPy and still runs when scikit-learn is missing
+        self.anomaly_detector = None
+        self.streaming_detector = None
+        if detect_anomalies:
+            from utils.ai_utils import StreamingAnomalyDetector
+            self.streaming_detector = StreamingAnomalyDetector()
+            try:
+                from utils.ai_utils import AnomalyDetector, preload_analytics
+                if not preload_analytics():
+                    raise ImportError("scikit-learn is not installed")
+                self.anomaly_detector = AnomalyDetector()
+            except ImportError as e:
+                print(f"Anomaly detection disabled: {e}")
+
+    def run(self, duration=None):
+        """Run until stopped (Ctrl+C / SIGTERM) or for `duration` seconds"""
+        self._running = True
+        try:
+            signal.signal(signal.SIGTERM, lambda signum, frame: self.stop())
+        except ValueError:
+            pass  # Not on the main thread; rely on stop() being called
+
+        deadline = time.monotonic() + duration if duration else None
+        print(f"Monitoring agent started (backend: {self.snapshot_engine.backend}, interval: {self.interval}s)")
+        self.collector.start()
+        try:
+            while self._running:
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+                try:
+                    sample = self.collector.queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                self.process_sample(sample)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+
+    def stop(self):
+        """Ask the run loop to exit"""
+        self._running = False
+
+    def process_sample(self, sample):
+        """Record one collector sample and run the alert and anomaly checks"""
+        timestamp = sample['timestamp']
+        cpu, memory, disk = sample['cpu'], sample['memory'], sample['disk']
+
+        closed_buckets = self.history.append(timestamp, cpu, memory, disk)
+        if self.store is not None:
+            self.store.add_sample(timestamp, cpu, memory, disk, closed_buckets, sample.get('snapshot'))
+
+        self.check_alerts(cpu, memory, disk, datetime.fromtimestamp(timestamp))
+        self.check_streaming_anomaly(cpu, memory, disk, timestamp)
+        self.check_anomalies()
+
+    def check_alerts(self, cpu, memory, disk, timestamp=None):
+        """Print threshold alerts, at most once per metric per cooldown period"""
+        now = time.monotonic()
+        for metric, message in check_thresholds(self.thresholds, cpu, memory, disk, timestamp):
+            last = self._last_alert.get(metric)
+            if last is None or now - last >= self.alert_cooldown:
+                self._last_alert[metric] = now
+                print(message)
+
+    def check_streaming_anomaly(self, cpu, memory, disk, timestamp):
+        """Score every sample with the streaming detector; report each anomalous episode once"""
+        if self.streaming_detector is None:
+            return
+        result = self.streaming_detector.update(cpu, memory, disk, timestamp)
+        if result['is_new']:
+            print(f"[{result['detection_time']}] ANOMALY DETECTED (streaming): CPU {cpu:.1f}%, "
+                  f"Memory {memory:.1f}%, Disk {disk:.1f}% ({result['metric']} z={result['score']:.1f})")
+
+    def check_anomalies(self):
+        """Train the anomaly detector when due and report anomalous samples"""
+        detector = self.anomaly_detector
+        if detector is None:
+            return
+        cpu = self.history.cpu.view()
+        memory = self.history.memory.view()
+        disk = self.history.disk.view()
+        try:
+            if detector.should_train(len(cpu)):
+                detector.train(cpu, memory, disk)
+            if detector.is_trained:
+                # Every sample since the last pass is scored once, in one model call
+                batch = detector.score_new_samples(cpu, memory, disk, self.history.total_samples)
+                if batch is None:
+                    return
+                timestamps = self.history.timestamps.view()
+                for position, score in zip(batch['positions'][batch['labels'] == -1],
+                                           batch['scores'][batch['labels'] == -1]):
+                    when = datetime.fromtimestamp(timestamps[position]).strftime("%H:%M:%S")
+                    print(f"[{when}] ANOMALY DETECTED: CPU {cpu[position]:.1f}%, "
+                          f"Memory {memory[position]:.1f}%, Disk {disk[position]:.1f}% "
+                          f"(score {score:.3f})")
+        except Exception as e:
+            print(f"Error in anomaly detection: {e}")
+
+    def shutdown(self):
+        """Stop the collector and flush the store"""
+        self.collector.stop()
+        if self.store is not None:
+            try:
+                self.store.close()
+            except Exception as e:
+                print(f"Error closing metric store: {e}")
+            self.store = None
+        print("Monitoring agent stopped")
@@ -1,29 +1,177 @@
+import threading
+import warnings
+
 import numpy as np
-from sklearn.ensemble import IsolationForest
-from statsmodels.tsa.arima.model import ARIMA
-import pandas as pd
 from datetime import datetime, timedelta
 
+# scikit-learn and statsmodels take seconds to import, so they are loaded on first use
+# (or ahead of time by preload_analytics from a background thread after startup)
+_analytics_ready = threading.Event()
+
+
+def preload_analytics():
+    """Import the analytics libraries; returns False if they are not installed"""
+    try:
+        import sklearn.ensemble  # noqa: F401
+        import statsmodels.tsa.arima.model  # noqa: F401
+    except ImportError as e:
+        print(f"Analytics libraries unavailable: {e}")
+        return False
+    _analytics_ready.set()
+    return True
+
+
+def analytics_ready():
+    """True once the analytics libraries have been imported"""
+    return _analytics_ready.is_set()
+
+
+def fit_anomaly_model(features):
+    """Fit the IsolationForest used by AnomalyDetector (module level so worker processes can run it)"""
+    from sklearn.ensemble import IsolationForest
+    
+    model = IsolationForest(contamination=0.05, random_state=42)
+    model.fit(features)
+    return model
+
+
+def arima_predictions(cpu_history, mem_history, disk_history):
+    """ARIMA predictions for all three metrics (module level so worker processes can run it)"""
+    return ResourcePredictor(method="arima").get_predictions(cpu_history, mem_history, disk_history)
+
+
+class OnlineForecaster:
+    """AR(1) model with intercept, y[t] = c + phi * y[t-1], fitted by recursive least squares
+
+    Each observe() is O(1) and the forecast needs no refit, unlike fitting ARIMA(1,0,0)
+    on the whole history. The forgetting factor lets the fit follow a changing workload
+    (0.995 weights roughly the last 200 samples).
+    """
+
+    def __init__(self, forgetting=0.995, initial_covariance=1000.0, low=0.0, high=100.0):
+        self.forgetting = forgetting
+        self.initial_covariance = initial_covariance
+        self.low = low
+        self.high = high
+        self.reset()
+
+    def reset(self):
+        self.c = 0.0
+        self.phi = 0.0
+        # 2x2 symmetric covariance of (c, phi), kept as three floats
+        self.p00 = self.p11 = self.initial_covariance
+        self.p01 = 0.0
+        self.last = None
+        self.count = 0
+
+    def observe(self, value):
+        """Update the model with one new sample"""
+        value = float(value)
+        if value != value:  # NaN
+            return
+        self.count += 1
+        if self.last is None:
+            self.last = value
+            self.c = value
+            return
+
+        x1 = self.last
+        lam = self.forgetting
+        # P x, gain k = P x / (lam + x' P x) for x = (1, x1)
+        px0 = self.p00 + self.p01 * x1
+        px1 = self.p01 + self.p11 * x1
+        denominator = lam + px0 + px1 * x1
+        k0 = px0 / denominator
+        k1 = px1 / denominator
+
+        error = value - (self.c + self.phi * x1)
+        self.c += k0 * error
+        self.phi += k1 * error
+
+        # P = (P - k x' P) / lam
+        self.p00 = (self.p00 - k0 * px0) / lam
+        self.p01 = (self.p01 - k0 * px1) / lam
+        self.p11 = (self.p11 - k1 * px1) / lam
+
+        # A flat series does not excite the model; keep forgetting from blowing P up
+        trace = self.p00 + self.p11
+        if trace > self.initial_covariance * 10:
+            scale = self.initial_covariance * 10 / trace
+            self.p00 *= scale
+            self.p01 *= scale
+            self.p11 *= scale
+
+        self.last = value
+
+    def warm_start(self, data):
+        """Fit from existing history (e.g. restored from the metric store)"""
+        for value in np.asarray(data, dtype=float):
+            self.observe(value)
+
+    def forecast(self, steps=5):
+        """Return the next `steps` values as an array, or None before the first sample"""
+        if self.last is None:
+            return None
+        # Keep the recursion stable even if the fit has drifted to a unit root
+        phi = min(0.999, max(-0.999, self.phi))
+        values = np.empty(steps)
+        y = self.last
+        for i in range(steps):
+            y = self.c + phi * y
+            values[i] = y
+        return np.clip(values, self.low, self.high)
+
+
 class ResourcePredictor:
     """Predictive analytics for system resource usage"""
     
-    def __init__(self, history_size=60):
+    METRICS = ('cpu', 'memory', 'disk')
+    
+    def __init__(self, history_size=60, method="online"):
         self.history_size = history_size
+        self.method = method  # "online" (RLS AR(1), O(1) per sample) or "arima" (refit every call)
         self.cpu_model = None
         self.mem_model = None
         self.disk_model = None
         self.min_samples_for_prediction = 30
+        self.forecasters = {metric: OnlineForecaster() for metric in self.METRICS}
+    
+    def ready(self):
+        """True if predictions can run without blocking on a library import"""
+        return self.method == "online" or analytics_ready()
+    
+    def observe(self, cpu, mem, disk):
+        """Feed one new sample to the online forecasters"""
+        for metric, value in zip(self.METRICS, (cpu, mem, disk)):
+            self.forecasters[metric].observe(value)
+    
+    def warm_start(self, cpu_history, mem_history, disk_history):
+        """Fit the online forecasters from existing history"""
+        for metric, data in zip(self.METRICS, (cpu_history, mem_history, disk_history)):
+            self.forecasters[metric].reset()
+            self.forecasters[metric].warm_start(data)
     
     def can_predict(self, data):
         """Check if we have enough data to make predictions"""
         return len(data) >= self.min_samples_for_prediction
     
+    def forecast(self, metric, data, steps=5):
+        """Forecast one metric with the configured method"""
+        if self.method != "online":
+            return self.predict_next_values(data, steps)
+        forecaster = self.forecasters[metric]
+        if forecaster.count == 0:
+            forecaster.warm_start(data)
+        return forecaster.forecast(steps)
+    
     def predict_next_values(self, data, steps=5):
         """Predict the next values using ARIMA model"""
         if not self.can_predict(data):
             return None
             
         try:
+            from statsmodels.tsa.arima.model import ARIMA
+            
             # Use a simple ARIMA model for prediction
             model = ARIMA(data, order=(1, 0, 0))
             model_fit = model.fit()
@@ -44,9 +192,9 @@ class ResourcePredictor:
         
         # Only make predictions if we have enough data
         if self.can_predict(cpu_history):
-            cpu_pred = self.predict_next_values(cpu_history)
-            mem_pred = self.predict_next_values(mem_history)
-            disk_pred = self.predict_next_values(disk_history)
+            cpu_pred = self.forecast('cpu', cpu_history)
+            mem_pred = self.forecast('memory', mem_history)
+            disk_pred = self.forecast('disk', disk_history)
             
             if cpu_pred is not None and mem_pred is not None and disk_pred is not None:
                 # Generate time labels for predictions (5 minutes into future)
@@ -75,6 +223,7 @@ class AnomalyDetector:
         self.last_training_time = None
         self.training_interval = 10  # Train every 10 updates
         self.update_count = 0
+        self.last_scored = None      # sequence number after the last sample scored by score_new_samples
     
     def should_train(self, data_size):
         """Determine if the model should be trained"""
@@ -94,20 +243,23 @@ class AnomalyDetector:
             return False
             
         try:
-            # Combine the data into a single feature matrix
-            X = np.column_stack((cpu_data, mem_data, disk_data))
-            
-            # Train an Isolation Forest model
-            self.model = IsolationForest(contamination=0.05, random_state=42)
-            self.model.fit(X)
-            
-            self.is_trained = True
-            self.last_training_time = datetime.now().strftime("%H:%M:%S")
+            # Train an Isolation Forest model on the combined feature matrix
+            self.set_model(fit_anomaly_model(self.training_data(cpu_data, mem_data, disk_data)))
             return True
         except Exception as e:
             print(f"Training error: {e}")
             return False
     
+    def training_data(self, cpu_data, mem_data, disk_data):
+        """Combine the data into a single feature matrix (a copy, safe to send to a worker)"""
+        return np.column_stack((cpu_data, mem_data, disk_data))
+    
+    def set_model(self, model):
+        """Install a model fitted elsewhere (e.g. by fit_anomaly_model in a worker process)"""
+        self.model = model
+        self.is_trained = True
+        self.last_training_time = datetime.now().strftime("%H:%M:%S")
+    
     def detect_anomalies(self, cpu_data, mem_data, disk_data):
         """Detect anomalies in the current resource usage"""
         if not self.is_trained:
@@ -119,15 +271,13 @@ class AnomalyDetector:
             mem_current = mem_data[-1]
             disk_current = disk_data[-1]
             
-            # Make prediction
+            # Score and label in a single model pass
             X = np.array([[cpu_current, mem_current, disk_current]])
-            prediction = self.model.predict(X)
-            
-            # Calculate anomaly score (negative = anomaly)
-            score = self.model.score_samples(X)[0]
+            scores, labels = self.score_batch(X)
+            score = scores[0]
             
             # Determine if this is an anomaly
-            is_anomaly = prediction[0] == -1
+            is_anomaly = labels[0] == -1
             
             return {
                 'is_anomaly': is_anomaly,
@@ -139,4 +289,191 @@ class AnomalyDetector:
             }
         except Exception as e:
             print(f"Anomaly detection error: {e}")
-            return None 
+            return None
+    
+    def score_batch(self, features):
+        """Score many rows with one model pass; returns (scores, labels), label -1 = anomaly
+
+        Labels match IsolationForest.predict, which is score_samples compared with offset_,
+        so calling predict as well would only repeat the tree traversal.
+        """
+        scores = self.model.score_samples(features)
+        labels = np.where(scores < self.model.offset_, -1, 1)
+        return scores, labels
+    
+    def score_new_samples(self, cpu_data, mem_data, disk_data, total_samples):
+        """Score every sample appended since the last call in one vectorized pass
+
+        total_samples is the sequence number after the newest sample (e.g.
+        MetricHistory.total_samples), so samples are never scored twice even though
+        the arrays are a sliding window. The first call scores only the newest
+        sample; older ones were part of the training data. Returns None when there
+        is nothing new, otherwise a dict with per-sample 'sequence', 'positions'
+        (indices into the given arrays), 'scores' and 'labels', plus the number of
+        samples that fell out of the window before they could be scored ('missed').
+        """
+        if not self.is_trained:
+            return None
+        
+        available = len(cpu_data)
+        if self.last_scored is None:
+            self.last_scored = total_samples - 1
+        first = max(self.last_scored, total_samples - available)
+        missed = first - self.last_scored
+        count = total_samples - first
+        if count <= 0:
+            return None
+        
+        positions = np.arange(available - count, available)
+        features = np.column_stack((cpu_data[positions], mem_data[positions], disk_data[positions]))
+        scores, labels = self.score_batch(features)
+        self.last_scored = total_samples
+        
+        return {
+            'sequence': np.arange(first, total_samples),
+            'positions': positions,
+            'scores': scores,
+            'labels': labels,
+            'missed': missed
+        }
+
+
+class StreamingAnomalyDetector:
+    """Robust EWMA z-score detector that scores every sample in O(1) time and fixed memory
+
+    Each metric keeps an exponentially weighted mean and mean absolute deviation.
+    A sample is scored against the state *before* it is absorbed, and its deviation
+    is clipped when updating the state, so a spike barely moves the baseline while
+    a lasting level shift is still learned within a few dozen samples.
+    """
+    
+    METRICS = ('cpu', 'memory', 'disk')
+    MAD_TO_SIGMA = 1.2533  # mean absolute deviation -> standard deviation for normal data
+    
+    def __init__(self, alpha=0.02, threshold=4.0, warmup=30, clip=3.0, min_scale=0.5):
+        self.alpha = alpha            # weight of a new sample (0.02 ~ the last 50 samples)
+        self.threshold = threshold    # z-score at which a sample is anomalous
+        self.warmup = warmup          # samples before anything is reported
+        self.clip = clip              # deviations beyond clip * scale are clipped when updating
+        self.min_scale = min_scale    # floor for the scale, in percentage points
+        self.reset()
+    
+    def reset(self):
+        self.mean = {metric: None for metric in self.METRICS}
+        self.deviation = {metric: 0.0 for metric in self.METRICS}
+        self.count = 0
+        self.in_anomaly = False
+        self.anomaly_count = 0
+    
+    def update(self, cpu, mem, disk, timestamp=None):
+        """Score one sample, then absorb it; returns a result dict like AnomalyDetector.detect_anomalies"""
+        values = {'cpu': float(cpu), 'memory': float(mem), 'disk': float(disk)}
+        warming_up = self.count < self.warmup
+        # Plain running averages at first, so the start-up state is not biased towards the first sample
+        alpha = max(self.alpha, 1.0 / (self.count + 1))
+        z_scores = {}
+        
+        for metric, value in values.items():
+            mean = self.mean[metric]
+            if mean is None:
+                self.mean[metric] = value
+                z_scores[metric] = 0.0
+                continue
+            
+            scale = max(self.deviation[metric] * self.MAD_TO_SIGMA, self.min_scale)
+            deviation = value - mean
+            z_scores[metric] = abs(deviation) / scale
+            
+            # Clip outliers once the baseline is established
+            if not warming_up:
+                limit = self.clip * scale
+                deviation = max(-limit, min(limit, deviation))
+            self.mean[metric] = mean + alpha * deviation
+            self.deviation[metric] += alpha * (abs(deviation) - self.deviation[metric])
+        
+        self.count += 1
+        score = max(z_scores.values())
+        is_anomaly = not warming_up and score >= self.threshold
+        # Only the first sample of a run of anomalous samples starts a new episode
+        is_new = is_anomaly and not self.in_anomaly
+        self.in_anomaly = is_anomaly
+        if is_anomaly:
+            self.anomaly_count += 1
+        
+        when = datetime.fromtimestamp(timestamp) if timestamp is not None else datetime.now()
+        return {
+            'is_anomaly': is_anomaly,
+            'is_new': is_new,
+            'score': score,
+            'z_scores': z_scores,
+            'metric': max(z_scores, key=z_scores.get),
+            'cpu': values['cpu'],
+            'memory': values['memory'],
+            'disk': values['disk'],
+            'detection_time': when.strftime("%H:%M:%S")
+        }
+
+
+def score_process_anomalies(cpu, rss, recent=10, baseline=120, min_baseline=30, cpu_floor=2.0,
+                            rss_floor_ratio=0.02):
+    """Score every tracked process at once from (processes x samples) CPU% and RSS matrices
+
+    Each process is compared with its own history: the mean of the last `recent`
+    samples against the median of the `baseline` samples before them, scaled by
+    their MAD (robust z-score). Only increases count. Returns (scores, cpu_z, rss_z), one value per
+    row; NaN where a process has fewer than `min_baseline` earlier samples.
+    """
+    # Only the columns that are used; keeps the cost independent of the history length
+    cpu = np.asarray(cpu[:, -(recent + baseline):], dtype=np.float64)
+    rss = np.asarray(rss[:, -(recent + baseline):], dtype=np.float64)
+    rows, samples = cpu.shape
+    if samples < recent + min_baseline:
+        empty = np.full(rows, np.nan)
+        return empty, empty.copy(), empty.copy()
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN rows (free slots, new processes)
+        
+        def robust_z(matrix, floor):
+            baseline = matrix[:, :-recent]
+            median = np.nanmedian(baseline, axis=1)
+            mad = np.nanmedian(np.abs(baseline - median[:, None]), axis=1)
+            current = np.nanmean(matrix[:, -recent:], axis=1)
+            return (current - median) / np.maximum(mad * 1.4826, floor(median)), baseline
+        
+        cpu_z, baseline = robust_z(cpu, lambda median: cpu_floor)
+        # RSS varies on a per-process scale; a 2% change of its usual size (at least 1 MB) is one unit
+        rss_z, _ = robust_z(rss, lambda median: np.maximum(np.nan_to_num(median) * rss_floor_ratio, 1024 * 1024))
+    
+    scores = np.fmax(cpu_z, rss_z)
+    scores[np.count_nonzero(~np.isnan(baseline), axis=1) < min_baseline] = np.nan
+    return scores, cpu_z, rss_z
+
+
+def top_process_anomalies(process_history, limit=3, threshold=4.0):
+    """Return the most anomalous tracked processes (score >= threshold), most anomalous first"""
+    _, cpu, rss = process_history.matrix()
+    scores, cpu_z, rss_z = score_process_anomalies(cpu, rss)
+    
+    # Freed slots keep their last owner's samples until reused; never rank them
+    free = np.array([key is None for key in process_history.slot_keys])
+    scores[free] = np.nan
+    
+    ranked = np.argsort(-np.nan_to_num(scores, nan=-np.inf))
+    results = []
+    for slot in ranked[:limit]:
+        if not scores[slot] >= threshold:
+            break
+        key = process_history.slot_keys[slot]
+        results.append({
+            'pid': key[0],
+            'create_time': key[1],
+            'name': process_history.slot_names[slot],
+            'score': float(scores[slot]),
+            'cpu_z': float(cpu_z[slot]),
+            'rss_z': float(rss_z[slot]),
+            'cpu': float(np.nan_to_num(cpu[slot, -1])),
+            'rss_mb': float(np.nan_to_num(rss[slot, -1])) / (1024 * 1024),
+            'reason': 'CPU' if cpu_z[slot] >= rss_z[slot] else 'memory'
+        })
+    return results
@@ -0,0 +1,126 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+class AnalyticsWorkerPool:
+    """Runs model training and forecasting jobs in worker processes, off the Tk thread
+
+    Jobs are grouped by kind ("anomaly-train", "forecast", ...). At most one job per
+    kind runs at a time; submitting while one is running parks the new job, and a
+    newer submission replaces (supersedes) a parked one. poll() collects finished
+    jobs, and the last completed result of each kind stays available until replaced.
+    """
+
+    def __init__(self, max_workers=1):
+        self.max_workers = max_workers
+        self._executor = None          # started on the first submit so startup stays cheap
+        self._running = {}             # kind -> Future
+        self._pending = {}             # kind -> (fn, args)
+        self._results = {}             # kind -> (result, completed_at)
+        self._unread = set()           # kinds with a result not yet returned by take()
+        self.submitted = 0
+        self.superseded = 0
+        self.failed = 0
+        self.broken = False            # fall back to running jobs inline
+
+    def _get_executor(self):
+        if self._executor is None:
+            # Spawn fresh interpreters: forking the Tk process would copy its running threads' locks
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    def submit(self, kind, fn, *args):
+        """Queue fn(*args); fn and args must be picklable (module-level function, arrays)"""
+        if kind in self._pending:
+            self.superseded += 1
+        self._pending[kind] = (fn, args)
+        self._start_pending()
+
+    def _start_pending(self):
+        for kind in list(self._pending):
+            if kind in self._running:
+                continue
+            fn, args = self._pending.pop(kind)
+            self.submitted += 1
+            if self.broken:
+                self._run_inline(kind, fn, args)
+                continue
+            try:
+                self._running[kind] = self._get_executor().submit(fn, *args)
+            except (BrokenProcessPool, RuntimeError, OSError) as e:
+                print(f"Analytics worker pool unavailable, running jobs inline: {e}")
+                self.broken = True
+                self._run_inline(kind, fn, args)
+
+    def _run_inline(self, kind, fn, args):
+        try:
+            self._store(kind, fn(*args))
+        except Exception as e:
+            self.failed += 1
+            print(f"Analytics job '{kind}' failed: {e}")
+
+    def _store(self, kind, result):
+        self._results[kind] = (result, time.time())
+        self._unread.add(kind)
+
+    def poll(self):
+        """Collect finished jobs and start parked ones; returns the kinds that completed"""
+        completed = []
+        for kind, future in list(self._running.items()):
+            if not future.done():
+                continue
+            del self._running[kind]
+            try:
+                self._store(kind, future.result())
+                completed.append(kind)
+            except BrokenProcessPool as e:
+                print(f"Analytics worker pool crashed, running jobs inline: {e}")
+                self.failed += 1
+                self.broken = True
+            except Exception as e:
+                self.failed += 1
+                print(f"Analytics job '{kind}' failed: {e}")
+        self._start_pending()
+        return completed
+
+    def result(self, kind):
+        """Last completed result of a kind (None if none has finished yet)"""
+        entry = self._results.get(kind)
+        return entry[0] if entry is not None else None
+
+    def completed_at(self, kind):
+        """Wall-clock time the last result of a kind completed, or None"""
+        entry = self._results.get(kind)
+        return entry[1] if entry is not None else None
+
+    def take(self, kind):
+        """Return a result once, the first time it is asked for after completing; else None"""
+        if kind not in self._unread:
+            return None
+        self._unread.discard(kind)
+        return self.result(kind)
+
+    def busy(self, kind):
+        """True while a job of this kind is running or parked"""
+        return kind in self._running or kind in self._pending
+
+    def stats(self):
+        return {
+            'submitted': self.submitted,
+            'superseded': self.superseded,
+            'failed': self.failed,
+            'running': len(self._running),
+            'pending': len(self._pending),
+            'inline': self.broken
+        }
+
+    def shutdown(self):
+        """Stop the workers without waiting for running jobs"""
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._running.clear()
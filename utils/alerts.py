@@ -0,0 +1,21 @@
+from datetime import datetime
+
+# Display names used in alert messages
+METRIC_LABELS = {
+    "cpu": "CPU",
+    "memory": "Memory",
+    "disk": "Disk"
+}
+
+
+def check_thresholds(thresholds, cpu_percent, mem_percent, disk_percent=None, timestamp=None):
+    """Return (metric, message) pairs for every usage value above its alert threshold"""
+    current_time = (timestamp or datetime.now()).strftime("%H:%M:%S")
+    alerts = []
+    for metric, value in (("cpu", cpu_percent), ("memory", mem_percent), ("disk", disk_percent)):
+        if not value or metric not in thresholds:
+            continue
+        if value > thresholds[metric]:
+            alerts.append((metric, f"[{current_time}] WARNING: {METRIC_LABELS[metric]} usage at "
+                                   f"{value:.1f}% exceeded threshold ({thresholds[metric]}%)"))
+    return alerts
@@ -0,0 +1,46 @@
+import numpy as np
+
+
+def minmax_indices(values, max_points):
+    """Indices of the min and max sample in each of max_points // 2 buckets, in time order
+
+    Keeping both extremes of every pixel-wide bucket preserves spikes that plain
+    decimation or averaging would drop.
+    """
+    values = np.asarray(values)
+    count = len(values)
+    buckets = max(1, int(max_points) // 2)
+    if count <= max(2, int(max_points)):
+        return np.arange(count)
+
+    # Bucket boundaries spread the remainder evenly across buckets
+    starts = np.linspace(0, count, buckets + 1).astype(np.intp)[:-1]
+    sizes = np.diff(np.append(starts, count))
+    bucket_ids = np.repeat(np.arange(buckets), sizes)
+
+    # fmin/fmax skip NaN gaps (e.g. while a process was not running)
+    low = np.fmin.reduceat(values, starts)
+    high = np.fmax.reduceat(values, starts)
+
+    # First position in each bucket that holds the bucket's min / max
+    low_hits = np.flatnonzero(values == low[bucket_ids])
+    high_hits = np.flatnonzero(values == high[bucket_ids])
+    low_index = starts.copy()
+    high_index = starts.copy()
+    _, first = np.unique(bucket_ids[low_hits], return_index=True)
+    low_index[bucket_ids[low_hits[first]]] = low_hits[first]
+    _, first = np.unique(bucket_ids[high_hits], return_index=True)
+    high_index[bucket_ids[high_hits[first]]] = high_hits[first]
+
+    pairs = np.sort(np.column_stack((low_index, high_index)), axis=1)
+    indices = pairs.ravel()
+    # Drop the duplicate when a bucket's min and max are the same sample
+    keep = np.ones(len(indices), dtype=bool)
+    keep[1:] = indices[1:] != indices[:-1]
+    return indices[keep]
+
+
+def minmax_downsample(x, y, max_points):
+    """Reduce (x, y) to at most max_points points, keeping each bucket's extremes"""
+    indices = minmax_indices(y, max_points)
+    return np.asarray(x)[indices], np.asarray(y)[indices]
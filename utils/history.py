@@ -0,0 +1,203 @@
+import math
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from utils.ring_buffer import RingBuffer
+
+# Metrics tracked by the history store
+METRICS = ("cpu", "memory", "disk")
+
+# Coarser resolutions kept alongside the raw samples: (seconds per bucket, bucket count)
+# 10s x 2160 = 6 hours, 1m x 1440 = 24 hours, 10m x 1008 = 7 days
+ROLLUP_LEVELS = ((10, 2160), (60, 1440), (600, 1008))
+
+# A slice of history at one resolution; mean/low/high map metric name -> array
+HistoryWindow = namedtuple("HistoryWindow", ["resolution", "timestamps", "mean", "low", "high"])
+
+# A finished rollup bucket; mean/low/high are (cpu, memory, disk) tuples
+RollupBucket = namedtuple("RollupBucket", ["resolution", "timestamp", "mean", "low", "high"])
+
+
+class RollupLevel:
+    """Min/max/mean of each metric over fixed-width time buckets"""
+
+    def __init__(self, resolution, capacity):
+        self.resolution = resolution
+        self.capacity = capacity
+        self.timestamps = RingBuffer(capacity, np.float64)  # bucket start times
+        self.mean = {name: RingBuffer(capacity, np.float32) for name in METRICS}
+        self.low = {name: RingBuffer(capacity, np.float32) for name in METRICS}
+        self.high = {name: RingBuffer(capacity, np.float32) for name in METRICS}
+
+        # Accumulators for the bucket currently being filled
+        self._bucket = None
+        self._count = 0
+        self._sum = np.zeros(len(METRICS))
+        self._min = np.zeros(len(METRICS))
+        self._max = np.zeros(len(METRICS))
+
+    @property
+    def span(self):
+        """Seconds of history this level can hold"""
+        return self.resolution * self.capacity
+
+    def add(self, timestamp, values):
+        """Fold one raw sample into the current bucket; returns the bucket it closed, if any"""
+        closed = None
+        bucket = math.floor(timestamp / self.resolution) * self.resolution
+        if self._bucket is not None and bucket != self._bucket:
+            closed = self._flush()
+        if self._count == 0:
+            self._bucket = bucket
+            self._sum[:] = values
+            self._min[:] = values
+            self._max[:] = values
+        else:
+            self._sum += values
+            np.minimum(self._min, values, out=self._min)
+            np.maximum(self._max, values, out=self._max)
+        self._count += 1
+        return closed
+
+    def _flush(self):
+        """Write the finished bucket to the ring buffers and return it"""
+        if self._count == 0:
+            return None
+        self.timestamps.append(self._bucket)
+        means = self._sum / self._count
+        for i, name in enumerate(METRICS):
+            self.mean[name].append(means[i])
+            self.low[name].append(self._min[i])
+            self.high[name].append(self._max[i])
+        self._count = 0
+        return RollupBucket(self.resolution, self._bucket, tuple(means.tolist()),
+                            tuple(self._min.tolist()), tuple(self._max.tolist()))
+
+    def close_bucket(self):
+        """Finish the partially filled bucket now (e.g. at shutdown); returns it, or None"""
+        return self._flush()
+
+    def resume(self, timestamp, mean, low, high, count):
+        """Reopen a bucket saved unfinished so new samples keep accumulating into it"""
+        self._bucket = timestamp
+        self._count = count
+        self._sum[:] = np.asarray(mean, dtype=np.float64) * count
+        self._min[:] = low
+        self._max[:] = high
+
+    def load(self, timestamps, mean, low, high):
+        """Bulk-load finished buckets (oldest first); mean/low/high map metric name -> array"""
+        self.timestamps.extend(timestamps)
+        for name in METRICS:
+            self.mean[name].extend(mean[name])
+            self.low[name].extend(low[name])
+            self.high[name].extend(high[name])
+
+    def window(self, start):
+        """Return a HistoryWindow of buckets starting at or after `start`, including the open bucket"""
+        timestamps = self.timestamps.view()
+        first = int(np.searchsorted(timestamps, start, side='left'))
+        mean = {name: self.mean[name].view()[first:] for name in METRICS}
+        low = {name: self.low[name].view()[first:] for name in METRICS}
+        high = {name: self.high[name].view()[first:] for name in METRICS}
+        timestamps = timestamps[first:]
+
+        # Append the partially filled bucket so the graph reaches the present
+        if self._count:
+            timestamps = np.append(timestamps, self._bucket)
+            for i, name in enumerate(METRICS):
+                mean[name] = np.append(mean[name], self._sum[i] / self._count)
+                low[name] = np.append(low[name], self._min[i])
+                high[name] = np.append(high[name], self._max[i])
+
+        return HistoryWindow(self.resolution, timestamps, mean, low, high)
+
+
+class MetricHistory:
+    """Fixed-size history of system CPU, memory and disk samples"""
+
+    def __init__(self, capacity=3600, rollup_levels=ROLLUP_LEVELS):
+        self.capacity = capacity
+        self.timestamps = RingBuffer(capacity, np.float64)
+        self.cpu = RingBuffer(capacity, np.float32)
+        self.memory = RingBuffer(capacity, np.float32)
+        self.disk = RingBuffer(capacity, np.float32)
+
+        # Coarser levels let the graphs show days of history with bounded memory
+        self.rollups = [RollupLevel(resolution, count) for resolution, count in rollup_levels]
+
+    def append(self, timestamp, cpu, memory, disk):
+        """Record one sample; returns the list of rollup buckets it closed"""
+        self.timestamps.append(timestamp)
+        self.cpu.append(cpu)
+        self.memory.append(memory)
+        self.disk.append(disk)
+
+        closed = []
+        values = (cpu, memory, disk)
+        for level in self.rollups:
+            bucket = level.add(timestamp, values)
+            if bucket is not None:
+                closed.append(bucket)
+        return closed
+
+    def close_rollups(self):
+        """Finish every level's partially filled bucket; returns the buckets that had samples"""
+        return [bucket for bucket in (level.close_bucket() for level in self.rollups) if bucket is not None]
+
+    def load(self, timestamps, cpu, memory, disk):
+        """Bulk-load raw samples (oldest first), e.g. from the on-disk store"""
+        self.timestamps.extend(timestamps)
+        self.cpu.extend(cpu)
+        self.memory.extend(memory)
+        self.disk.extend(disk)
+
+    def rollup(self, resolution):
+        """Return the rollup level with the given bucket width, or None"""
+        for level in self.rollups:
+            if level.resolution == resolution:
+                return level
+        return None
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    @property
+    def total_samples(self):
+        """Number of samples recorded since creation (including overwritten ones)"""
+        return self.timestamps.total_appended
+
+    @property
+    def max_span(self):
+        """Longest time range (seconds) the history can show"""
+        spans = [level.span for level in self.rollups]
+        return max(spans) if spans else self.capacity
+
+    def window(self, seconds, now=None):
+        """Return (timestamps, cpu, memory, disk) views covering the last `seconds`"""
+        if now is None:
+            now = time.time()
+        timestamps = self.timestamps.view()
+        start = int(np.searchsorted(timestamps, now - seconds, side='left'))
+        return (timestamps[start:], self.cpu.view()[start:],
+                self.memory.view()[start:], self.disk.view()[start:])
+
+    def series(self, seconds, now=None):
+        """Return a HistoryWindow for the last `seconds` at the finest resolution that covers it"""
+        if now is None:
+            now = time.time()
+
+        # Raw samples are roughly one per second; use them while they cover the range
+        if seconds <= self.capacity or not self.rollups:
+            timestamps, cpu, memory, disk = self.window(seconds, now)
+            values = {"cpu": cpu, "memory": memory, "disk": disk}
+            return HistoryWindow(1, timestamps, values, values, values)
+
+        level = self.rollups[-1]
+        for candidate in self.rollups:
+            if seconds <= candidate.span:
+                level = candidate
+                break
+        return level.window(now - seconds)
@@ -0,0 +1,212 @@
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+from utils.history import METRICS
+from utils.snapshot import ProcessInfo, ProcessSnapshot
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS system_samples (
+    ts REAL PRIMARY KEY,
+    cpu REAL,
+    memory REAL,
+    disk REAL
+);
+CREATE TABLE IF NOT EXISTS system_rollups (
+    resolution INTEGER,
+    ts REAL,
+    cpu_mean REAL, cpu_min REAL, cpu_max REAL,
+    memory_mean REAL, memory_min REAL, memory_max REAL,
+    disk_mean REAL, disk_min REAL, disk_max REAL,
+    PRIMARY KEY (resolution, ts)
+);
+CREATE TABLE IF NOT EXISTS process_samples (
+    ts REAL,
+    pid INTEGER,
+    create_time REAL,
+    name TEXT,
+    cpu REAL,
+    rss INTEGER
+);
+CREATE INDEX IF NOT EXISTS process_samples_ts ON process_samples (ts);
+CREATE INDEX IF NOT EXISTS process_samples_key ON process_samples (pid, create_time, ts);
+"""
+
+
+class MetricStore:
+    """SQLite-backed store for system metrics, rollups and top-process samples"""
+
+    def __init__(self, path, retention, top_processes=10, batch_size=30, flush_interval=10.0):
+        self.path = path
+        self.retention = retention
+        self.top_processes = top_processes
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(path)
+        # WAL keeps appends cheap and lets readers run alongside the writer
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+        # Rows waiting for the next batched write
+        self._system_rows = []
+        self._rollup_rows = []
+        self._process_rows = []
+        self._last_flush = time.monotonic()
+        self._last_prune = 0.0
+
+    def add_sample(self, timestamp, cpu, memory, disk, closed_buckets=(), snapshot=None):
+        """Queue one system sample, any rollup buckets it closed and the top processes"""
+        self._system_rows.append((timestamp, float(cpu), float(memory), float(disk)))
+        self._queue_buckets(closed_buckets)
+
+        if snapshot is not None and self.top_processes:
+            for proc in snapshot.top(self.top_processes):
+                self._process_rows.append((timestamp, proc.pid, proc.create_time, proc.name,
+                                           proc.cpu_percent, proc.memory_rss))
+
+        if (len(self._system_rows) >= self.batch_size or
+                time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def _queue_buckets(self, buckets):
+        for bucket in buckets:
+            row = [bucket.resolution, bucket.timestamp]
+            for i in range(len(METRICS)):
+                row.extend((bucket.mean[i], bucket.low[i], bucket.high[i]))
+            self._rollup_rows.append(tuple(row))
+
+    def flush(self):
+        """Write all queued rows in a single transaction"""
+        self._last_flush = time.monotonic()
+        if not (self._system_rows or self._rollup_rows or self._process_rows):
+            return
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO system_samples VALUES (?, ?, ?, ?)", self._system_rows)
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO system_rollups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    self._rollup_rows)
+                self.conn.executemany(
+                    "INSERT INTO process_samples VALUES (?, ?, ?, ?, ?, ?)", self._process_rows)
+        except sqlite3.Error as e:
+            print(f"Error writing metric store: {e}")
+        self._system_rows = []
+        self._rollup_rows = []
+        self._process_rows = []
+
+        # Apply the retention policy every few minutes rather than on every write
+        if self._last_flush - self._last_prune >= 300:
+            self.prune()
+
+    def prune(self, now=None):
+        """Delete rows older than the retention policy allows"""
+        if now is None:
+            now = time.time()
+        self._last_prune = time.monotonic()
+        try:
+            with self.conn:
+                self.conn.execute("DELETE FROM system_samples WHERE ts < ?",
+                                  (now - self.retention["system"],))
+                self.conn.execute("DELETE FROM system_rollups WHERE ts < ?",
+                                  (now - self.retention["rollups"],))
+                self.conn.execute("DELETE FROM process_samples WHERE ts < ?",
+                                  (now - self.retention["process"],))
+        except sqlite3.Error as e:
+            print(f"Error pruning metric store: {e}")
+
+    def load_recent(self, seconds, now=None):
+        """Return (timestamps, cpu, memory, disk) arrays for the last `seconds` of raw samples"""
+        if now is None:
+            now = time.time()
+        rows = self.conn.execute(
+            "SELECT ts, cpu, memory, disk FROM system_samples WHERE ts >= ? ORDER BY ts",
+            (now - seconds,)).fetchall()
+        if not rows:
+            empty = np.zeros(0)
+            return empty, empty, empty, empty
+        data = np.array(rows, dtype=np.float64)
+        return data[:, 0], data[:, 1], data[:, 2], data[:, 3]
+
+    def load_rollups(self, resolution, seconds, now=None):
+        """Return (timestamps, mean, low, high) for one rollup level; mean/low/high map metric -> array"""
+        if now is None:
+            now = time.time()
+        rows = self.conn.execute(
+            "SELECT * FROM system_rollups WHERE resolution = ? AND ts >= ? ORDER BY ts",
+            (resolution, now - seconds)).fetchall()
+        data = np.array(rows, dtype=np.float64).reshape(-1, 2 + 3 * len(METRICS))
+        mean, low, high = {}, {}, {}
+        for i, name in enumerate(METRICS):
+            column = 2 + 3 * i
+            mean[name] = data[:, column]
+            low[name] = data[:, column + 1]
+            high[name] = data[:, column + 2]
+        return data[:, 1], mean, low, high
+
+    def load_process_samples(self, seconds, now=None):
+        """Return stored top-process rows (ts, pid, create_time, name, cpu, rss) for the last `seconds`"""
+        if now is None:
+            now = time.time()
+        return self.conn.execute(
+            "SELECT ts, pid, create_time, name, cpu, rss FROM process_samples WHERE ts >= ? ORDER BY ts",
+            (now - seconds,)).fetchall()
+
+    def restore_history(self, history, now=None):
+        """Fill a MetricHistory with the most recent stored data"""
+        if now is None:
+            now = time.time()
+        history.load(*self.load_recent(history.capacity, now))
+        raw_timestamps = history.timestamps.view()
+        for level in history.rollups:
+            timestamps, mean, low, high = self.load_rollups(level.resolution, level.span, now)
+            if len(timestamps) and timestamps[-1] + level.resolution > now:
+                # The newest bucket was saved unfinished at shutdown and is still current:
+                # reopen it, weighted by the raw samples it already covers
+                start = timestamps[-1]
+                count = int(np.count_nonzero((raw_timestamps >= start) &
+                                             (raw_timestamps < start + level.resolution)))
+                level.resume(start, [mean[name][-1] for name in METRICS],
+                             [low[name][-1] for name in METRICS],
+                             [high[name][-1] for name in METRICS], max(1, count))
+                timestamps = timestamps[:-1]
+                mean = {name: values[:-1] for name, values in mean.items()}
+                low = {name: values[:-1] for name, values in low.items()}
+                high = {name: values[:-1] for name, values in high.items()}
+            level.load(timestamps, mean, low, high)
+        return len(history)
+
+    def restore_process_history(self, process_history, now=None):
+        """Replay stored top-process samples into a ProcessHistory; returns the number of ticks replayed"""
+        rows = self.load_process_samples(process_history.capacity, now)
+        ticks = 0
+        start = 0
+        for end in range(1, len(rows) + 1):
+            if end < len(rows) and rows[end][0] == rows[start][0]:
+                continue
+            processes = [ProcessInfo(pid, name, "", cpu, rss, create_time, 0, 0, 0)
+                         for _, pid, create_time, name, cpu, rss in rows[start:end]]
+            process_history.update(ProcessSnapshot(processes, rows[start][0], 0.0, 0.0), rows[start][0])
+            ticks += 1
+            start = end
+        return ticks
+
+    def close(self, history=None):
+        """Flush pending rows and close the database
+
+        Passing the MetricHistory also saves its partially filled rollup buckets,
+        so a restart does not leave a gap at every rollup level.
+        """
+        if history is not None:
+            self._queue_buckets(history.close_rollups())
+        self.flush()
+        self.conn.close()
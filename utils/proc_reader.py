@@ -0,0 +1,151 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+# The kernel truncates the command name in /proc/<pid>/stat to this many characters
+COMM_LENGTH = 15
+
+# Map /proc/<pid>/stat state letters to the status strings psutil uses
+PROC_STATUS = {
+    'R': 'running',
+    'S': 'sleeping',
+    'D': 'disk-sleep',
+    'T': 'stopped',
+    't': 'tracing-stop',
+    'Z': 'zombie',
+    'X': 'dead',
+    'x': 'dead',
+    'K': 'wake-kill',
+    'W': 'waking',
+    'P': 'parked',
+    'I': 'idle',
+}
+
+
+def is_supported(proc_path='/proc'):
+    """Check whether the /proc reader can be used on this system"""
+    return sys.platform.startswith('linux') and os.path.isdir(proc_path)
+
+
+def read_boot_time(proc_path='/proc'):
+    """Read the system boot time (seconds since the epoch) from /proc/stat"""
+    with open(os.path.join(proc_path, 'stat'), 'rb') as f:
+        for line in f:
+            if line.startswith(b'btime'):
+                return float(line.split()[1])
+    raise RuntimeError("btime not found in /proc/stat")
+
+
+class ProcStatReader:
+    """Bulk reader for per-process statistics straight from /proc/<pid>/stat"""
+
+    def __init__(self, proc_path='/proc'):
+        self.proc_path = proc_path
+        self.clock_ticks = os.sysconf('SC_CLK_TCK')
+        self.page_size = os.sysconf('SC_PAGE_SIZE')
+        self.boot_time = read_boot_time(proc_path)
+
+        # CPU ticks per (pid, starttime) from the previous read, for CPU% deltas
+        self._last_ticks = {}
+        self._last_read = None
+
+        # Full names of processes whose stat name was truncated, per (pid, starttime)
+        self._full_names = {}
+
+    def full_name(self, pid, comm):
+        """Untruncated name the way psutil resolves it: the basename of argv[0] if it extends comm"""
+        try:
+            with open(f"{self.proc_path}/{pid}/cmdline", 'rb') as f:
+                data = f.read()
+        except OSError:
+            return comm
+        # Processes that rewrite their argv may use spaces instead of NUL separators
+        args = data.split(b'\0' if b'\0' in data else b' ')
+        if args and args[0]:
+            name = os.path.basename(args[0].decode('utf-8', 'replace'))
+            if name.startswith(comm):
+                return name
+        return comm
+
+    def read(self):
+        """Read every process and return a dict of column arrays"""
+        now = time.monotonic()
+        elapsed = now - self._last_read if self._last_read is not None else None
+
+        pids, names, states = [], [], []
+        ppids, nices, threads = [], [], []
+        utimes, stimes, starts, rss_pages = [], [], [], []
+        full_names = {}
+
+        for entry in os.listdir(self.proc_path):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"{self.proc_path}/{entry}/stat", 'rb') as f:
+                    data = f.read()
+            except OSError:
+                # Process exited between listdir and open, or is not readable
+                continue
+
+            # The command name is wrapped in parentheses and may itself contain spaces or ')'
+            lpar = data.find(b'(')
+            rpar = data.rfind(b')')
+            fields = data[rpar + 2:].split()
+
+            pid = int(entry)
+            name = data[lpar + 1:rpar].decode('utf-8', 'replace')
+            if len(name) >= COMM_LENGTH:
+                # Resolve the full name once per process and reuse it on later reads
+                key = (pid, int(fields[19]))
+                full = self._full_names.get(key)
+                if full is None:
+                    full = self.full_name(pid, name)
+                full_names[key] = full
+                name = full
+
+            pids.append(pid)
+            names.append(name)
+            states.append(PROC_STATUS.get(fields[0].decode(), 'unknown'))
+            ppids.append(int(fields[1]))
+            utimes.append(int(fields[11]))
+            stimes.append(int(fields[12]))
+            nices.append(int(fields[16]))
+            threads.append(int(fields[17]))
+            starts.append(int(fields[19]))
+            rss_pages.append(int(fields[21]))
+
+        utime = np.array(utimes, dtype=np.float64)
+        stime = np.array(stimes, dtype=np.float64)
+        starttime = np.array(starts, dtype=np.int64)
+        pid = np.array(pids, dtype=np.int64)
+        total_ticks = utime + stime
+
+        # CPU% from the change in CPU ticks since the previous read, same scale as psutil
+        cpu_percent = np.zeros(len(pid), dtype=np.float64)
+        current_ticks = {}
+        for i, key in enumerate(zip(pids, starts)):
+            ticks = total_ticks[i]
+            current_ticks[key] = ticks
+            if elapsed:
+                previous = self._last_ticks.get(key)
+                if previous is not None:
+                    cpu_percent[i] = (ticks - previous) / self.clock_ticks / elapsed * 100.0
+        self._last_ticks = current_ticks
+        self._full_names = full_names
+        self._last_read = now
+
+        return {
+            'pid': pid,
+            'name': names,
+            'status': states,
+            'ppid': np.array(ppids, dtype=np.int64),
+            'nice': np.array(nices, dtype=np.int32),
+            'num_threads': np.array(threads, dtype=np.int32),
+            'utime': utime / self.clock_ticks,
+            'stime': stime / self.clock_ticks,
+            'create_time': self.boot_time + starttime / self.clock_ticks,
+            'rss': np.array(rss_pages, dtype=np.int64) * self.page_size,
+            'cpu_percent': cpu_percent,
+        }
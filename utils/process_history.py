@@ -0,0 +1,154 @@
+import time
+
+import numpy as np
+
+
+class ProcessHistory:
+    """CPU and RSS history for the most active processes, stored as one row per tracked process"""
+
+    def __init__(self, capacity=600, max_tracked=50, grace_period=30.0, activity_alpha=0.2,
+                 min_tenure=30, replace_margin=5.0):
+        self.capacity = capacity
+        self.max_tracked = max_tracked
+        self.grace_period = grace_period
+        self.activity_alpha = activity_alpha
+        # Hysteresis so short bursts cannot churn slots and wipe established histories
+        self.min_tenure = min_tenure
+        self.replace_margin = replace_margin
+
+        # Samples share one time axis; every tick writes one column for all slots.
+        # Columns are written twice (i and i + capacity) so each row reads as one ordered slice.
+        self._timestamps = np.zeros(capacity * 2, dtype=np.float64)
+        self._cpu = np.full((max_tracked, capacity * 2), np.nan, dtype=np.float32)
+        self._rss = np.full((max_tracked, capacity * 2), np.nan, dtype=np.float32)
+        self._start = 0
+        self._size = 0
+        self._written = 0                                 # columns written since creation
+
+        # Slot bookkeeping; a key is (pid, create_time) so reused PIDs never mix
+        self.slots = {}                                   # key -> slot index
+        self.slot_keys = [None] * max_tracked             # slot index -> key
+        self.slot_names = [""] * max_tracked
+        self.activity = np.zeros(max_tracked)             # EMA of CPU% per slot
+        self.last_seen = np.zeros(max_tracked)            # wall-clock time last present
+        self.admitted_at = np.zeros(max_tracked, dtype=np.int64)  # column count when admitted
+
+    def __len__(self):
+        return self._size
+
+    def update(self, snapshot, timestamp=None):
+        """Record one tick of the process table"""
+        if timestamp is None:
+            timestamp = time.time()
+
+        present = {}
+        for proc in snapshot:
+            present[(proc.pid, proc.create_time)] = proc
+
+        # Decay activity for every tracked process; absent ones count as idle
+        alpha = self.activity_alpha
+        for key, slot in self.slots.items():
+            proc = present.get(key)
+            cpu = proc.cpu_percent if proc is not None else 0.0
+            self.activity[slot] = alpha * cpu + (1 - alpha) * self.activity[slot]
+            if proc is not None:
+                self.last_seen[slot] = timestamp
+
+        self._evict_exited(timestamp)
+
+        # Offer the busiest untracked processes a slot
+        for proc in snapshot.top(self.max_tracked):
+            key = (proc.pid, proc.create_time)
+            if key not in self.slots:
+                self._admit(key, proc, timestamp)
+
+        self._write_column(timestamp, present)
+
+    def _admit(self, key, proc, timestamp):
+        """Give a process a slot, replacing the least active tracked process if needed
+
+        Only slots held for at least min_tenure samples can be replaced, and only by a
+        process busier than the slot's activity by replace_margin.
+        """
+        free = [slot for slot, slot_key in enumerate(self.slot_keys) if slot_key is None]
+        if free:
+            slot = free[0]
+        else:
+            tenure = self._written - self.admitted_at
+            activity = np.where(tenure >= self.min_tenure, self.activity, np.inf)
+            slot = int(np.argmin(activity))
+            if proc.cpu_percent <= activity[slot] + self.replace_margin:
+                return
+            del self.slots[self.slot_keys[slot]]
+
+        self.slots[key] = slot
+        self.slot_keys[slot] = key
+        self.slot_names[slot] = proc.name
+        self.activity[slot] = proc.cpu_percent
+        self.last_seen[slot] = timestamp
+        self.admitted_at[slot] = self._written
+        # A reused slot must not show the previous owner's samples
+        self._cpu[slot, :] = np.nan
+        self._rss[slot, :] = np.nan
+
+    def _evict_exited(self, timestamp):
+        """Free slots of processes that have been gone longer than the grace period"""
+        expired = [key for key, slot in self.slots.items()
+                   if timestamp - self.last_seen[slot] > self.grace_period]
+        for key in expired:
+            slot = self.slots.pop(key)
+            self.slot_keys[slot] = None
+            self.slot_names[slot] = ""
+            self.activity[slot] = 0.0
+
+    def _write_column(self, timestamp, present):
+        """Append one column with the current CPU% and RSS of every tracked process"""
+        if self._size < self.capacity:
+            column = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            column = self._start
+            self._start = (self._start + 1) % self.capacity
+        self._written += 1
+
+        cpu = np.full(self.max_tracked, np.nan, dtype=np.float32)
+        rss = np.full(self.max_tracked, np.nan, dtype=np.float32)
+        for key, slot in self.slots.items():
+            proc = present.get(key)
+            if proc is not None:
+                cpu[slot] = proc.cpu_percent
+                rss[slot] = proc.memory_rss
+
+        for index in (column, column + self.capacity):
+            self._timestamps[index] = timestamp
+            self._cpu[:, index] = cpu
+            self._rss[:, index] = rss
+
+    def timestamps(self):
+        """Sample times, oldest first"""
+        return self._timestamps[self._start:self._start + self._size]
+
+    def matrix(self):
+        """Return (timestamps, cpu, rss) with one row per slot; NaN where a process was absent"""
+        window = slice(self._start, self._start + self._size)
+        return self._timestamps[window], self._cpu[:, window], self._rss[:, window]
+
+    def find(self, pid):
+        """Return the tracked key for a PID, or None"""
+        for key in self.slots:
+            if key[0] == pid:
+                return key
+        return None
+
+    def series(self, key):
+        """Return (timestamps, cpu, rss) views for one tracked process, or None"""
+        slot = self.slots.get(key)
+        if slot is None:
+            return None
+        window = slice(self._start, self._start + self._size)
+        return self._timestamps[window], self._cpu[slot, window], self._rss[slot, window]
+
+    def tracked(self):
+        """Return (key, name, activity) for every tracked process, most active first"""
+        rows = [(key, self.slot_names[slot], float(self.activity[slot])) for key, slot in self.slots.items()]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
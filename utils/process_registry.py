@@ -0,0 +1,92 @@
+import threading
+import time
+
+import psutil
+
+# Attributes read for every process in one oneshot() pass
+REGISTRY_ATTRS = ['name', 'status', 'cpu_times', 'memory_info', 'ppid', 'nice', 'num_threads']
+
+
+class _Entry:
+    """Cached Process object plus the state needed for CPU% deltas"""
+
+    __slots__ = ("process", "create_time", "cpu_total", "sampled_at", "cpu_percent")
+
+    def __init__(self, process, create_time):
+        self.process = process
+        self.create_time = create_time
+        self.cpu_total = None
+        self.sampled_at = None
+        self.cpu_percent = None  # unknown until two samples have been taken
+
+
+class ProcessRegistry:
+    """Keeps psutil.Process objects across ticks and derives CPU% from cpu_times deltas"""
+
+    def __init__(self):
+        self._entries = {}  # pid -> _Entry
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def scan(self):
+        """Read every process once; returns a list of (pid, create_time, info dict) with 'cpu_percent' set
+
+        The psutil pass runs without the lock; the new entry table is swapped in at the end,
+        so get() and cpu_percent() never wait for a scan.
+        """
+        rows = []
+        now = time.monotonic()
+        previous = self._entries
+        entries = {}
+
+        for pid in psutil.pids():
+            entry = previous.get(pid)
+            try:
+                if entry is not None:
+                    with entry.process.oneshot():
+                        # create_time() is cached on the Process object; is_running() re-reads
+                        # it, so this is what detects a reused PID
+                        if entry.process.is_running():
+                            info = entry.process.as_dict(REGISTRY_ATTRS)
+                        else:
+                            entry = None
+                if entry is None:
+                    # New PID, or same PID and a different process: start with a fresh entry
+                    process = psutil.Process(pid)
+                    entry = _Entry(process, process.create_time())
+                    with process.oneshot():
+                        info = process.as_dict(REGISTRY_ATTRS)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+
+            cpu_times = info['cpu_times']
+            if cpu_times is not None:
+                cpu_total = cpu_times.user + cpu_times.system
+                if entry.cpu_total is not None and now > entry.sampled_at:
+                    entry.cpu_percent = max(0.0, (cpu_total - entry.cpu_total) / (now - entry.sampled_at) * 100.0)
+                entry.cpu_total = cpu_total
+                entry.sampled_at = now
+
+            info['cpu_percent'] = entry.cpu_percent or 0.0
+            entries[pid] = entry
+            rows.append((pid, entry.create_time, info))
+
+        # Processes that exited are dropped by not carrying them over
+        with self._lock:
+            self._entries = entries
+        return rows
+
+    def get(self, pid):
+        """Return the cached psutil.Process for a PID, or a new one if it is not cached or was reused"""
+        entry = self._entries.get(pid)
+        if entry is not None and entry.process.is_running():
+            # is_running() also detects a reused PID
+            return entry.process
+        return psutil.Process(pid)
+
+    def cpu_percent(self, pid):
+        """Return the last measured CPU% for a PID, or None if it has not been measured yet"""
+        entry = self._entries.get(pid)
+        return entry.cpu_percent if entry is not None else None
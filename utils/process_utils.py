@@ -1,29 +1,4 @@
 import psutil
-from datetime import datetime
-
-def get_process_details(pid):
-    """Get detailed information about a process"""
-    try:
-        process = psutil.Process(pid)
-        
-        # Get detailed information
-        details = {
-            "PID": pid,
-            "Name": process.name(),
-            "Status": process.status(),
-            "Created": datetime.fromtimestamp(process.create_time()).strftime('%Y-%m-%d %H:%M:%S'),
-            "CPU %": f"{process.cpu_percent():.1f}%",
-            "Memory": f"{process.memory_info().rss / (1024 * 1024):.1f} MB",
-            "Username": process.username(),
-            "Executable": process.exe(),
-            "Command Line": " ".join(process.cmdline()),
-            "Threads": process.num_threads(),
-            "Priority": process.nice()
-        }
-        
-        return details
-    except (psutil.NoSuchProcess, psutil.AccessDenied):
-        return None
 
 def kill_process(pid):
     """Kill a process by PID"""
@@ -46,3 +21,38 @@ def change_process_priority(pid, priority):
         return False, f"Process {pid} not found."
     except psutil.AccessDenied:
         return False, f"Access denied to change priority of process {pid}." 
+
+def get_process_relations(process, limit=2):
+    """Return (relation_type, label) pairs for a process: parent, children, connections and files"""
+    relations = []
+
+    try:
+        parent = process.parent()
+        if parent is not None:
+            relations.append(("Parent", f"{parent.pid} ({parent.name()})"))
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        pass
+
+    try:
+        for child in process.children()[:limit]:
+            try:
+                relations.append(("Child", f"{child.pid} ({child.name()})"))
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        pass
+
+    try:
+        for conn in process.connections()[:limit]:
+            addr = conn.laddr
+            relations.append(("Network", f"{addr.ip}:{addr.port}"))
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        pass
+
+    try:
+        for file in process.open_files()[:limit]:
+            relations.append(("File", file.path.replace('\\', '/').split('/')[-1]))
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        pass
+
+    return relations
@@ -0,0 +1,78 @@
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+
+class StageTimer:
+    """Rolling timing statistics per named stage, shared by the collector thread and the UI"""
+
+    def __init__(self, window=300, clock=time.perf_counter):
+        self.window = window          # number of recent durations kept per stage
+        self.clock = clock
+        self._samples = {}            # stage -> deque of durations in seconds
+        self._counts = {}
+        self._lock = threading.Lock()
+        self.enabled = True
+
+    def record(self, stage, seconds):
+        """Add one duration for a stage"""
+        if not self.enabled:
+            return
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.window)
+                self._counts[stage] = 0
+            samples.append(seconds)
+            self._counts[stage] += 1
+
+    @contextmanager
+    def time(self, stage):
+        """Context manager that records how long its block took"""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.record(stage, self.clock() - start)
+
+    def stats(self):
+        """Return {stage: {count, last_ms, p50_ms, p95_ms, max_ms}} over the rolling window"""
+        with self._lock:
+            snapshot = {stage: (np.array(samples), self._counts[stage])
+                        for stage, samples in self._samples.items()}
+
+        result = {}
+        for stage, (samples, count) in sorted(snapshot.items()):
+            if len(samples) == 0:
+                continue
+            p50, p95 = np.percentile(samples, [50, 95]) * 1000.0
+            result[stage] = {
+                'count': count,
+                'last_ms': float(samples[-1] * 1000.0),
+                'p50_ms': float(p50),
+                'p95_ms': float(p95),
+                'max_ms': float(samples.max() * 1000.0)
+            }
+        return result
+
+    def reset(self):
+        """Forget all recorded durations"""
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+    def to_json(self, extra=None):
+        """Serialize the current statistics (plus optional extra sections) as JSON"""
+        data = {'timestamp': time.time(), 'window': self.window, 'stages': self.stats()}
+        if extra:
+            data.update(extra)
+        return json.dumps(data, indent=2)
+
+    def export_json(self, path, extra=None):
+        """Write the current statistics to a JSON file"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.to_json(extra))
@@ -0,0 +1,73 @@
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-capacity buffer backed by a NumPy array with O(1) append and zero-copy ordered views"""
+
+    def __init__(self, capacity, dtype=np.float64):
+        self.capacity = int(capacity)
+        self.dtype = np.dtype(dtype)
+
+        # Every value is written twice (at i and i + capacity) so the logical
+        # contents are always one contiguous slice of the backing array
+        self._data = np.zeros(self.capacity * 2, dtype=self.dtype)
+        self._start = 0
+        self._size = 0
+        self.total_appended = 0
+
+    def append(self, value):
+        """Append a value, overwriting the oldest one once the buffer is full"""
+        end = (self._start + self._size) % self.capacity
+        self._data[end] = value
+        self._data[end + self.capacity] = value
+        if self._size < self.capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+        self.total_appended += 1
+
+    def extend(self, values):
+        """Append many values at once (used to bulk-load history)"""
+        values = np.asarray(values, dtype=self.dtype)[-self.capacity:]
+        count = len(values)
+        if count == 0:
+            return
+        # Rebuild the buffer from the retained tail plus the new values
+        kept = self.view()[max(0, self._size + count - self.capacity):]
+        merged = np.concatenate((kept, values))
+        self._data[:len(merged)] = merged
+        self._data[self.capacity:self.capacity + len(merged)] = merged
+        self._start = 0
+        self._size = len(merged)
+        self.total_appended += count
+
+    def clear(self):
+        """Remove all values"""
+        self._start = 0
+        self._size = 0
+
+    def view(self):
+        """Return the values oldest-first as a read-only view (no copy)"""
+        view = self._data[self._start:self._start + self._size]
+        view.flags.writeable = False
+        return view
+
+    def last(self, count):
+        """Return a view of the newest count values"""
+        return self.view()[max(0, self._size - count):]
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __getitem__(self, index):
+        return self.view()[index]
+
+    def __iter__(self):
+        return iter(self.view())
+
+    def __array__(self, dtype=None, copy=None):
+        view = self.view()
+        return view if dtype is None else view.astype(dtype)
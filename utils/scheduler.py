@@ -0,0 +1,192 @@
+import math
+import time
+
+
+class ScheduledTask:
+    """A periodic callback registered with the TickScheduler, plus its timing statistics"""
+
+    def __init__(self, name, period, callback, priority=0, next_run=0.0, visible=None):
+        self.name = name
+        self.period = period          # seconds, or a callable returning seconds
+        self.callback = callback
+        self.priority = priority      # lower runs first when several tasks are due
+        self.next_run = next_run
+        self.visible = visible        # optional predicate; hidden tasks are skipped and marked dirty
+        self.dirty = False
+        self.enabled = True
+
+        self.runs = 0
+        self.skipped = 0
+        self.hidden_skips = 0
+        self.errors = 0
+        self.total_runtime = 0.0
+        self.max_runtime = 0.0
+        self.last_runtime = 0.0
+        self.total_lateness = 0.0
+        self.max_lateness = 0.0
+
+    def get_period(self):
+        """Current period in seconds"""
+        period = self.period() if callable(self.period) else self.period
+        return max(0.001, float(period))
+
+    def stats(self):
+        """Return run time and lateness statistics in milliseconds"""
+        runs = max(1, self.runs)
+        return {
+            'period_ms': self.get_period() * 1000.0,
+            'runs': self.runs,
+            'skipped': self.skipped,
+            'hidden_skips': self.hidden_skips,
+            'errors': self.errors,
+            'avg_runtime_ms': self.total_runtime / runs * 1000.0,
+            'max_runtime_ms': self.max_runtime * 1000.0,
+            'last_runtime_ms': self.last_runtime * 1000.0,
+            'avg_lateness_ms': self.total_lateness / runs * 1000.0,
+            'max_lateness_ms': self.max_lateness * 1000.0
+        }
+
+
+class TickScheduler:
+    """Runs periodic tasks on a fixed monotonic grid, skipping missed ticks instead of stacking them"""
+
+    def __init__(self, clock=time.monotonic, max_sleep=0.25, timer=None):
+        self.clock = clock
+        self.max_sleep = max_sleep
+        self.timer = timer            # optional StageTimer; each run is recorded as "task.<name>"
+        self.tasks = {}
+        self._widget = None
+        self._after_id = None
+        self._in_tick = False         # set while _tk_tick runs tasks; it re-arms the timer itself
+
+    def add(self, name, period, callback, priority=0, delay=None, visible=None):
+        """Register (or replace) a periodic task; the first run is after `delay` (default: one period)"""
+        task = ScheduledTask(name, period, callback, priority, visible=visible)
+        task.next_run = self.clock() + (task.get_period() if delay is None else delay)
+        self.tasks[name] = task
+        self._wake()
+        return task
+
+    def remove(self, name):
+        """Unregister a task"""
+        self.tasks.pop(name, None)
+
+    def run_soon(self, name):
+        """Make a task due immediately (its grid restarts from now)"""
+        task = self.tasks.get(name)
+        if task is not None:
+            task.next_run = self.clock()
+            self._wake()
+
+    def next_due(self):
+        """Monotonic time of the earliest enabled task, or None"""
+        due = [task.next_run for task in self.tasks.values() if task.enabled]
+        return min(due) if due else None
+
+    def run_pending(self):
+        """Run every task that is due, in priority order; returns the number of tasks run"""
+        now = self.clock()
+        due = [task for task in self.tasks.values() if task.enabled and task.next_run <= now]
+        due.sort(key=lambda task: (task.priority, task.next_run))
+
+        ran = 0
+        for task in due:
+            start = self.clock()
+            if not self._is_visible(task):
+                # Nothing on screen to update; render once when the panel is shown again
+                task.dirty = True
+                task.hidden_skips += 1
+                self._advance(task, start)
+                continue
+
+            lateness = start - task.next_run
+            task.dirty = False
+            try:
+                task.callback()
+            except Exception as e:
+                task.errors += 1
+                print(f"Error in scheduled task '{task.name}': {e}")
+            end = self.clock()
+
+            runtime = end - start
+            task.runs += 1
+            task.last_runtime = runtime
+            task.total_runtime += runtime
+            task.max_runtime = max(task.max_runtime, runtime)
+            task.total_lateness += lateness
+            task.max_lateness = max(task.max_lateness, lateness)
+            if self.timer is not None:
+                self.timer.record(f"task.{task.name}", runtime)
+            self._advance(task, end)
+            ran += 1
+        return ran
+
+    def _advance(self, task, now):
+        """Move a task to its next slot on the original grid; slots already in the past are skipped"""
+        period = task.get_period()
+        task.next_run += period
+        if task.next_run <= now:
+            missed = math.floor((now - task.next_run) / period) + 1
+            task.skipped += missed
+            task.next_run += missed * period
+
+    def _is_visible(self, task):
+        if task.visible is None:
+            return True
+        try:
+            return bool(task.visible())
+        except Exception:
+            return True  # If visibility cannot be determined, render anyway
+
+    def catch_up(self):
+        """Run every task that skipped renders while hidden and is visible again"""
+        for task in self.tasks.values():
+            if task.dirty and task.enabled and self._is_visible(task):
+                task.dirty = False
+                task.next_run = self.clock()
+                self._wake()
+
+    def stats(self):
+        """Return per-task statistics keyed by task name"""
+        return {name: task.stats() for name, task in self.tasks.items()}
+
+    def attach_tk(self, widget):
+        """Drive the scheduler from a Tk event loop"""
+        self._widget = widget
+        self._wake()
+
+    def detach(self):
+        """Stop driving the scheduler from Tk"""
+        if self._widget is not None and self._after_id is not None:
+            try:
+                self._widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = None
+        self._widget = None
+
+    def _wake(self):
+        """Re-arm the Tk timer so newly due tasks are picked up straight away"""
+        if self._widget is None or self._in_tick:
+            # During a tick the finally block re-arms for the earliest due task,
+            # so a second timer here would run every tick twice
+            return
+        if self._after_id is not None:
+            try:
+                self._widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = self._widget.after_idle(self._tk_tick)
+
+    def _tk_tick(self):
+        self._after_id = None
+        self._in_tick = True
+        try:
+            self.run_pending()
+        finally:
+            self._in_tick = False
+            if self._widget is not None:
+                # Sleep until the next task is due (bounded so period changes are noticed)
+                next_due = self.next_due()
+                delay = self.max_sleep if next_due is None else min(self.max_sleep, next_due - self.clock())
+                self._after_id = self._widget.after(max(1, int(delay * 1000)), self._tk_tick)
@@ -0,0 +1,135 @@
+import time
+from collections import namedtuple
+
+from utils import proc_reader
+from utils.process_registry import ProcessRegistry
+
+# One row of the process table
+ProcessInfo = namedtuple("ProcessInfo", [
+    "pid", "name", "status", "cpu_percent", "memory_rss",
+    "create_time", "ppid", "nice", "num_threads"
+])
+
+
+class ProcessSnapshot:
+    """Immutable view of the process table collected in a single scan"""
+
+    __slots__ = ("processes", "timestamp", "collected_at", "collect_duration",
+                 "total_count", "total_memory")
+
+    def __init__(self, processes, timestamp, collected_at, collect_duration):
+        processes = tuple(processes)
+        object.__setattr__(self, "processes", processes)
+        object.__setattr__(self, "timestamp", timestamp)            # wall clock (time.time)
+        object.__setattr__(self, "collected_at", collected_at)      # monotonic clock
+        object.__setattr__(self, "collect_duration", collect_duration)
+        object.__setattr__(self, "total_count", len(processes))
+        object.__setattr__(self, "total_memory", sum(p.memory_rss for p in processes))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ProcessSnapshot is immutable")
+
+    def __len__(self):
+        return self.total_count
+
+    def __iter__(self):
+        return iter(self.processes)
+
+    def age(self):
+        """Seconds elapsed since the snapshot was collected"""
+        return time.monotonic() - self.collected_at
+
+    def filter(self, text):
+        """Return processes whose name contains text (case-insensitive)"""
+        if not text:
+            return list(self.processes)
+        text = text.lower()
+        return [p for p in self.processes if text in p.name.lower()]
+
+    def find(self, pid):
+        """Return the process with the given PID, or None"""
+        for proc in self.processes:
+            if proc.pid == pid:
+                return proc
+        return None
+
+    def top(self, count, key="cpu_percent"):
+        """Return the top processes sorted by the given attribute"""
+        return sorted(self.processes, key=lambda p: getattr(p, key), reverse=True)[:count]
+
+    def names(self):
+        """Return the sorted set of distinct process names"""
+        return sorted({p.name for p in self.processes if p.name})
+
+
+class SnapshotEngine:
+    """Collects the process table once per tick and shares it between panels"""
+
+    def __init__(self, backend="psutil"):
+        self.latest = None
+        self.proc_reader = None
+        # Cached psutil.Process objects, also used by panels that need more than the snapshot
+        self.registry = ProcessRegistry()
+        self.backend = "psutil"
+
+        # The /proc reader is optional; psutil is always available as the fallback
+        if backend in ("procfs", "auto"):
+            if proc_reader.is_supported():
+                try:
+                    self.proc_reader = proc_reader.ProcStatReader()
+                    self.backend = "procfs"
+                except Exception as e:
+                    print(f"Falling back to psutil collector: {e}")
+            elif backend == "procfs":
+                print("The procfs collector is only available on Linux; using psutil")
+
+    def collect(self):
+        """Scan the process table and publish a new snapshot"""
+        start = time.monotonic()
+        if self.proc_reader is not None:
+            rows = self._collect_procfs()
+        else:
+            rows = self._collect_psutil()
+        end = time.monotonic()
+
+        self.latest = ProcessSnapshot(rows, time.time(), end, end - start)
+        return self.latest
+
+    def _collect_procfs(self):
+        """Build process rows from the column arrays read out of /proc"""
+        columns = self.proc_reader.read()
+        return [ProcessInfo(*row) for row in zip(
+            columns['pid'].tolist(),
+            columns['name'],
+            columns['status'],
+            columns['cpu_percent'].tolist(),
+            columns['rss'].tolist(),
+            columns['create_time'].tolist(),
+            columns['ppid'].tolist(),
+            columns['nice'].tolist(),
+            columns['num_threads'].tolist()
+        )]
+
+    def _collect_psutil(self):
+        """Build process rows from the registry's cached psutil.Process objects"""
+        rows = []
+        for pid, create_time, info in self.registry.scan():
+            memory_info = info['memory_info']
+            rows.append(ProcessInfo(
+                pid,
+                info['name'] or "",
+                info['status'] or "unknown",
+                info['cpu_percent'],
+                memory_info.rss if memory_info else 0,
+                create_time,
+                info['ppid'] or 0,
+                info['nice'] if info['nice'] is not None else 0,
+                info['num_threads'] or 0
+            ))
+        return rows
+
+    def get(self, max_age=None):
+        """Return the latest snapshot, collecting a new one if missing or older than max_age"""
+        if self.latest is None or (max_age is not None and self.latest.age() > max_age):
+            return self.collect()
+        return self.latest